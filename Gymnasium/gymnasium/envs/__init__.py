@@ -27,6 +27,7 @@ register(
 register(
     id="MountainCar-v0",
     entry_point="gymnasium.envs.classic_control.mountain_car:MountainCarEnv",
+    vector_entry_point="gymnasium.envs.classic_control.mountain_car:MountainCarVectorEnv",
     max_episode_steps=200,
     reward_threshold=-110.0,
 )
@@ -34,6 +35,7 @@ register(
 register(
     id="MountainCarContinuous-v0",
     entry_point="gymnasium.envs.classic_control.continuous_mountain_car:Continuous_MountainCarEnv",
+    vector_entry_point="gymnasium.envs.classic_control.continuous_mountain_car:Continuous_MountainCarVectorEnv",
     max_episode_steps=999,
     reward_threshold=90.0,
 )
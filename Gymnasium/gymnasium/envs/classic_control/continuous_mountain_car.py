@@ -20,7 +20,9 @@ import numpy as np
 import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.envs.classic_control import utils
+from gymnasium.envs.classic_control.mountain_car import MountainCarVectorEnv
 from gymnasium.error import DependencyNotInstalled
+from gymnasium.vector.utils import batch_space
 
 
 class Continuous_MountainCarEnv(gym.Env):
@@ -307,3 +309,39 @@ class Continuous_MountainCarEnv(gym.Env):
             pygame.display.quit()
             pygame.quit()
             self.isopen = False
+
+
+class Continuous_MountainCarVectorEnv(MountainCarVectorEnv):
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: int = 999,
+        render_mode: str | None = None,
+        goal_velocity: float = 0,
+    ):
+        super().__init__(
+            num_envs=num_envs,
+            max_episode_steps=max_episode_steps,
+            render_mode=render_mode,
+            goal_velocity=goal_velocity,
+        )
+        self.min_action = -1.0
+        self.max_action = 1.0
+        self.goal_position = (
+            0.45  # was 0.5 in gymnasium, 0.45 in Arnaud de Broissia's version
+        )
+        self.power = 0.0015
+
+        self.single_action_space = spaces.Box(
+            low=self.min_action, high=self.max_action, shape=(1,), dtype=np.float32
+        )
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+    def _acceleration(self, action: np.ndarray) -> np.ndarray:
+        position = self.state[0]
+        force = np.clip(action[:, 0], self.min_action, self.max_action)
+        return force * self.power - 0.0025 * np.cos(3 * position)
+
+    def _reward(self, action: np.ndarray, terminated: np.ndarray) -> np.ndarray:
+        reward = np.where(terminated, 100.0, 0.0) - np.square(action[:, 0]) * 0.1
+        return reward.astype(np.float32)
@@ -11,6 +11,8 @@ import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.envs.classic_control import utils
 from gymnasium.error import DependencyNotInstalled
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
 
 
 class MountainCarEnv(gym.Env):
@@ -287,3 +289,224 @@ class MountainCarEnv(gym.Env):
             pygame.display.quit()
             pygame.quit()
             self.isopen = False
+
+
+class MountainCarVectorEnv(VectorEnv):
+    metadata = {
+        "render_modes": ["rgb_array"],
+        "render_fps": 30,
+        "autoreset_mode": AutoresetMode.NEXT_STEP,
+    }
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: int = 200,
+        render_mode: str | None = None,
+        goal_velocity: float = 0,
+    ):
+        self.num_envs = num_envs
+        self.max_episode_steps = max_episode_steps
+        self.render_mode = render_mode
+
+        self.min_position = -1.2
+        self.max_position = 0.6
+        self.max_speed = 0.07
+        self.goal_position = 0.5
+        self.goal_velocity = goal_velocity
+
+        self.force = 0.001
+        self.gravity = 0.0025
+
+        self.low = -0.6
+        self.high = -0.4
+
+        self.state = None
+
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(num_envs, dtype=np.bool_)
+
+        low = np.array([self.min_position, -self.max_speed], dtype=np.float32)
+        high = np.array([self.max_position, self.max_speed], dtype=np.float32)
+
+        self.single_action_space = spaces.Discrete(3)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.single_observation_space = spaces.Box(low, high, dtype=np.float32)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+        self.screen_width = 600
+        self.screen_height = 400
+        self.screens = None
+        self.surf = None
+
+    def _acceleration(self, action: np.ndarray) -> np.ndarray:
+        position = self.state[0]
+        return (action - 1) * self.force + np.cos(3 * position) * (-self.gravity)
+
+    def _reward(self, action: np.ndarray, terminated: np.ndarray) -> np.ndarray:
+        return np.full(self.num_envs, -1.0, dtype=np.float32)
+
+    def step(
+        self, action: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        assert self.action_space.contains(
+            action
+        ), f"{action!r} ({type(action)}) invalid"
+        assert self.state is not None, "Call reset before using step method."
+
+        velocity = self.state[1] + self._acceleration(action)
+        velocity = np.clip(velocity, -self.max_speed, self.max_speed)
+        position = self.state[0] + velocity
+        position = np.clip(position, self.min_position, self.max_position)
+        velocity[(position == self.min_position) & (velocity < 0)] = 0
+
+        self.state = np.stack((position, velocity))
+
+        terminated: np.ndarray = (position >= self.goal_position) & (
+            velocity >= self.goal_velocity
+        )
+
+        self.steps += 1
+
+        truncated = self.steps >= self.max_episode_steps
+
+        reward = self._reward(action, terminated)
+
+        # Reset all environments which terminated or were truncated in the last step
+        self.state[0, self.prev_done] = self.np_random.uniform(
+            low=self.low, high=self.high, size=self.prev_done.sum()
+        )
+        self.state[1, self.prev_done] = 0
+        self.steps[self.prev_done] = 0
+        reward[self.prev_done] = 0.0
+        terminated[self.prev_done] = False
+        truncated[self.prev_done] = False
+
+        self.prev_done = np.logical_or(terminated, truncated)
+
+        return self.state.T.astype(np.float32), reward, terminated, truncated, {}
+
+    def reset(
+        self,
+        *,
+        seed: int | None = None,
+        options: dict | None = None,
+    ):
+        super().reset(seed=seed)
+        # Note that if you use custom reset bounds, it may lead to out-of-bound
+        # state/observations.
+        self.low, self.high = utils.maybe_parse_reset_bounds(options, -0.6, -0.4)
+        self.state = np.stack(
+            (
+                self.np_random.uniform(
+                    low=self.low, high=self.high, size=self.num_envs
+                ),
+                np.zeros(self.num_envs),
+            )
+        )
+        self.steps = np.zeros(self.num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(self.num_envs, dtype=np.bool_)
+
+        return self.state.T.astype(np.float32), {}
+
+    def _height(self, xs):
+        return np.sin(3 * xs) * 0.45 + 0.55
+
+    def render(self):
+        if self.render_mode is None:
+            assert self.spec is not None
+            gym.logger.warn(
+                "You are calling render method without specifying any render mode. "
+                "You can specify the render_mode at initialization, "
+                f'e.g. gym.make_vec("{self.spec.id}", render_mode="rgb_array")'
+            )
+            return
+
+        try:
+            import pygame
+            from pygame import gfxdraw
+        except ImportError as e:
+            raise DependencyNotInstalled(
+                'pygame is not installed, run `pip install "gymnasium[classic_control]"`'
+            ) from e
+
+        if self.screens is None:
+            pygame.init()
+
+            self.screens = [
+                pygame.Surface((self.screen_width, self.screen_height))
+                for _ in range(self.num_envs)
+            ]
+
+        if self.state is None:
+            raise ValueError(
+                "MountainCar's state is None, it probably hasn't be reset yet."
+            )
+
+        world_width = self.max_position - self.min_position
+        scale = self.screen_width / world_width
+        carwidth = 40
+        carheight = 20
+        clearance = 10
+
+        # The track and flag are the same for every sub-environment, only the car is drawn per screen
+        xs = np.linspace(self.min_position, self.max_position, 100)
+        ys = self._height(xs)
+        xys = list(zip((xs - self.min_position) * scale, ys * scale))
+
+        flagx = int((self.goal_position - self.min_position) * scale)
+        flagy1 = int(self._height(self.goal_position) * scale)
+        flagy2 = flagy1 + 50
+        flag_coords = [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)]
+
+        background = pygame.Surface((self.screen_width, self.screen_height))
+        background.fill((255, 255, 255))
+        pygame.draw.aalines(background, points=xys, closed=False, color=(0, 0, 0))
+        gfxdraw.vline(background, flagx, flagy1, flagy2, (0, 0, 0))
+        gfxdraw.aapolygon(background, flag_coords, (204, 204, 0))
+        gfxdraw.filled_polygon(background, flag_coords, (204, 204, 0))
+
+        for pos, screen in zip(self.state[0], self.screens):
+            self.surf = background.copy()
+
+            l, r, t, b = -carwidth / 2, carwidth / 2, carheight, 0
+            coords = []
+            for c in [(l, b), (l, t), (r, t), (r, b)]:
+                c = pygame.math.Vector2(c).rotate_rad(math.cos(3 * pos))
+                coords.append(
+                    (
+                        c[0] + (pos - self.min_position) * scale,
+                        c[1] + clearance + self._height(pos) * scale,
+                    )
+                )
+
+            gfxdraw.aapolygon(self.surf, coords, (0, 0, 0))
+            gfxdraw.filled_polygon(self.surf, coords, (0, 0, 0))
+
+            for c in [(carwidth / 4, 0), (-carwidth / 4, 0)]:
+                c = pygame.math.Vector2(c).rotate_rad(math.cos(3 * pos))
+                wheel = (
+                    int(c[0] + (pos - self.min_position) * scale),
+                    int(c[1] + clearance + self._height(pos) * scale),
+                )
+
+                gfxdraw.aacircle(
+                    self.surf, wheel[0], wheel[1], int(carheight / 2.5), (128, 128, 128)
+                )
+                gfxdraw.filled_circle(
+                    self.surf, wheel[0], wheel[1], int(carheight / 2.5), (128, 128, 128)
+                )
+
+            self.surf = pygame.transform.flip(self.surf, False, True)
+            screen.blit(self.surf, (0, 0))
+
+        return [
+            np.transpose(np.array(pygame.surfarray.pixels3d(screen)), axes=(1, 0, 2))
+            for screen in self.screens
+        ]
+
+    def close(self):
+        if self.screens is not None:
+            import pygame
+
+            pygame.quit()
@@ -250,6 +250,7 @@ class VectorizeMode(Enum):
 
     ASYNC = "async"
     SYNC = "sync"
+    THREADED = "threaded"
     VECTOR_ENTRY_POINT = "vector_entry_point"
 
 
@@ -842,9 +843,9 @@ def make_vec(
         num_envs: Number of environments to create
         vectorization_mode: The vectorization method used, defaults to ``None`` such that if env id' spec has a ``vector_entry_point`` (not ``None``),
             this is first used otherwise defaults to ``sync`` to use the :class:`gymnasium.vector.SyncVectorEnv`.
-            Valid modes are ``"async"``, ``"sync"`` or ``"vector_entry_point"``. Recommended to use the :class:`VectorizeMode` enum rather than strings.
+            Valid modes are ``"async"``, ``"sync"``, ``"threaded"`` or ``"vector_entry_point"``. Recommended to use the :class:`VectorizeMode` enum rather than strings.
         vector_kwargs: Additional arguments to pass to the vectorizor environment constructor, i.e., ``SyncVectorEnv(..., **vector_kwargs)``.
-        wrappers: A sequence of wrapper functions to apply to the base environment. Can only be used in ``"sync"`` or ``"async"`` mode.
+        wrappers: A sequence of wrapper functions to apply to the base environment. Can only be used in ``"sync"``, ``"async"`` or ``"threaded"`` mode.
         **kwargs: Additional arguments passed to the base environment constructor.
 
     Returns:
@@ -924,6 +925,17 @@ def make_vec(
             **vector_kwargs,
         )
 
+    elif vectorization_mode == VectorizeMode.THREADED:
+        if env_spec.entry_point is None:
+            raise error.Error(
+                f"Cannot create vectorized environment for {env_spec.id} because it doesn't have an entry point defined."
+            )
+
+        env = gym.vector.ThreadedVectorEnv(
+            env_fns=[create_single_env for _ in range(num_envs)],
+            **vector_kwargs,
+        )
+
     elif vectorization_mode == VectorizeMode.VECTOR_ENTRY_POINT:
         if len(vector_kwargs) > 0:
             raise error.Error(
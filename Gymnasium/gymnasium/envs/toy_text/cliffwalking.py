@@ -7,7 +7,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces
-from gymnasium.envs.toy_text.utils import categorical_sample
+from gymnasium.envs.toy_text.utils import cached_transition_table, categorical_sample
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -114,15 +114,12 @@ class CliffWalkingEnv(Env):
         self._cliff = np.zeros(self.shape, dtype=bool)
         self._cliff[3, 1:-1] = True
 
-        # Calculate transition probabilities and rewards
-        self.P = {}
-        for s in range(self.nS):
-            position = np.unravel_index(s, self.shape)
-            self.P[s] = {a: [] for a in range(self.nA)}
-            self.P[s][UP] = self._calculate_transition_prob(position, UP)
-            self.P[s][RIGHT] = self._calculate_transition_prob(position, RIGHT)
-            self.P[s][DOWN] = self._calculate_transition_prob(position, DOWN)
-            self.P[s][LEFT] = self._calculate_transition_prob(position, LEFT)
+        # Array-backed copy of `P` used for stepping, shared between all instances with the same dynamics.
+        # `P` is only built in Python for the first instance, later ones rebuild it from the table.
+        # It is kept for planning algorithms: `step` samples from the table, so changing `P` has no effect.
+        self.transition_table, self.P = cached_transition_table(
+            ("CliffWalking", is_slippery), self._build_P
+        )
 
         # Calculate initial state distribution
         # We always start in state (3, 0)
@@ -158,6 +155,18 @@ class CliffWalkingEnv(Env):
         coord[1] = max(coord[1], 0)
         return coord
 
+    def _build_P(self) -> dict[int, dict[int, list[tuple[float, Any, int, bool]]]]:
+        """Calculate transition probabilities and rewards of every state and action."""
+        P = {}
+        for s in range(self.nS):
+            position = np.unravel_index(s, self.shape)
+            P[s] = {a: [] for a in range(self.nA)}
+            P[s][UP] = self._calculate_transition_prob(position, UP)
+            P[s][RIGHT] = self._calculate_transition_prob(position, RIGHT)
+            P[s][DOWN] = self._calculate_transition_prob(position, DOWN)
+            P[s][LEFT] = self._calculate_transition_prob(position, LEFT)
+        return P
+
     def _calculate_transition_prob(
         self, current: list[int] | np.ndarray, move: int
     ) -> list[tuple[float, Any, int, bool]]:
@@ -192,9 +201,8 @@ class CliffWalkingEnv(Env):
         return outcomes
 
     def step(self, a):
-        transitions = self.P[self.s][a]
-        i = categorical_sample([t[0] for t in transitions], self.np_random)
-        p, s, r, t = transitions[i]
+        i = self.transition_table.sample(self.s, a, self.np_random)
+        p, s, r, t = self.transition_table.outcome(self.s, a, i)
         self.s = s
         self.lastaction = a
 
@@ -8,7 +8,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces, utils
-from gymnasium.envs.toy_text.utils import categorical_sample
+from gymnasium.envs.toy_text.utils import cached_transition_table, categorical_sample
 from gymnasium.error import DependencyNotInstalled
 from gymnasium.utils import seeding
 
@@ -253,8 +253,6 @@ class FrozenLakeEnv(Env):
         self.initial_state_distrib = np.array(desc == b"S").astype("float64").ravel()
         self.initial_state_distrib /= self.initial_state_distrib.sum()
 
-        self.P = {s: {a: [] for a in range(nA)} for s in range(nS)}
-
         fail_rate = (1.0 - success_rate) / 2.0
 
         def to_s(row, col):
@@ -281,25 +279,45 @@ class FrozenLakeEnv(Env):
             ]
             return new_state, reward, terminated
 
-        for row in range(nrow):
-            for col in range(ncol):
-                s = to_s(row, col)
-                for a in range(4):
-                    li = self.P[s][a]
-                    letter = desc[row, col]
-                    if letter in b"GH":
-                        li.append((1.0, s, 0, True))
-                    else:
-                        if is_slippery:
-                            for b in [(a - 1) % 4, a, (a + 1) % 4]:
-                                li.append(
-                                    (
-                                        success_rate if b == a else fail_rate,
-                                        *update_probability_matrix(row, col, b),
+        def build_P():
+            P = {s: {a: [] for a in range(nA)} for s in range(nS)}
+            for row in range(nrow):
+                for col in range(ncol):
+                    s = to_s(row, col)
+                    for a in range(4):
+                        li = P[s][a]
+                        letter = desc[row, col]
+                        if letter in b"GH":
+                            li.append((1.0, s, 0, True))
+                        else:
+                            if is_slippery:
+                                for b in [(a - 1) % 4, a, (a + 1) % 4]:
+                                    li.append(
+                                        (
+                                            success_rate if b == a else fail_rate,
+                                            *update_probability_matrix(row, col, b),
+                                        )
                                     )
+                            else:
+                                li.append(
+                                    (1.0, *update_probability_matrix(row, col, a))
                                 )
-                        else:
-                            li.append((1.0, *update_probability_matrix(row, col, a)))
+            return P
+
+        # Array-backed copy of `P` used for stepping, shared between all instances with the same map and dynamics.
+        # `P` is only built in Python for the first instance, later ones rebuild it from the table.
+        # It is kept for planning algorithms: `step` samples from the table, so changing `P` has no effect.
+        self.transition_table, self.P = cached_transition_table(
+            (
+                "FrozenLake",
+                desc.shape,
+                desc.tobytes(),
+                is_slippery,
+                success_rate,
+                tuple(reward_schedule),
+            ),
+            build_P,
+        )
 
         self.observation_space = spaces.Discrete(nS)
         self.action_space = spaces.Discrete(nA)
@@ -322,9 +340,8 @@ class FrozenLakeEnv(Env):
         self.start_img = None
 
     def step(self, a):
-        transitions = self.P[self.s][a]
-        i = categorical_sample([t[0] for t in transitions], self.np_random)
-        p, s, r, t = transitions[i]
+        i = self.transition_table.sample(self.s, a, self.np_random)
+        p, s, r, t = self.transition_table.outcome(self.s, a, i)
         self.s = s
         self.lastaction = a
 
@@ -6,7 +6,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces, utils
-from gymnasium.envs.toy_text.utils import categorical_sample
+from gymnasium.envs.toy_text.utils import cached_transition_table, categorical_sample
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -276,6 +276,35 @@ class TaxiEnv(Env):
         else:
             self.P[state][action].append((1.0, intended_state, reward, terminated))
 
+    def _build_P(self, num_states, num_actions, is_rainy):
+        """Computes the transitions of every state and action."""
+        self.P = {
+            state: {action: [] for action in range(num_actions)}
+            for state in range(num_states)
+        }
+        for row in range(self.max_row + 1):
+            for col in range(self.max_col + 1):
+                for pass_idx in range(len(self.locs) + 1):  # +1 for being inside taxi
+                    for dest_idx in range(len(self.locs)):
+                        for action in range(num_actions):
+                            if is_rainy:
+                                self._build_rainy_transitions(
+                                    row,
+                                    col,
+                                    pass_idx,
+                                    dest_idx,
+                                    action,
+                                )
+                            else:
+                                self._build_dry_transitions(
+                                    row,
+                                    col,
+                                    pass_idx,
+                                    dest_idx,
+                                    action,
+                                )
+        return self.P
+
     def __init__(
         self,
         render_mode: str | None = None,
@@ -294,11 +323,6 @@ class TaxiEnv(Env):
         self.max_col = num_columns - 1
         self.initial_state_distrib = np.zeros(num_states)
         num_actions = 6
-        self.P = {
-            state: {action: [] for action in range(num_actions)}
-            for state in range(num_states)
-        }
-
         for row in range(num_rows):
             for col in range(num_columns):
                 for pass_idx in range(len(locs) + 1):  # +1 for being inside taxi
@@ -306,24 +330,16 @@ class TaxiEnv(Env):
                         state = self.encode(row, col, pass_idx, dest_idx)
                         if pass_idx < 4 and pass_idx != dest_idx:
                             self.initial_state_distrib[state] += 1
-                        for action in range(num_actions):
-                            if is_rainy:
-                                self._build_rainy_transitions(
-                                    row,
-                                    col,
-                                    pass_idx,
-                                    dest_idx,
-                                    action,
-                                )
-                            else:
-                                self._build_dry_transitions(
-                                    row,
-                                    col,
-                                    pass_idx,
-                                    dest_idx,
-                                    action,
-                                )
         self.initial_state_distrib /= self.initial_state_distrib.sum()
+
+        # Array-backed copy of `P` used for stepping, shared between all instances with the same dynamics.
+        # `P` is only built in Python for the first instance, later ones rebuild it from the table.
+        # It is kept for planning algorithms: `step` samples from the table, so changing `P` has no effect.
+        self.transition_table, self.P = cached_transition_table(
+            ("Taxi", is_rainy),
+            lambda: self._build_P(num_states, num_actions, is_rainy),
+        )
+
         self.action_space = spaces.Discrete(num_actions)
         self.observation_space = spaces.Discrete(num_states)
 
@@ -391,9 +407,8 @@ class TaxiEnv(Env):
         return mask
 
     def step(self, a):
-        transitions = self.P[self.s][a]
-        i = categorical_sample([t[0] for t in transitions], self.np_random)
-        p, s, r, t = transitions[i]
+        i = self.transition_table.sample(self.s, a, self.np_random)
+        p, s, r, t = self.transition_table.outcome(self.s, a, i)
         self.lastaction = a
 
         shadow_row, shadow_col, shadow_pass_loc, shadow_dest_idx = self.decode(self.s)
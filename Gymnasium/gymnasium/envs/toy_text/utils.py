@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+
 import numpy as np
 
 
@@ -6,3 +10,121 @@ def categorical_sample(prob_n, np_random: np.random.Generator):
     prob_n = np.asarray(prob_n)
     csprob_n = np.cumsum(prob_n)
     return np.argmax(csprob_n > np_random.random())
+
+
+class TransitionTable:
+    """Array-backed version of a toy_text ``P[s][a] = [(prob, next_state, reward, terminated), ...]`` table.
+
+    Every array has shape ``(num_states, num_actions, max_outcomes)`` and is indexed by ``[s, a, k]`` for the k-th outcome
+    of ``P[s][a]``. Pairs with fewer outcomes are padded with zero probability outcomes that are never sampled,
+    ``num_outcomes[s, a]`` is the number of outcomes of ``P[s][a]``.
+    The arrays are read-only as the table can be shared between environment instances.
+    """
+
+    def __init__(self, P: dict[int, dict[int, list[tuple]]]):
+        """Compiles the transition table ``P``."""
+        num_states = len(P)
+        num_actions = len(P[0])
+        max_outcomes = max(
+            len(P[s][a]) for s in range(num_states) for a in range(num_actions)
+        )
+
+        shape = (num_states, num_actions, max_outcomes)
+        self.probs = np.zeros(shape, dtype=np.float64)
+        self.next_states = np.zeros(shape, dtype=np.int64)
+        self.rewards = np.zeros(
+            shape,
+            dtype=np.asarray([t[2] for s in P for a in P[s] for t in P[s][a]]).dtype,
+        )
+        self.terminated = np.zeros(shape, dtype=np.bool_)
+
+        for s in range(num_states):
+            for a in range(num_actions):
+                for k, (prob, next_state, reward, terminated) in enumerate(P[s][a]):
+                    self.probs[s, a, k] = prob
+                    self.next_states[s, a, k] = next_state
+                    self.rewards[s, a, k] = reward
+                    self.terminated[s, a, k] = terminated
+
+        # The last outcome of every pair (and the padding after it) is set to exactly 1 so that a uniform
+        # sample in [0, 1) always falls within the valid outcomes, even with floating point rounding of the sum
+        self.cumulative_probs = np.cumsum(self.probs, axis=2)
+        self.num_outcomes = np.array(
+            [[len(P[s][a]) for a in range(num_actions)] for s in range(num_states)],
+            dtype=np.int64,
+        )
+        self.cumulative_probs[
+            np.arange(max_outcomes) >= self.num_outcomes[..., None] - 1
+        ] = 1.0
+
+        for array in (
+            self.probs,
+            self.next_states,
+            self.rewards,
+            self.terminated,
+            self.cumulative_probs,
+            self.num_outcomes,
+        ):
+            array.flags.writeable = False
+
+    def to_P(self) -> dict[int, dict[int, list[tuple]]]:
+        """Returns a new ``P[s][a] = [(prob, next_state, reward, terminated), ...]`` table of Python scalars, the inverse of compiling ``P``."""
+        # All the outcomes of the table in [s, a, k] order, split into the lists of every pair
+        valid = np.arange(self.probs.shape[2]) < self.num_outcomes[..., None]
+        outcomes = list(
+            zip(
+                self.probs[valid].tolist(),
+                self.next_states[valid].tolist(),
+                self.rewards[valid].tolist(),
+                self.terminated[valid].tolist(),
+            )
+        )
+        P = {}
+        end = 0
+        for s, num_outcomes in enumerate(self.num_outcomes.tolist()):
+            P[s] = {}
+            for a, n in enumerate(num_outcomes):
+                start, end = end, end + n
+                P[s][a] = outcomes[start:end]
+        return P
+
+    def sample(self, s: int, a: int, np_random: np.random.Generator) -> int:
+        """Samples the index of the outcome for taking action ``a`` in state ``s``, equivalent to :func:`categorical_sample`."""
+        return int(
+            self.cumulative_probs[s, a].searchsorted(np_random.random(), side="right")
+        )
+
+    def outcome(self, s: int, a: int, k: int) -> tuple:
+        """Returns the k-th outcome of ``P[s][a]`` as a ``(prob, next_state, reward, terminated)`` tuple of Python scalars."""
+        return (
+            self.probs[s, a, k].item(),
+            self.next_states[s, a, k].item(),
+            self.rewards[s, a, k].item(),
+            self.terminated[s, a, k].item(),
+        )
+
+
+_TRANSITION_TABLE_CACHE: dict[Hashable, TransitionTable] = {}
+_TRANSITION_TABLE_CACHE_SIZE = 128
+
+
+def cached_transition_table(
+    key: Hashable, build_P: Callable[[], dict[int, dict[int, list[tuple]]]]
+) -> tuple[TransitionTable, dict[int, dict[int, list[tuple]]]]:
+    """Returns the :class:`TransitionTable` of the transitions identified by ``key`` together with their ``P`` table.
+
+    ``build_P`` is only called, and its ``P`` compiled, the first time a key is seen. For a cached key, ``P`` is
+    rebuilt from the table with :meth:`TransitionTable.to_P`, which is much faster than building it in Python.
+    The key must uniquely identify the transitions, e.g., the map description and slipperiness. The least recently
+    compiled tables are dropped once the cache holds more than a fixed number of them (e.g., with many random maps).
+    """
+    table = _TRANSITION_TABLE_CACHE.get(key)
+    if table is not None:
+        return table, table.to_P()
+
+    P = build_P()
+    table = TransitionTable(P)
+    if len(_TRANSITION_TABLE_CACHE) >= _TRANSITION_TABLE_CACHE_SIZE:
+        _TRANSITION_TABLE_CACHE.pop(next(iter(_TRANSITION_TABLE_CACHE)))
+    _TRANSITION_TABLE_CACHE[key] = table
+    return table, P
@@ -1,9 +1,15 @@
 """A collection of runtime performance bencharks, useful for debugging performance related issues."""
 
+from __future__ import annotations
+
 import time
 from collections.abc import Callable
+from typing import Any
+
+import numpy as np
 
 import gymnasium
+import gymnasium.vector
 
 
 def benchmark_step(env: gymnasium.Env, target_duration: int = 5, seed=None) -> float:
@@ -99,3 +105,70 @@ def benchmark_render(env: gymnasium.Env, target_duration: int = 5) -> float:
 
     renders_per_time = renders / length
     return renders_per_time
+
+
+def benchmark_step_latency(
+    env: gymnasium.Env | gymnasium.vector.VectorEnv,
+    num_steps: int = 1000,
+    warmup: int = 100,
+    repeats: int = 5,
+    seed: int | None = None,
+    percentiles: tuple[float, ...] = (50, 90, 99),
+) -> dict[str, Any]:
+    """A benchmark to measure the per-step latency and throughput of an environment or vector environment.
+
+    Unlike :func:`benchmark_step`, every step is timed individually with :func:`time.perf_counter_ns`, actions are
+    sampled before the timed loop, and the benchmark is repeated so the spread between runs is visible.
+
+    Example:
+        >>> env = gymnasium.make("CartPole-v1")
+        >>> result = benchmark_step_latency(env, num_steps=100, warmup=10, repeats=2, seed=0)
+        >>> sorted(result)
+        ['latency_us', 'num_envs', 'repeats', 'steps_per_second', 'steps_per_second_all']
+
+    Args:
+        env: the environment to benchmark, for a :class:`VectorEnv` one step advances every sub-environment.
+        num_steps: the number of timed steps in each repeat.
+        warmup: the number of untimed steps before the first repeat.
+        repeats: the number of times the timed steps are repeated.
+        seed: seeds the environment and the action space.
+        percentiles: the latency percentiles to report.
+
+    Returns:
+        A dictionary with the median ``steps_per_second`` over the repeats (``steps_per_second_all`` for every
+        repeat), the latency percentiles in microseconds over all timed steps (``latency_us``), ``num_envs`` and
+        ``repeats``. For vector environments, ``steps_per_second`` counts calls to ``step``; multiply by
+        ``num_envs`` for environment steps.
+    """
+    is_vector = isinstance(env, gymnasium.vector.VectorEnv)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(max(num_steps, warmup))]
+
+    latencies = np.empty((repeats, num_steps), dtype=np.int64)
+    for i in range(warmup):
+        _, _, terminated, truncated, _ = env.step(actions[i])
+        if not is_vector and (terminated or truncated):
+            env.reset()
+
+    for repeat in range(repeats):
+        timings = latencies[repeat]
+        for i in range(num_steps):
+            start = time.perf_counter_ns()
+            _, _, terminated, truncated, _ = env.step(actions[i])
+            timings[i] = time.perf_counter_ns() - start
+            # vector environments reset themselves, single environments are reset outside the timed region
+            if not is_vector and (terminated or truncated):
+                env.reset()
+
+    steps_per_second = num_steps / (latencies.sum(axis=1) / 1e9)
+    return {
+        "steps_per_second": float(np.median(steps_per_second)),
+        "steps_per_second_all": steps_per_second.tolist(),
+        "latency_us": {
+            f"p{p:g}": float(v) / 1e3
+            for p, v in zip(percentiles, np.percentile(latencies, percentiles))
+        },
+        "num_envs": env.num_envs if is_vector else 1,
+        "repeats": repeats,
+    }
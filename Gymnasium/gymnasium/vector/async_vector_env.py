@@ -6,11 +6,12 @@ import multiprocessing
 import sys
 import time
 import traceback
+from collections import deque
 from collections.abc import Callable, Sequence
 from copy import deepcopy
 from enum import Enum
 from multiprocessing import Queue
-from multiprocessing.connection import Connection
+from multiprocessing.connection import Connection, wait
 from multiprocessing.sharedctypes import SynchronizedArray
 from typing import Any
 
@@ -24,15 +25,18 @@ from gymnasium.error import (
     CustomSpaceError,
     NoAsyncCallError,
 )
+from gymnasium.spaces import Box, Discrete, MultiBinary, MultiDiscrete
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
 from gymnasium.vector.utils import (
     CloudpickleWrapper,
+    InfoBatcher,
     batch_differing_spaces,
     batch_space,
     clear_mpi_env_vars,
     concatenate,
     create_empty_array,
     create_shared_memory,
+    is_array_space,
     iterate,
     read_from_shared_memory,
     write_to_shared_memory,
@@ -42,6 +46,10 @@ from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
 
 __all__ = ["AsyncVectorEnv", "AsyncState"]
 
+# Values of the shared command array, telling a worker where its next command is (``transport="shared_memory"``)
+_PIPE_COMMAND = 0
+_STEP_COMMAND = 1
+
 
 class AsyncState(Enum):
     """The AsyncVectorEnv possible states given the different actions."""
@@ -50,12 +58,25 @@ class AsyncState(Enum):
     WAITING_RESET = "reset"
     WAITING_STEP = "step"
     WAITING_CALL = "call"
+    WAITING_RECV = "recv"
 
 
 class AsyncVectorEnv(VectorEnv):
     """Vectorized environment that runs multiple environments in parallel.
 
-    It uses ``multiprocessing`` processes, and pipes for communication.
+    It uses ``multiprocessing`` processes, and pipes for communication. With ``envs_per_worker > 1``, each process
+    hosts a group of sub-environments, steps them sequentially and exchanges one message per group, so thousands
+    of cheap environments do not need thousands of processes. With ``transport="shared_memory"``,
+    steps skip the pipes: actions, rewards, terminations and truncations are exchanged through preallocated
+    shared arrays, signalled with semaphores, and only non-empty infos are pickled.
+
+    Besides :meth:`step`, the sub-environments can be stepped independently (EnvPool-style) with :meth:`send`
+    and :meth:`recv`: :meth:`recv` returns the first ``batch_size`` sub-environments that finished together
+    with their ids, and :meth:`send` steps only those, so a slow sub-environment does not hold back the batch.
+
+    With ``observation_buffers=N > 1``, the shared observation memory holds ``N`` batches used in turn: the workers
+    write each step into the next batch while the caller keeps a read-only view of the previous ones, so the
+    observations are safe to hold without copying them every step (megabytes per step for pixel observations).
 
     Example:
         >>> import gymnasium as gym
@@ -87,6 +108,19 @@ class AsyncVectorEnv(VectorEnv):
         array([False, False])
         >>> infos
         {}
+
+    Example - Stepping the sub-environments independently:
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=4, vectorization_mode="async")
+        >>> observations, infos = envs.reset(seed=42)
+        >>> envs.send(np.array([0, 1, 0, 1]))
+        >>> observations, rewards, terminations, truncations, infos, env_ids = envs.recv(batch_size=2)
+        >>> observations.shape, rewards.shape, env_ids.shape
+        ((2, 4), (2,), (2,))
+        >>> envs.send(np.array([1, 1]), env_ids)
+        >>> observations, rewards, terminations, truncations, infos, env_ids = envs.recv()
+        >>> env_ids.shape
+        (4,)
+        >>> envs.close()
     """
 
     def __init__(
@@ -104,6 +138,9 @@ class AsyncVectorEnv(VectorEnv):
         ) = None,
         observation_mode: str | Space = "same",
         autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        transport: str = "pipe",
+        envs_per_worker: int = 1,
+        observation_buffers: int = 1,
     ):
         """Vectorized environment that runs multiple environments in parallel.
 
@@ -124,6 +161,22 @@ class AsyncVectorEnv(VectorEnv):
                 warning, may raise unexpected errors. Passing a ``Tuple[Space, Space]`` object allows defining a custom ``single_observation_space`` and
                 ``observation_space``, warning, may raise unexpected errors.
             autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            transport: How step commands and results are exchanged with the worker processes. ``"pipe"`` pickles the
+                action and the step results through a pipe. ``"shared_memory"`` writes them into preallocated shared
+                arrays and signals with semaphores, infos are only pickled when non-empty. This lowers the latency of
+                each step for cheap environments (e.g. CartPole) where the pipe overhead dominates. It requires
+                ``shared_memory=True`` and a ``Box``, ``Discrete``, ``MultiDiscrete`` or ``MultiBinary`` action space,
+                a custom ``worker`` then also receives the step buffers as last argument.
+            envs_per_worker: Number of sub-environments hosted by each worker process, the last worker hosts the
+                remainder. With more than one, a custom ``worker`` receives the ``range`` of its sub-environment
+                indices and the list of their functions, and every message holds one ``(command, data)`` per
+                sub-environment.
+            observation_buffers: Number of observation batches in the shared memory, used in turn by :meth:`reset` and
+                :meth:`step`. With more than one, they return read-only views of the batch just written instead of
+                copies (whatever ``copy``), which stay unchanged for the next ``observation_buffers - 1`` calls.
+                It requires ``shared_memory=True`` and an observation space made of ``Box``, ``Discrete``,
+                ``MultiDiscrete`` and ``MultiBinary`` spaces (possibly in a ``Tuple`` or ``Dict``), a custom ``worker``
+                then also receives the ``buffer_indices`` shared array, the batch to write each sub-environment into.
 
         Warnings:
             worker is an advanced mode option. It provides a high degree of flexibility and a high chance
@@ -135,6 +188,9 @@ class AsyncVectorEnv(VectorEnv):
                 (or, by default, the observation space of the first sub-environment).
             ValueError: If observation_space is a custom space (i.e. not a default space in Gym,
                 such as gymnasium.spaces.Box, gymnasium.spaces.Discrete, or gymnasium.spaces.Dict) and shared_memory is True.
+            ValueError: If ``transport="shared_memory"`` is used without ``shared_memory`` or with an unsupported action space.
+            ValueError: If ``observation_buffers`` is not a positive integer, or is larger than one without
+                ``shared_memory`` or with an unsupported observation space.
         """
         self.env_fns = env_fns
         self.shared_memory = shared_memory
@@ -143,6 +199,9 @@ class AsyncVectorEnv(VectorEnv):
         self.daemon = daemon
         self.worker = worker
         self.observation_mode = observation_mode
+        self.transport = transport
+        self.envs_per_worker = envs_per_worker
+        self.observation_buffers = observation_buffers
         self.autoreset_mode = (
             autoreset_mode
             if isinstance(autoreset_mode, AutoresetMode)
@@ -150,6 +209,24 @@ class AsyncVectorEnv(VectorEnv):
         )
 
         self.num_envs = len(env_fns)
+        if not (isinstance(envs_per_worker, int) and envs_per_worker >= 1):
+            raise ValueError(
+                f"Expected `envs_per_worker` to be a positive integer, actual got {envs_per_worker}"
+            )
+        # The sub-environment indices hosted by each worker process
+        self.worker_envs = [
+            range(start, min(start + envs_per_worker, self.num_envs))
+            for start in range(0, self.num_envs, envs_per_worker)
+        ]
+        self.num_workers = len(self.worker_envs)
+        if not (isinstance(observation_buffers, int) and observation_buffers >= 1):
+            raise ValueError(
+                f"Expected `observation_buffers` to be a positive integer, actual got {observation_buffers}"
+            )
+        if observation_buffers > 1 and not shared_memory:
+            raise ValueError(
+                "`AsyncVectorEnv(..., observation_buffers > 1)` requires `shared_memory=True`."
+            )
 
         # This would be nice to get rid of, but without it there's a deadlock between shared memory and pipes
         # Create a dummy environment to gather the metadata and observation / action space of the environment
@@ -190,13 +267,24 @@ class AsyncVectorEnv(VectorEnv):
 
         # Generate the multiprocessing context for the observation buffer
         ctx = multiprocessing.get_context(context)
+        if observation_buffers > 1 and not is_array_space(
+            self.single_observation_space
+        ):
+            raise ValueError(
+                "`AsyncVectorEnv(..., observation_buffers > 1)` requires an observation space made of Box, Discrete, "
+                f"MultiDiscrete and MultiBinary spaces, actual got {self.single_observation_space}"
+            )
         if self.shared_memory:
             try:
                 _obs_buffer = create_shared_memory(
-                    self.single_observation_space, n=self.num_envs, ctx=ctx
+                    self.single_observation_space,
+                    n=self.num_envs * observation_buffers,
+                    ctx=ctx,
                 )
                 self.observations = read_from_shared_memory(
-                    self.single_observation_space, _obs_buffer, n=self.num_envs
+                    self.single_observation_space,
+                    _obs_buffer,
+                    n=self.num_envs * observation_buffers,
                 )
             except CustomSpaceError as e:
                 raise ValueError(
@@ -208,24 +296,68 @@ class AsyncVectorEnv(VectorEnv):
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
 
+        # The batch of observations last returned and the batch each sub-environment was last written into,
+        # the workers write into `observation_buffers` batches in turn (``observation_buffers > 1``)
+        self._buffer_index = 0
+        if observation_buffers > 1:
+            self._observation_batches = []
+            for k in range(observation_buffers):
+                rows = slice(k * self.num_envs, (k + 1) * self.num_envs)
+                self._observation_batches.append(
+                    _map_arrays(lambda array: array[rows], self.observations)
+                )
+            self._read_only_batches = [
+                _map_arrays(_read_only_view, batch)
+                for batch in self._observation_batches
+            ]
+            self.observations = self._read_only_batches[0]
+            _buffer_indices = ctx.Array("i", self.num_envs, lock=False)
+            self._buffer_indices = np.frombuffer(_buffer_indices, dtype=np.int32)
+            worker_kwargs = {"buffer_indices": _buffer_indices}
+        else:
+            worker_kwargs = {}
+
+        if transport == "shared_memory":
+            step_buffers = self._create_step_buffers(ctx)
+        elif transport == "pipe":
+            step_buffers = None
+        else:
+            raise ValueError(
+                f"Invalid `transport`, expected: 'pipe' or 'shared_memory', actual got {transport}"
+            )
+
         self.parent_pipes, self.processes = [], []
         self.error_queue = ctx.Queue()
         target = worker or _async_worker
         with clear_mpi_env_vars():
-            for idx, env_fn in enumerate(self.env_fns):
+            for idx, env_indices in enumerate(self.worker_envs):
                 parent_pipe, child_pipe = ctx.Pipe()
+                args = (
+                    (idx if envs_per_worker == 1 else env_indices),
+                    (
+                        CloudpickleWrapper(self.env_fns[idx])
+                        if envs_per_worker == 1
+                        else [CloudpickleWrapper(self.env_fns[i]) for i in env_indices]
+                    ),
+                    child_pipe,
+                    parent_pipe,
+                    _obs_buffer,
+                    self.error_queue,
+                    self.autoreset_mode,
+                )
+                if step_buffers is not None:
+                    args += (
+                        {
+                            **step_buffers,
+                            "worker_index": idx,
+                            "command_ready": self._command_ready[idx],
+                        },
+                    )
                 process = ctx.Process(
                     target=target,
                     name=f"Worker<{type(self).__name__}>-{idx}",
-                    args=(
-                        idx,
-                        CloudpickleWrapper(env_fn),
-                        child_pipe,
-                        parent_pipe,
-                        _obs_buffer,
-                        self.error_queue,
-                        self.autoreset_mode,
-                    ),
+                    args=args,
+                    kwargs=worker_kwargs,
                 )
 
                 self.parent_pipes.append(parent_pipe)
@@ -235,9 +367,145 @@ class AsyncVectorEnv(VectorEnv):
                 process.start()
                 child_pipe.close()
 
+        # State of `send` / `recv`: the sub-environments sent a step and not returned by `recv` yet,
+        # the results already received in the order they arrived and the replies expected from each worker
+        self._pending = np.zeros(self.num_envs, dtype=np.bool_)
+        self._received = deque()
+        self._pending_replies = [0] * self.num_workers
+        self._info_stash = {}
+
+        self._infos = InfoBatcher(self.num_envs)
+
         self._state = AsyncState.DEFAULT
         self._check_spaces()
 
+    def _create_step_buffers(self, ctx) -> dict[str, Any]:
+        """Allocates the shared arrays and semaphores of ``transport="shared_memory"`` and their views in this process."""
+        if not self.shared_memory:
+            raise ValueError(
+                "`AsyncVectorEnv(..., transport='shared_memory')` requires `shared_memory=True`."
+            )
+        if not isinstance(
+            self.single_action_space, (Box, Discrete, MultiDiscrete, MultiBinary)
+        ):
+            raise ValueError(
+                "`AsyncVectorEnv(..., transport='shared_memory')` requires a Box, Discrete, MultiDiscrete or "
+                f"MultiBinary action space, actual got {self.single_action_space}"
+            )
+
+        step_buffers = {
+            "num_envs": self.num_envs,
+            "actions": create_shared_memory(
+                self.single_action_space, n=self.num_envs, ctx=ctx
+            ),
+            "rewards": ctx.Array("d", self.num_envs, lock=False),
+            "terminations": ctx.Array("b", self.num_envs, lock=False),
+            "truncations": ctx.Array("b", self.num_envs, lock=False),
+            # 0 for a step without info, 1 if its info follows through the pipe, -1 if the step raised an error
+            "step_status": ctx.Array("b", self.num_envs, lock=False),
+            # Set by a worker when the step of a sub-environment is written, cleared once received
+            "step_ready": ctx.Array("b", self.num_envs, lock=False),
+            # The step request of each sub-environment: every wake-up of a worker steps the sub-environments
+            # whose request is the worker's next request number, so wake-ups and requests stay paired
+            "requested": ctx.Array("q", self.num_envs, lock=False),
+            "commands": ctx.Array("b", self.num_workers, lock=False),
+            "step_done": ctx.Semaphore(0),
+            # Held by a worker while it flags and signals a step and by `recv` while it collects flagged steps,
+            # see `_receive_steps` for the ordering this gives
+            "step_lock": ctx.Lock(),
+        }
+        self._command_ready = [ctx.Semaphore(0) for _ in range(self.num_workers)]
+        self._step_done = step_buffers["step_done"]
+        self._step_lock = step_buffers["step_lock"]
+        self._commands = np.frombuffer(step_buffers["commands"], dtype=np.int8)
+        self._actions = read_from_shared_memory(
+            self.single_action_space, step_buffers["actions"], n=self.num_envs
+        )
+        self._rewards = np.frombuffer(step_buffers["rewards"], dtype=np.float64)
+        self._terminations = np.frombuffer(step_buffers["terminations"], dtype=np.int8)
+        self._truncations = np.frombuffer(step_buffers["truncations"], dtype=np.int8)
+        self._step_status = np.frombuffer(step_buffers["step_status"], dtype=np.int8)
+        self._step_ready = np.frombuffer(step_buffers["step_ready"], dtype=np.int8)
+        self._requested = np.frombuffer(step_buffers["requested"], dtype=np.int64)
+        self._requests = np.zeros(self.num_workers, dtype=np.int64)
+        return step_buffers
+
+    def _send_command(self, index: int, message: Any):
+        """Sends a message through the pipe of a worker, waking it up with ``transport="shared_memory"``."""
+        if self.transport == "shared_memory":
+            # Woken up before sending, a large message cannot block on a full pipe the worker does not read yet
+            self._commands[index] = _PIPE_COMMAND
+            self._command_ready[index].release()
+        self.parent_pipes[index].send(message)
+
+    def _request_shared_step(self, env_ids: np.ndarray):
+        """Wakes up the workers of ``env_ids`` to step them, their actions are already in the shared buffer."""
+        workers = np.unique(env_ids // self.envs_per_worker)
+        self._requests[workers] += 1
+        self._requested[env_ids] = self._requests[env_ids // self.envs_per_worker]
+        self._commands[workers] = _STEP_COMMAND
+        for index in workers:
+            self._command_ready[index].release()
+
+    def _recv_info(self, env_idx: int) -> dict[str, Any]:
+        """Receives the info of a shared memory step, infos of the other sub-environments of the worker may come first."""
+        pipe = self.parent_pipes[env_idx // self.envs_per_worker]
+        while env_idx not in self._info_stash:
+            info_idx, info = pipe.recv()
+            self._info_stash[info_idx] = info
+        return self._info_stash.pop(env_idx)
+
+    def _send_to_envs(self, messages: list[tuple[str, Any]]):
+        """Sends one ``(command, data)`` message per sub-environment, batched into one message per worker."""
+        for index, env_indices in enumerate(self.worker_envs):
+            if self.envs_per_worker == 1:
+                self._send_command(index, messages[env_indices.start])
+            else:
+                self._send_command(index, [messages[i] for i in env_indices])
+
+    def _recv_from_envs(self) -> tuple[list[Any], list[bool]]:
+        """Receives the result of every sub-environment and whether each worker succeeded."""
+        results, successes = [], []
+        for pipe, env_indices in zip(self.parent_pipes, self.worker_envs):
+            result, success = pipe.recv()
+            successes.append(success)
+            if self.envs_per_worker == 1:
+                results.append(result)
+            else:
+                results.extend(result if success else [None] * len(env_indices))
+        return results, successes
+
+    def _next_observation_buffer(self) -> int:
+        """The batch of the shared observation memory the next :meth:`reset` or :meth:`step` writes into."""
+        return (self._buffer_index + 1) % self.observation_buffers
+
+    def _start_observation_buffer(self, env_ids: np.ndarray | slice):
+        """Points the workers of ``env_ids`` and :attr:`observations` to the next batch of the observation memory."""
+        if self.observation_buffers > 1:
+            self._buffer_index = self._next_observation_buffer()
+            self._buffer_indices[env_ids] = self._buffer_index
+            self.observations = self._read_only_batches[self._buffer_index]
+
+    def _batch_observations(self) -> ObsType:
+        """The observations returned by :meth:`reset` and :meth:`step`."""
+        if self.observation_buffers > 1:
+            # Sub-environments left out (`reset_mask`) keep their last observation, copied from its batch
+            stale = np.flatnonzero(self._buffer_indices != self._buffer_index)
+            for k in np.unique(self._buffer_indices[stale]):
+                rows = stale[self._buffer_indices[stale] == k]
+
+                def copy_rows(source: np.ndarray, target: np.ndarray):
+                    target[rows] = source[rows]
+
+                _map_arrays(
+                    copy_rows,
+                    self._observation_batches[k],
+                    self._observation_batches[self._buffer_index],
+                )
+            self._buffer_indices[stale] = self._buffer_index
+            return self.observations
+        return deepcopy(self.observations) if self.copy else self.observations
+
     @property
     def np_random_seed(self) -> tuple[int, ...]:
         """Returns a tuple of np_random seeds for all the wrapped envs."""
@@ -316,16 +584,22 @@ class AsyncVectorEnv(VectorEnv):
                 reset_mask
             ), f"`options['reset_mask': mask]` must contain a boolean array, got reset_mask={reset_mask}"
 
-            for pipe, env_seed, env_reset in zip(self.parent_pipes, seed, reset_mask):
-                if env_reset:
-                    env_kwargs = {"seed": env_seed, "options": options}
-                    pipe.send(("reset", env_kwargs))
-                else:
-                    pipe.send(("reset-noop", None))
+            self._start_observation_buffer(reset_mask)
+            self._send_to_envs(
+                [
+                    (
+                        ("reset", {"seed": env_seed, "options": options})
+                        if env_reset
+                        else ("reset-noop", None)
+                    )
+                    for env_seed, env_reset in zip(seed, reset_mask)
+                ]
+            )
         else:
-            for pipe, env_seed in zip(self.parent_pipes, seed):
-                env_kwargs = {"seed": env_seed, "options": options}
-                pipe.send(("reset", env_kwargs))
+            self._start_observation_buffer(slice(None))
+            self._send_to_envs(
+                [("reset", {"seed": env_seed, "options": options}) for env_seed in seed]
+            )
 
         self._state = AsyncState.WAITING_RESET
 
@@ -359,13 +633,13 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `reset_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = self._recv_from_envs()
         self._raise_if_errors(successes)
 
-        infos = {}
         results, info_data = zip(*results)
         for i, info in enumerate(info_data):
-            infos = self._add_info(infos, info, i)
+            self._infos.add(info, i)
+        infos = self._infos.pop()
 
         if not self.shared_memory:
             self.observations = concatenate(
@@ -373,7 +647,7 @@ class AsyncVectorEnv(VectorEnv):
             )
 
         self._state = AsyncState.DEFAULT
-        return (deepcopy(self.observations) if self.copy else self.observations), infos
+        return self._batch_observations(), infos
 
     def step(
         self, actions: ActType
@@ -409,9 +683,26 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        iter_actions = iterate(self.action_space, actions)
-        for pipe, action in zip(self.parent_pipes, iter_actions, strict=True):
-            pipe.send(("step", action))
+        if self.transport == "shared_memory":
+            actions = np.asarray(actions)
+            if actions.shape != self._actions.shape:
+                raise ValueError(
+                    f"Expected a batch of actions with shape {self._actions.shape}, actual got {actions.shape}"
+                )
+            self._actions[:] = actions
+            self._start_observation_buffer(slice(None))
+            self._request_shared_step(np.arange(self.num_envs))
+        else:
+            messages = [
+                ("step", action)
+                for _, action in zip(
+                    range(self.num_envs),
+                    iterate(self.action_space, actions),
+                    strict=True,
+                )
+            ]
+            self._start_observation_buffer(slice(None))
+            self._send_to_envs(messages)
         self._state = AsyncState.WAITING_STEP
 
     def step_wait(
@@ -437,27 +728,27 @@ class AsyncVectorEnv(VectorEnv):
                 AsyncState.WAITING_STEP.value,
             )
 
+        if self.transport == "shared_memory":
+            return self._step_wait_shared(timeout)
+
         if not self._poll_pipe_envs(timeout):
             self._state = AsyncState.DEFAULT
             raise multiprocessing.TimeoutError(
                 f"The call to `step_wait` has timed out after {timeout} second(s)."
             )
 
-        observations, rewards, terminations, truncations, infos = [], [], [], [], {}
-        successes = []
-        for env_idx, pipe in enumerate(self.parent_pipes):
-            env_step_return, success = pipe.recv()
-
-            successes.append(success)
-            if success:
-                observations.append(env_step_return[0])
-                rewards.append(env_step_return[1])
-                terminations.append(env_step_return[2])
-                truncations.append(env_step_return[3])
-                infos = self._add_info(infos, env_step_return[4], env_idx)
-
+        env_step_returns, successes = self._recv_from_envs()
         self._raise_if_errors(successes)
 
+        observations, rewards, terminations, truncations = [], [], [], []
+        for env_idx, env_step_return in enumerate(env_step_returns):
+            observations.append(env_step_return[0])
+            rewards.append(env_step_return[1])
+            terminations.append(env_step_return[2])
+            truncations.append(env_step_return[3])
+            self._infos.add(env_step_return[4], env_idx)
+        infos = self._infos.pop()
+
         if not self.shared_memory:
             self.observations = concatenate(
                 self.single_observation_space,
@@ -467,13 +758,278 @@ class AsyncVectorEnv(VectorEnv):
 
         self._state = AsyncState.DEFAULT
         return (
-            deepcopy(self.observations) if self.copy else self.observations,
+            self._batch_observations(),
             np.array(rewards, dtype=np.float64),
             np.array(terminations, dtype=np.bool_),
             np.array(truncations, dtype=np.bool_),
             infos,
         )
 
+    def _step_wait_shared(
+        self, timeout: int | float | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """:meth:`step_wait` for ``transport="shared_memory"``, the results are read from the shared arrays."""
+        if not self._wait_step_done(timeout):
+            self._state = AsyncState.DEFAULT
+            raise multiprocessing.TimeoutError(
+                f"The call to `step_wait` has timed out after {timeout} second(s)."
+            )
+
+        self._step_ready[:] = 0
+        for env_idx in np.flatnonzero(self._step_status == 1):
+            self._infos.add(self._recv_info(env_idx), env_idx)
+        infos = self._infos.pop()
+        self._raise_if_errors(
+            [bool(np.all(self._step_status[r] >= 0)) for r in self.worker_envs]
+        )
+
+        self._state = AsyncState.DEFAULT
+        return (
+            self._batch_observations(),
+            self._rewards.copy(),
+            self._terminations.astype(np.bool_),
+            self._truncations.astype(np.bool_),
+            infos,
+        )
+
+    def _wait_step_done(self, timeout: int | float | None = None) -> bool:
+        """Waits for every worker to signal its step, returns ``False`` if ``timeout`` seconds passed first."""
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        return all(self._acquire_step_done(end_time) for _ in range(self.num_envs))
+
+    def _acquire_step_done(self, end_time: float | None = None) -> bool:
+        """Waits for the step signal of one sub-environment, returns ``False`` if ``end_time`` passed first."""
+        # Wake up every second to notice workers that were killed without signalling
+        while not self._step_done.acquire(
+            timeout=(
+                1.0
+                if end_time is None
+                else min(max(end_time - time.perf_counter(), 0), 1.0)
+            )
+        ):
+            if end_time is not None and time.perf_counter() >= end_time:
+                return False
+            for idx, process in enumerate(self.processes):
+                if process.exitcode not in (None, 0):
+                    raise EOFError(
+                        f"Worker-{idx} exited with code {process.exitcode} before finishing its step."
+                    )
+        return True
+
+    def send(self, actions: ActType, env_ids: Sequence[int] | np.ndarray | None = None):
+        """Sends actions to some sub-environments without waiting for their steps, see :meth:`recv`.
+
+        Unlike :meth:`step_async`, other sub-environments may still be stepping: each sub-environment returned
+        by :meth:`recv` can be sent its next action straight away.
+
+        Args:
+            actions: Batch of actions, one per entry of ``env_ids``.
+            env_ids: Indices of the sub-environments to step. If ``None``, all the sub-environments.
+
+        Raises:
+            ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
+            AlreadyPendingCallError: If the environment is waiting for a pending call to :meth:`reset_async`,
+                :meth:`step_async` or :meth:`call_async`.
+            ValueError: If a sub-environment in ``env_ids`` was already sent a step that :meth:`recv` did not return yet.
+        """
+        self._assert_is_running()
+        if self._state not in (AsyncState.DEFAULT, AsyncState.WAITING_RECV):
+            raise AlreadyPendingCallError(
+                f"Calling `send` while waiting for a pending call to `{self._state.value}` to complete.",
+                str(self._state.value),
+            )
+
+        env_ids = (
+            np.arange(self.num_envs)
+            if env_ids is None
+            else np.asarray(env_ids, dtype=np.int64).reshape(-1)
+        )
+        if len(np.unique(env_ids)) != len(env_ids) or np.any(self._pending[env_ids]):
+            raise ValueError(
+                f"Sub-environments can only be sent one step at a time, `recv` their results first, env_ids={env_ids}"
+            )
+
+        if self.transport == "shared_memory":
+            actions = np.asarray(actions)
+            if actions.shape != (len(env_ids),) + self._actions.shape[1:]:
+                raise ValueError(
+                    f"Expected a batch of actions with shape {(len(env_ids),) + self._actions.shape[1:]}, actual got {actions.shape}"
+                )
+            self._actions[env_ids] = actions
+            self._send_observation_buffer(env_ids)
+            self._request_shared_step(env_ids)
+        else:
+            iter_actions = iterate(
+                batch_space(self.single_action_space, len(env_ids)), actions
+            )
+            messages = [None] * self.num_envs
+            for env_idx, action in zip(env_ids, iter_actions, strict=True):
+                messages[env_idx] = ("step", action)
+            self._send_observation_buffer(env_ids)
+            for index, env_indices in enumerate(self.worker_envs):
+                group = [messages[i] for i in env_indices]
+                if any(message is not None for message in group):
+                    self._send_command(
+                        index, group[0] if self.envs_per_worker == 1 else group
+                    )
+                    self._pending_replies[index] += 1
+
+        self._pending[env_ids] = True
+        self._state = AsyncState.WAITING_RECV
+
+    def _send_observation_buffer(self, env_ids: np.ndarray):
+        """Steps sent with :meth:`send` write into the next batch, the observations last returned stay unchanged."""
+        if self.observation_buffers > 1:
+            self._buffer_indices[env_ids] = self._next_observation_buffer()
+
+    def recv(
+        self, batch_size: int | None = None, timeout: int | float | None = None
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any], np.ndarray]:
+        """Returns the first ``batch_size`` sub-environments to finish the steps sent with :meth:`send`.
+
+        Args:
+            batch_size: Number of sub-environments to return. If ``None``, all the sub-environments with a pending step.
+            timeout: Number of seconds before the call to :meth:`recv` times out. If ``None``, it never times out.
+                After a time out, the steps are still pending and :meth:`recv` can be called again.
+
+        Returns:
+            The batched step information of the returned sub-environments in the order they finished,
+            (obs, reward, terminated, truncated, info, env_ids)
+
+        Raises:
+            ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
+            NoAsyncCallError: If :meth:`recv` was called without any pending step sent with :meth:`send`.
+            ValueError: If ``batch_size`` is larger than the number of sub-environments with a pending step.
+            TimeoutError: If :meth:`recv` timed out.
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.WAITING_RECV:
+            raise NoAsyncCallError(
+                "Calling `recv` without any prior call to `send`.",
+                AsyncState.WAITING_RECV.value,
+            )
+
+        num_pending = int(np.sum(self._pending))
+        batch_size = num_pending if batch_size is None else batch_size
+        if not 0 < batch_size <= num_pending:
+            raise ValueError(
+                f"Expected `batch_size` between 1 and the {num_pending} sub-environments with a pending step, actual got {batch_size}"
+            )
+
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        while len(self._received) < batch_size:
+            if not self._receive_steps(end_time):
+                raise multiprocessing.TimeoutError(
+                    f"The call to `recv` has timed out after {timeout} second(s)."
+                )
+
+        env_ids, env_step_returns = zip(
+            *[self._received.popleft() for _ in range(batch_size)]
+        )
+        env_ids = np.array(env_ids, dtype=np.int64)
+        observations, rewards, terminations, truncations, info_data = zip(
+            *env_step_returns
+        )
+
+        if self.shared_memory:
+            observations = self._select_observations(env_ids)
+        else:
+            observations = concatenate(
+                self.single_observation_space,
+                observations,
+                create_empty_array(self.single_observation_space, n=batch_size),
+            )
+        # The infos are batched in the order of `env_ids`
+        batched_infos = InfoBatcher(batch_size)
+        for i, info in enumerate(info_data):
+            batched_infos.add(info, i)
+        infos = batched_infos.pop()
+
+        self._pending[env_ids] = False
+        if not np.any(self._pending):
+            self._state = AsyncState.DEFAULT
+        return (
+            observations,
+            np.array(rewards, dtype=np.float64),
+            np.array(terminations, dtype=np.bool_),
+            np.array(truncations, dtype=np.bool_),
+            infos,
+            env_ids,
+        )
+
+    def _receive_steps(self, end_time: float | None = None) -> bool:
+        """Receives the steps finished so far (at least one), returns ``False`` if ``end_time`` passed first."""
+        if self.transport == "shared_memory":
+            if not self._acquire_step_done(end_time):
+                return False
+
+            # Ordering: a worker writes the results of a step, then flags (`step_ready`) and signals (`step_done`)
+            # it while holding `step_lock`. Under the same lock, every signal still counted by the semaphore belongs
+            # to a flagged step, so once they are all taken the flagged steps are exactly the signalled ones.
+            # The results of each were written before the worker released the lock that the parent acquired
+            # since, so they are visible here even on weakly ordered CPUs (e.g. aarch64), not only on x86.
+            with self._step_lock:
+                while self._step_done.acquire(block=False):
+                    pass
+                env_ids = np.flatnonzero((self._step_ready == 1) & self._pending)
+                self._step_ready[env_ids] = 0
+            for env_idx in env_ids:
+                if self._step_status[env_idx] < 0:
+                    self._raise_if_errors([False])
+                info = self._recv_info(env_idx) if self._step_status[env_idx] else {}
+                self._received.append(
+                    (
+                        env_idx,
+                        (
+                            None,
+                            self._rewards[env_idx],
+                            self._terminations[env_idx],
+                            self._truncations[env_idx],
+                            info,
+                        ),
+                    )
+                )
+            return True
+
+        pipes = [
+            pipe
+            for pipe, num_replies in zip(self.parent_pipes, self._pending_replies)
+            if num_replies > 0
+        ]
+        ready_pipes = wait(
+            pipes, None if end_time is None else max(end_time - time.perf_counter(), 0)
+        )
+        if len(ready_pipes) == 0:
+            return False
+        for pipe in ready_pipes:
+            index = self.parent_pipes.index(pipe)
+            result, success = pipe.recv()
+            self._pending_replies[index] -= 1
+            self._raise_if_errors([success])
+            for env_idx, env_step_return in zip(
+                self.worker_envs[index],
+                [result] if self.envs_per_worker == 1 else result,
+            ):
+                if env_step_return is not None:
+                    self._received.append((env_idx, env_step_return))
+        return True
+
+    def _select_observations(self, env_ids: np.ndarray) -> ObsType:
+        """Copies the observations of ``env_ids`` out of the shared observation buffer."""
+        observations = (
+            self._observation_batches[self._next_observation_buffer()]
+            if self.observation_buffers > 1
+            else self.observations
+        )
+        if isinstance(observations, np.ndarray):
+            return observations[env_ids]
+        env_observations = tuple(iterate(self.observation_space, observations))
+        return concatenate(
+            self.single_observation_space,
+            [env_observations[i] for i in env_ids],
+            create_empty_array(self.single_observation_space, n=len(env_ids)),
+        )
+
     def call(self, name: str, *args: Any, **kwargs: Any) -> tuple[Any, ...]:
         """Call a method from each parallel environment with args and kwargs.
 
@@ -511,8 +1067,7 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        for pipe in self.parent_pipes:
-            pipe.send(("_call", (name, args, kwargs)))
+        self._send_to_envs([("_call", (name, args, kwargs))] * self.num_envs)
         self._state = AsyncState.WAITING_CALL
 
     def call_wait(self, timeout: int | float | None = None) -> tuple[Any, ...]:
@@ -542,11 +1097,11 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `call_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = self._recv_from_envs()
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
-        return results
+        return tuple(results)
 
     def get_attr(self, name: str) -> tuple[Any, ...]:
         """Get a property from each parallel environment.
@@ -587,9 +1142,8 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        for pipe, value in zip(self.parent_pipes, values):
-            pipe.send(("_setattr", (name, value)))
-        _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._send_to_envs([("_setattr", (name, value)) for value in values])
+        _, successes = self._recv_from_envs()
         self._raise_if_errors(successes)
 
     def close_extras(self, timeout: int | float | None = None, terminate: bool = False):
@@ -610,8 +1164,11 @@ class AsyncVectorEnv(VectorEnv):
                 logger.warn(
                     f"Calling `close` while waiting for a pending call to `{self._state.value}` to complete."
                 )
-                function = getattr(self, f"{self._state.value}_wait")
-                function(timeout)
+                if self._state == AsyncState.WAITING_RECV:
+                    self.recv(timeout=timeout)
+                else:
+                    function = getattr(self, f"{self._state.value}_wait")
+                    function(timeout)
         except multiprocessing.TimeoutError:
             terminate = True
 
@@ -620,9 +1177,18 @@ class AsyncVectorEnv(VectorEnv):
                 if process.is_alive():
                     process.terminate()
         else:
-            for pipe in self.parent_pipes:
+            for index, (pipe, env_indices) in enumerate(
+                zip(self.parent_pipes, self.worker_envs)
+            ):
                 if (pipe is not None) and (not pipe.closed):
-                    pipe.send(("close", None))
+                    self._send_command(
+                        index,
+                        (
+                            ("close", None)
+                            if self.envs_per_worker == 1
+                            else [("close", None)] * len(env_indices)
+                        ),
+                    )
             for pipe in self.parent_pipes:
                 if (pipe is not None) and (not pipe.closed):
                     pipe.recv()
@@ -652,8 +1218,8 @@ class AsyncVectorEnv(VectorEnv):
     def _check_spaces(self):
         self._assert_is_running()
 
-        for pipe in self.parent_pipes:
-            pipe.send(
+        self._send_to_envs(
+            [
                 (
                     "_check_spaces",
                     (
@@ -662,9 +1228,11 @@ class AsyncVectorEnv(VectorEnv):
                         self.single_action_space,
                     ),
                 )
-            )
+            ]
+            * self.num_envs
+        )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = self._recv_from_envs()
         self._raise_if_errors(successes)
         same_observation_spaces, same_action_spaces = zip(*results)
 
@@ -694,10 +1262,13 @@ class AsyncVectorEnv(VectorEnv):
         if all(successes):
             return
 
-        num_errors = self.num_envs - sum(successes)
+        # Infos added before the error are not returned
+        self._infos.clear()
+        num_errors = len(successes) - sum(successes)
         assert num_errors > 0
         for i in range(num_errors):
-            index, exctype, value, trace = self.error_queue.get()
+            env_idx, exctype, value, trace = self.error_queue.get()
+            index = env_idx // self.envs_per_worker
 
             logger.error(
                 f"Received the following error from Worker-{index} - Shutting it down"
@@ -718,113 +1289,223 @@ class AsyncVectorEnv(VectorEnv):
             self.close(terminate=True)
 
 
+def _step_env(
+    env: Env, action: Any, autoreset: bool, autoreset_mode: AutoresetMode
+) -> tuple[Any, Any, bool, bool, dict[str, Any], bool]:
+    """Steps a sub-environment following the autoreset mode, returns the step results and the new ``autoreset``."""
+    if autoreset_mode == AutoresetMode.NEXT_STEP:
+        if autoreset:
+            observation, info = env.reset()
+            reward, terminated, truncated = 0, False, False
+        else:
+            (
+                observation,
+                reward,
+                terminated,
+                truncated,
+                info,
+            ) = env.step(action)
+        autoreset = terminated or truncated
+    elif autoreset_mode == AutoresetMode.SAME_STEP:
+        (
+            observation,
+            reward,
+            terminated,
+            truncated,
+            info,
+        ) = env.step(action)
+
+        if terminated or truncated:
+            reset_observation, reset_info = env.reset()
+
+            info = {
+                "final_info": info,
+                "final_obs": observation,
+                **reset_info,
+            }
+            observation = reset_observation
+    elif autoreset_mode == AutoresetMode.DISABLED:
+        assert autoreset is False
+        (
+            observation,
+            reward,
+            terminated,
+            truncated,
+            info,
+        ) = env.step(action)
+    else:
+        raise ValueError(f"Unexpected autoreset_mode: {autoreset_mode}")
+
+    return observation, reward, terminated, truncated, info, autoreset
+
+
 def _async_worker(
-    index: int,
-    env_fn: Callable,
+    index: int | range,
+    env_fn: Callable | list[Callable],
     pipe: Connection,
     parent_pipe: Connection,
     shared_memory: SynchronizedArray | dict[str, Any] | tuple[Any, ...],
     error_queue: Queue,
     autoreset_mode: AutoresetMode,
+    step_buffers: dict[str, Any] | None = None,
+    buffer_indices: SynchronizedArray | None = None,
 ):
-    env = env_fn()
-    observation_space = env.observation_space
-    action_space = env.action_space
-    autoreset = False
-    observation = None
+    # With `envs_per_worker > 1`, the worker hosts a group of sub-environments: `index` is the range of their
+    # indices, `env_fn` the list of their functions and each message holds one (command, data) per sub-environment
+    grouped = isinstance(index, range)
+    env_indices = index if grouped else range(index, index + 1)
+    envs = [fn() for fn in env_fn] if grouped else [env_fn()]
+    autoresets = [False] * len(envs)
+    observations = [None] * len(envs)
+    env_idx = env_indices.start
+    position = 0
+    command = None
 
     parent_pipe.close()
 
+    # With `observation_buffers > 1`, the shared observation memory holds several batches and `buffer_indices`
+    # tells which one each sub-environment writes into
+    if buffer_indices is not None:
+        buffer_indices = np.frombuffer(buffer_indices, dtype=np.int32)
+
+    def observation_row(idx: int) -> int:
+        if buffer_indices is None:
+            return idx
+        return int(buffer_indices[idx]) * len(buffer_indices) + idx
+
+    if step_buffers is not None:
+        actions = read_from_shared_memory(
+            envs[0].action_space, step_buffers["actions"], n=step_buffers["num_envs"]
+        )
+        rewards = np.frombuffer(step_buffers["rewards"], dtype=np.float64)
+        terminations = np.frombuffer(step_buffers["terminations"], dtype=np.int8)
+        truncations = np.frombuffer(step_buffers["truncations"], dtype=np.int8)
+        step_status = np.frombuffer(step_buffers["step_status"], dtype=np.int8)
+        step_ready = np.frombuffer(step_buffers["step_ready"], dtype=np.int8)
+        requested = np.frombuffer(step_buffers["requested"], dtype=np.int64)
+        request = 0
+        commands = np.frombuffer(step_buffers["commands"], dtype=np.int8)
+        worker_index, command_ready, step_done = (
+            step_buffers["worker_index"],
+            step_buffers["command_ready"],
+            step_buffers["step_done"],
+        )
+        step_lock = step_buffers["step_lock"]
+
     try:
         while True:
-            command, data = pipe.recv()
-
-            if command == "reset":
-                observation, info = env.reset(**data)
-                if shared_memory:
-                    write_to_shared_memory(
-                        observation_space, index, observation, shared_memory
-                    )
-                    observation = None
-                    autoreset = False
-                pipe.send(((observation, info), True))
-            elif command == "reset-noop":
-                pipe.send(((observation, {}), True))
-            elif command == "step":
-                if autoreset_mode == AutoresetMode.NEXT_STEP:
-                    if autoreset:
-                        observation, info = env.reset()
-                        reward, terminated, truncated = 0, False, False
-                    else:
+            if step_buffers is not None:
+                command_ready.acquire()
+                if commands[worker_index] == _STEP_COMMAND:
+                    command = "shared-step"
+                    request += 1
+                    for position, (env_idx, env) in enumerate(zip(env_indices, envs)):
+                        if requested[env_idx] != request:
+                            continue
                         (
                             observation,
                             reward,
                             terminated,
                             truncated,
                             info,
-                        ) = env.step(data)
-                    autoreset = terminated or truncated
-                elif autoreset_mode == AutoresetMode.SAME_STEP:
-                    (
-                        observation,
-                        reward,
-                        terminated,
-                        truncated,
-                        info,
-                    ) = env.step(data)
-
-                    if terminated or truncated:
-                        reset_observation, reset_info = env.reset()
-
-                        info = {
-                            "final_info": info,
-                            "final_obs": observation,
-                            **reset_info,
-                        }
-                        observation = reset_observation
-                elif autoreset_mode == AutoresetMode.DISABLED:
-                    assert autoreset is False
+                            autoresets[position],
+                        ) = _step_env(
+                            env,
+                            actions[env_idx].copy(),
+                            autoresets[position],
+                            autoreset_mode,
+                        )
+
+                        write_to_shared_memory(
+                            env.observation_space,
+                            observation_row(env_idx),
+                            observation,
+                            shared_memory,
+                        )
+                        rewards[env_idx] = reward
+                        terminations[env_idx] = terminated
+                        truncations[env_idx] = truncated
+                        step_status[env_idx] = 1 if info else 0
+                        with step_lock:
+                            step_ready[env_idx] = 1
+                            step_done.release()
+                        # Sent after signalling, a large info cannot block on a full pipe the parent does not read yet
+                        if info:
+                            pipe.send((env_idx, info))
+                    continue
+
+            message = pipe.recv()
+            results = []
+            for position, (env_idx, env, env_message) in enumerate(
+                zip(env_indices, envs, message if grouped else [message])
+            ):
+                # Sub-environments of the group left out of a `send`
+                if env_message is None:
+                    results.append(None)
+                    continue
+
+                command, data = env_message
+                observation_space = env.observation_space
+                action_space = env.action_space
+
+                if command == "reset":
+                    observation, info = env.reset(**data)
+                    if shared_memory:
+                        write_to_shared_memory(
+                            observation_space,
+                            observation_row(env_idx),
+                            observation,
+                            shared_memory,
+                        )
+                        observation = None
+                        autoresets[position] = False
+                    observations[position] = observation
+                    results.append((observation, info))
+                elif command == "reset-noop":
+                    results.append((observations[position], {}))
+                elif command == "step":
                     (
                         observation,
                         reward,
                         terminated,
                         truncated,
                         info,
-                    ) = env.step(data)
-                else:
-                    raise ValueError(f"Unexpected autoreset_mode: {autoreset_mode}")
-
-                if shared_memory:
-                    write_to_shared_memory(
-                        observation_space, index, observation, shared_memory
-                    )
-                    observation = None
-
-                pipe.send(((observation, reward, terminated, truncated, info), True))
-            elif command == "close":
-                pipe.send((None, True))
-                break
-            elif command == "_call":
-                name, args, kwargs = data
-                if name in ["reset", "step", "close", "_setattr", "_check_spaces"]:
-                    raise ValueError(
-                        f"Trying to call function `{name}` with `call`, use `{name}` directly instead."
-                    )
+                        autoresets[position],
+                    ) = _step_env(env, data, autoresets[position], autoreset_mode)
 
-                attr = env.get_wrapper_attr(name)
-                if callable(attr):
-                    pipe.send((attr(*args, **kwargs), True))
-                else:
-                    pipe.send((attr, True))
-            elif command == "_setattr":
-                name, value = data
-                env.set_wrapper_attr(name, value)
-                pipe.send((None, True))
-            elif command == "_check_spaces":
-                obs_mode, single_obs_space, single_action_space = data
-
-                pipe.send(
-                    (
+                    if shared_memory:
+                        write_to_shared_memory(
+                            observation_space,
+                            observation_row(env_idx),
+                            observation,
+                            shared_memory,
+                        )
+                        observation = None
+
+                    observations[position] = observation
+                    results.append((observation, reward, terminated, truncated, info))
+                elif command == "close":
+                    results.append(None)
+                elif command == "_call":
+                    name, args, kwargs = data
+                    if name in ["reset", "step", "close", "_setattr", "_check_spaces"]:
+                        raise ValueError(
+                            f"Trying to call function `{name}` with `call`, use `{name}` directly instead."
+                        )
+
+                    attr = env.get_wrapper_attr(name)
+                    if callable(attr):
+                        results.append(attr(*args, **kwargs))
+                    else:
+                        results.append(attr)
+                elif command == "_setattr":
+                    name, value = data
+                    env.set_wrapper_attr(name, value)
+                    results.append(None)
+                elif command == "_check_spaces":
+                    obs_mode, single_obs_space, single_action_space = data
+
+                    results.append(
                         (
                             (
                                 single_obs_space == observation_space
@@ -834,19 +1515,51 @@ def _async_worker(
                                 )
                             ),
                             single_action_space == action_space,
-                        ),
-                        True,
+                        )
                     )
-                )
-            else:
-                raise RuntimeError(
-                    f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_check_spaces`]."
-                )
+                else:
+                    raise RuntimeError(
+                        f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_check_spaces`]."
+                    )
+
+            pipe.send(((results if grouped else results[0]), True))
+            if command == "close":
+                break
     except (KeyboardInterrupt, Exception):
         error_type, error_message, _ = sys.exc_info()
         trace = traceback.format_exc()
 
-        error_queue.put((index, error_type, error_message, trace))
-        pipe.send((None, False))
+        error_queue.put((env_idx, error_type, error_message, trace))
+        if command == "shared-step":
+            # The parent waits for a signal from every requested sub-environment of the group
+            for remaining_idx in env_indices[position:]:
+                if remaining_idx == env_idx or requested[remaining_idx] == request:
+                    step_status[remaining_idx] = -1
+                    with step_lock:
+                        step_ready[remaining_idx] = 1
+                        step_done.release()
+        else:
+            pipe.send((None, False))
     finally:
-        env.close()
+        for env in envs:
+            env.close()
+
+
+def _map_arrays(fn: Callable[..., Any], *observations: Any) -> Any:
+    """Applies ``fn`` to the matching numpy arrays of batched observations, keeping their tuple and dict structure."""
+    if isinstance(observations[0], tuple):
+        return tuple(_map_arrays(fn, *items) for items in zip(*observations))
+    elif isinstance(observations[0], dict):
+        return {
+            key: _map_arrays(fn, *(obs[key] for obs in observations))
+            for key in observations[0]
+        }
+    else:
+        return fn(*observations)
+
+
+def _read_only_view(array: np.ndarray) -> np.ndarray:
+    """A view of ``array`` that cannot be written to, the writes of the workers still show through."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
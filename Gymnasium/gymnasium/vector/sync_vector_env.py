@@ -12,6 +12,7 @@ from gymnasium import Env, Space
 from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
 from gymnasium.vector.utils import (
+    InfoBatcher,
     batch_differing_spaces,
     batch_space,
     concatenate,
@@ -151,6 +152,7 @@ class SyncVectorEnv(VectorEnv):
         self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
 
         self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._infos = InfoBatcher(self.num_envs)
 
     @property
     def np_random_seed(self) -> tuple[int, ...]:
@@ -188,6 +190,8 @@ class SyncVectorEnv(VectorEnv):
             len(seed) == self.num_envs
         ), f"If seeds are passed as a list the length must match num_envs={self.num_envs} but got length={len(seed)}."
 
+        # Infos left over by a call that raised an error
+        self._infos.clear()
         if options is not None and "reset_mask" in options:
             reset_mask = options.pop("reset_mask")
             assert isinstance(
@@ -207,7 +211,6 @@ class SyncVectorEnv(VectorEnv):
             self._truncations[reset_mask] = False
             self._autoreset_envs[reset_mask] = False
 
-            infos = {}
             for i, (env, single_seed, env_mask) in enumerate(
                 zip(self.envs, seed, reset_mask)
             ):
@@ -216,24 +219,24 @@ class SyncVectorEnv(VectorEnv):
                         seed=single_seed, options=options
                     )
 
-                    infos = self._add_info(infos, env_info, i)
+                    self._infos.add(env_info, i)
         else:
             self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
 
-            infos = {}
             for i, (env, single_seed) in enumerate(zip(self.envs, seed)):
                 self._env_obs[i], env_info = env.reset(
                     seed=single_seed, options=options
                 )
 
-                infos = self._add_info(infos, env_info, i)
+                self._infos.add(env_info, i)
 
         # Concatenate the observations
         self._observations = concatenate(
             self.single_observation_space, self._env_obs, self._observations
         )
+        infos = self._infos.pop()
         return deepcopy(self._observations) if self.copy else self._observations, infos
 
     def step(
@@ -246,7 +249,7 @@ class SyncVectorEnv(VectorEnv):
         """
         actions = iterate(self.action_space, actions)
 
-        infos = {}
+        self._infos.clear()
         for i, (action, _) in enumerate(zip(actions, self.envs, strict=True)):
             if self.autoreset_mode == AutoresetMode.NEXT_STEP:
                 if self._autoreset_envs[i]:
@@ -283,23 +286,22 @@ class SyncVectorEnv(VectorEnv):
                 ) = self.envs[i].step(action)
 
                 if self._terminations[i] or self._truncations[i]:
-                    infos = self._add_info(
-                        infos,
-                        {"final_obs": self._env_obs[i], "final_info": env_info},
-                        i,
+                    self._infos.add(
+                        {"final_obs": self._env_obs[i], "final_info": env_info}, i
                     )
 
                     self._env_obs[i], env_info = self.envs[i].reset()
             else:
                 raise ValueError(f"Unexpected autoreset mode, {self.autoreset_mode}")
 
-            infos = self._add_info(infos, env_info, i)
+            self._infos.add(env_info, i)
 
         # Concatenate the observations
         self._observations = concatenate(
             self.single_observation_space, self._env_obs, self._observations
         )
         self._autoreset_envs = np.logical_or(self._terminations, self._truncations)
+        infos = self._infos.pop()
 
         return (
             deepcopy(self._observations) if self.copy else self._observations,
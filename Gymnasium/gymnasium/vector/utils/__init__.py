@@ -1,5 +1,6 @@
 """Module for gymnasium experimental vector utility functions."""
 
+from gymnasium.vector.utils.batched_infos import InfoBatcher
 from gymnasium.vector.utils.misc import CloudpickleWrapper, clear_mpi_env_vars
 from gymnasium.vector.utils.shared_memory import (
     create_shared_memory,
@@ -11,6 +12,7 @@ from gymnasium.vector.utils.space_utils import (
     batch_space,
     concatenate,
     create_empty_array,
+    is_array_space,
     iterate,
 )
 
@@ -21,9 +23,11 @@ __all__ = [
     "iterate",
     "concatenate",
     "create_empty_array",
+    "is_array_space",
     "create_shared_memory",
     "read_from_shared_memory",
     "write_to_shared_memory",
+    "InfoBatcher",
     "CloudpickleWrapper",
     "clear_mpi_env_vars",
 ]
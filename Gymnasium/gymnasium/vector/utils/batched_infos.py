@@ -0,0 +1,147 @@
+"""Batching the infos of the sub-environments into preallocated columns."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+__all__ = ["InfoBatcher"]
+
+
+class InfoBatcher:
+    """Batches the infos of the sub-environments, as :meth:`VectorEnv._add_info`, into persistent columns.
+
+    Every info key is backed by a preallocated array and a boolean mask ``_key`` of the sub-environments that
+    returned it, both learned the first time the key is seen and reused on the following steps. Adding the info
+    of a sub-environment is then one assignment per key, the type of a key is only checked on its first value of
+    each step, and empty infos are skipped altogether. A column is rebuilt when that first value does not match it
+    (another type, shape or dtype), so the batched infos are the same as with :meth:`VectorEnv._add_info`.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.vector.utils import InfoBatcher
+        >>> batcher = InfoBatcher(num_envs=3)
+        >>> batcher.add({"lives": 3}, 0)
+        >>> batcher.add({}, 1)
+        >>> batcher.add({"lives": 1, "stats": {"hits": np.float32(0.5)}}, 2)
+        >>> batcher.pop()
+        {'lives': array([3, 0, 1]), '_lives': array([ True, False,  True]), 'stats': {'hits': array([0. , 0. , 0.5], dtype=float32), '_hits': array([False, False,  True])}, '_stats': array([False, False,  True])}
+        >>> batcher.pop()
+        {}
+    """
+
+    def __init__(self, num_envs: int):
+        """Creates the batcher, the columns are allocated when their key is first added.
+
+        Args:
+            num_envs: The number of sub-environments, the length of every column.
+        """
+        self.num_envs = num_envs
+        self._columns: dict[str, _InfoColumn] = {}
+        # The columns added to since the last `pop`, in the order their keys were first added
+        self._added: list[_InfoColumn] = []
+
+    def add(self, env_info: dict[str, Any], env_num: int):
+        """Adds the info of the sub-environment ``env_num`` to the batch.
+
+        Args:
+            env_info: The info returned by the sub-environment.
+            env_num: The index of the sub-environment.
+        """
+        if not env_info:
+            return
+
+        for key, value in env_info.items():
+            column = self._columns.get(key)
+            if column is None or not column.added:
+                kind = _info_kind(key, value)
+                if column is None or column.kind != kind:
+                    column = self._columns[key] = _InfoColumn(key, kind, self.num_envs)
+                column.added = True
+                self._added.append(column)
+
+            if column.nested is None:
+                column.values[env_num] = value
+            else:
+                column.nested.add(value, env_num)
+            column.mask[env_num] = True
+
+    def pop(self) -> dict[str, Any]:
+        """Returns the batched infos added since the last call and resets the columns for the next step.
+
+        Returns:
+            The batched infos, every key paired with its mask ``_key``
+        """
+        if not self._added:
+            return {}
+
+        infos = {}
+        for column in self._added:
+            if column.nested is None:
+                infos[column.key] = column.values.copy()
+            else:
+                infos[column.key] = column.nested.pop()
+            infos[column.mask_key] = column.mask.copy()
+        self.clear()
+        return infos
+
+    def clear(self):
+        """Discards the infos added since the last :meth:`pop`, e.g. of a step that raised an error."""
+        for column in self._added:
+            if column.nested is None:
+                column.values[column.mask] = column.fill_value
+            else:
+                column.nested.clear()
+            column.mask[:] = False
+            column.added = False
+        self._added = []
+
+
+class _InfoColumn:
+    """The preallocated values and mask of one info key."""
+
+    __slots__ = (
+        "key",
+        "mask_key",
+        "kind",
+        "values",
+        "nested",
+        "fill_value",
+        "mask",
+        "added",
+    )
+
+    def __init__(self, key: str, kind: tuple[Any, ...], num_envs: int):
+        self.key = key
+        self.mask_key = f"_{key}"
+        self.kind = kind
+        self.values, self.nested, self.fill_value = None, None, None
+        if kind[0] == "dict":
+            self.nested = InfoBatcher(num_envs)
+        elif kind[0] == "scalar":
+            self.values = np.zeros(num_envs, dtype=kind[1])
+            self.fill_value = 0
+        elif kind[0] == "array":
+            self.values = np.zeros((num_envs, *kind[1]), dtype=kind[2])
+            self.fill_value = 0
+        else:
+            self.values = np.full(num_envs, fill_value=None, dtype=object)
+        self.mask = np.zeros(num_envs, dtype=np.bool_)
+        self.added = False
+
+
+def _info_kind(key: str, value: Any) -> tuple[Any, ...]:
+    """The column needed by the first value of an info key in a step, see :meth:`VectorEnv._add_info`."""
+    # It is easier for users to access their `final_obs` in the unbatched array of `obs` objects
+    if key == "final_obs":
+        return ("object",)
+    elif isinstance(value, dict):
+        return ("dict",)
+    elif type(value) in (int, float, bool) or issubclass(type(value), np.number):
+        return ("scalar", type(value))
+    elif isinstance(value, np.ndarray):
+        return ("array", value.shape, value.dtype)
+    else:
+        return ("object",)
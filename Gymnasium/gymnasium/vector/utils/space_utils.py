@@ -5,6 +5,7 @@
 - ``concatenate``: Concatenate multiple samples from (unbatched) space into a single object.
 - ``Iterate``: Iterate over the elements of a (batched) space and items.
 - ``create_empty_array``: Create an empty (possibly nested) (normally numpy-based) array, used in conjunction with ``concatenate(..., out=array)``
+- ``is_array_space``: If the batched array of a space is made of numpy arrays with one row per sub-environment.
 """
 
 from __future__ import annotations
@@ -41,6 +42,7 @@ __all__ = [
     "iterate",
     "concatenate",
     "create_empty_array",
+    "is_array_space",
 ]
 
 
@@ -539,3 +541,31 @@ def _create_empty_array_oneof(space: OneOf, n: int = 1, fn=np.zeros):
 @create_empty_array.register(Space)
 def _create_empty_array_custom(space, n=1, fn=np.zeros):
     return None
+
+
+def is_array_space(space: Space) -> bool:
+    """If the batched array of ``space`` (see :func:`create_empty_array`) is made of numpy arrays with one row per sub-environment.
+
+    This is the case for :class:`Box`, :class:`Discrete`, :class:`MultiDiscrete` and :class:`MultiBinary` spaces,
+    and :class:`Tuple` and :class:`Dict` spaces made only of them. Rows of such batched arrays (and of the matching
+    shared memory, see :func:`read_from_shared_memory`) can be written to in-place for a single sub-environment.
+
+    Example:
+        >>> from gymnasium.spaces import Box, Dict, Text
+        >>> is_array_space(Dict({"position": Box(0, 1, shape=(2,)), "velocity": Box(0, 1)}))
+        True
+        >>> is_array_space(Text(5))
+        False
+
+    Args:
+        space: The single (unbatched) space
+
+    Returns:
+        If the batched array of ``space`` is made of numpy arrays with one row per sub-environment
+    """
+    if isinstance(space, Tuple):
+        return all(is_array_space(subspace) for subspace in space.spaces)
+    elif isinstance(space, Dict):
+        return all(is_array_space(subspace) for subspace in space.spaces.values())
+    else:
+        return isinstance(space, (Box, Discrete, MultiDiscrete, MultiBinary))
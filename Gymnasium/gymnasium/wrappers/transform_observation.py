@@ -38,7 +38,7 @@ __all__ = [
     "DiscretizeObservation",
 ]
 
-from gymnasium.wrappers.utils import rescale_box
+from gymnasium.wrappers.utils import BinDiscretizer, rescale_box
 
 
 class TransformObservation(
@@ -690,7 +690,7 @@ class DiscretizeObservation(
     TransformObservation[WrapperObsType, ActType, ObsType],
     gym.utils.RecordConstructorArgs,
 ):
-    """Uniformly discretizes a continuous Box observation space into a single Discrete space.
+    """Discretizes a continuous Box observation space into a single Discrete space, with uniform or custom bins.
 
     Example 1 - Discretize MountainCar observation space:
         >>> env = gym.make("MountainCar-v0")
@@ -739,20 +739,34 @@ class DiscretizeObservation(
         >>> obs, _ = env.reset(seed=42)
         >>> obs
         array([1, 2, 1, 1, 1, 1, 0, 0])
+
+    Example 4 - Quantile bins learned from a warmup rollout of MountainCar:
+        >>> from gymnasium.wrappers.utils import BinDiscretizer
+        >>> env = gym.make("MountainCar-v0")
+        >>> _ = env.reset(seed=42)
+        >>> _ = env.action_space.seed(42)
+        >>> samples = [env.step(env.action_space.sample())[0] for _ in range(500)]
+        >>> edges = BinDiscretizer.from_samples(np.array(samples), bins=4).edges
+        >>> env = DiscretizeObservation(env, bin_edges=edges)
+        >>> env.observation_space
+        Discrete(16)
     """
 
     def __init__(
         self,
         env: gym.Env[ObsType, ActType],
-        bins: int | tuple[int, ...],
+        bins: int | tuple[int, ...] | None = None,
         multidiscrete: bool = False,
+        bin_edges: Sequence[np.ndarray] | None = None,
     ):
         """Constructor for the discretize observation wrapper.
 
         Args:
             env: The environment to wrap.
-            bins: int or tuple of ints (number of bins per dimension).
+            bins: int or tuple of ints (number of uniform bins per dimension).
             multidiscrete: If True, use MultiDiscrete space instead of flattening to Discrete.
+            bin_edges: The increasing inner bin edges of every dimension instead of uniform ``bins``, for example
+                the quantile edges of :meth:`BinDiscretizer.from_samples`. Dimension ``i`` has ``len(bin_edges[i]) + 1`` bins.
         """
         if not isinstance(env.observation_space, spaces.Box):
             raise TypeError(
@@ -770,21 +784,29 @@ class DiscretizeObservation(
             )
 
         self.multidiscrete = multidiscrete
-        gym.utils.RecordConstructorArgs.__init__(self, bins=bins)
+        gym.utils.RecordConstructorArgs.__init__(
+            self, bins=bins, multidiscrete=multidiscrete, bin_edges=bin_edges
+        )
         gym.ObservationWrapper.__init__(self, env)
 
-        if isinstance(bins, int):
-            self.bins = np.array([bins] * self.n_dims)
+        if bin_edges is not None:
+            assert (
+                len(bin_edges) == self.n_dims
+            ), f"bin_edges must match observation dimensions: expected {self.n_dims}, got {len(bin_edges)}"
+            self.discretizer = BinDiscretizer(bin_edges)
+        elif isinstance(bins, int):
+            self.discretizer = BinDiscretizer.uniform(self.low, self.high, bins)
         else:
+            assert (
+                bins is not None
+            ), "DiscretizeObservation requires either bins or bin_edges"
             assert (
                 len(bins) == self.n_dims
             ), f"bins must match action dimensions: expected {self.n_dims}, got {len(bins)}"
-            self.bins = np.array(bins)
+            self.discretizer = BinDiscretizer.uniform(self.low, self.high, bins)
 
-        self.bin_edges = [
-            np.linspace(self.low[i], self.high[i], self.bins[i] + 1)[1:-1]
-            for i in range(self.n_dims)
-        ]
+        self.bins = self.discretizer.bins
+        self.bin_edges = self.discretizer.edges
 
         if self.multidiscrete:
             self.observation_space = spaces.MultiDiscrete(self.bins)
@@ -793,46 +815,25 @@ class DiscretizeObservation(
 
     def observation(self, observation):
         """Discretizes the observation."""
-        # np.digitize returns len(bins) if the input exceeds the last edge.
-        # If an observation is exactly equal to the high bound, the resulting
-        # index could be out of range for the number of bins.
-        # Solution: clip to ensure 0 <= index < bins[i], and add a small margin
-        # to prevent precision issues.
-        clipped = np.clip(observation, self.low, self.high - 1e-8)
-        indices = [
-            int(np.digitize(clipped[i], self.bin_edges[i])) for i in range(self.n_dims)
-        ]
+        # The edges are the inner bin boundaries only, so observations at (or beyond) the bounds
+        # fall in the first or last bin without clipping.
         if self.multidiscrete:
-            return np.array(indices, dtype=np.int64)
+            return self.discretizer.indices(observation).astype(np.int64)
         else:
-            return int(self._flatten_indices(indices))
+            return int(self.discretizer.flat_indices(observation))
 
     def revert_observation(self, obs):
         """Reverts discretization. It returns the edges of the bin the discretized observation belongs to."""
         if self.multidiscrete:
             indices = np.asarray(obs, dtype=int)
         else:
-            indices = self._unflatten_index(obs)
+            indices = self.discretizer.unflatten(obs)
         lows = []
         highs = []
         for i, idx in enumerate(indices):
-            edges = np.linspace(self.low[i], self.high[i], self.bins[i] + 1)
+            edges = np.concatenate([[self.low[i]], self.bin_edges[i], [self.high[i]]])
             lows.append(edges[idx])
             highs.append(edges[idx + 1])
         return np.array(lows, dtype=self.env.observation_space.dtype), np.array(
             highs, dtype=self.env.observation_space.dtype
         )
-
-    def _flatten_indices(self, indices):
-        flat_index = 0
-        for i in range(self.n_dims):
-            flat_index *= self.bins[i]
-            flat_index += indices[i]
-        return flat_index
-
-    def _unflatten_index(self, flat_index):
-        indices = []
-        for b in reversed(self.bins):
-            indices.insert(0, flat_index % b)
-            flat_index //= b
-        return indices
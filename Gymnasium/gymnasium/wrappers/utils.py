@@ -25,7 +25,13 @@ from gymnasium.spaces import (
 from gymnasium.spaces.space import T_cov
 
 
-__all__ = ["RunningMeanStd", "update_mean_var_count_from_moments", "create_zero_array"]
+__all__ = [
+    "RunningMeanStd",
+    "update_mean_var_count_from_moments",
+    "create_zero_array",
+    "BinDiscretizer",
+    "TileCoder",
+]
 
 
 class RunningMeanStd:
@@ -69,6 +75,157 @@ def update_mean_var_count_from_moments(
     return new_mean, new_var, new_count
 
 
+class BinDiscretizer:
+    """Maps continuous observations to bin indices, with its own (possibly non-uniform) bin edges for every dimension.
+
+    Works on a single observation of shape ``(n_dims,)`` or a whole batch ``(..., n_dims)`` in one vectorized call.
+    An observation ``x`` falls in bin ``i`` of a dimension when ``edges[i - 1] <= x < edges[i]`` (as ``np.digitize``),
+    values below the first or above the last edge fall in the first or last bin.
+
+    Example:
+        >>> discretizer = BinDiscretizer.uniform(low=[0.0, -1.0], high=[1.0, 1.0], bins=(4, 2))
+        >>> discretizer.indices(np.array([[0.3, -0.5], [0.99, 0.5]]))
+        array([[1, 0],
+               [3, 1]])
+        >>> discretizer.flat_indices(np.array([[0.3, -0.5], [0.99, 0.5]]))
+        array([2, 7])
+        >>> samples = np.random.default_rng(0).normal(size=(1000, 1))
+        >>> BinDiscretizer.from_samples(samples, bins=4).edges[0].round(2)
+        array([-0.69, -0.07,  0.62])
+    """
+
+    def __init__(self, edges: list[np.ndarray]):
+        """Constructor for the bin discretizer.
+
+        Args:
+            edges: The increasing inner bin edges of every dimension, ``len(edges[i]) + 1`` bins for dimension ``i``.
+        """
+        self.edges = [np.asarray(e, dtype=np.float64) for e in edges]
+        assert all(
+            np.all(np.diff(e) > 0) for e in self.edges
+        ), "bin edges must be strictly increasing"
+        self.n_dims = len(self.edges)
+        self.bins = np.array([len(e) + 1 for e in self.edges], dtype=np.int64)
+        self.n = int(np.prod(self.bins))
+
+        # Edges of all dimensions in one array, padded with inf which no observation reaches
+        self._padded_edges = np.full(
+            (self.n_dims, max(len(e) for e in self.edges)), np.inf
+        )
+        for i, e in enumerate(self.edges):
+            self._padded_edges[i, : len(e)] = e
+        # Row-major strides of the flattened index, the last dimension changes fastest
+        self._strides = np.append(np.cumprod(self.bins[:0:-1])[::-1], 1)
+
+    @classmethod
+    def uniform(
+        cls, low: np.ndarray, high: np.ndarray, bins: int | tuple[int, ...]
+    ) -> BinDiscretizer:
+        """Equal-width bins between ``low`` and ``high``."""
+        low, high = np.asarray(low), np.asarray(high)
+        bins = np.broadcast_to(bins, low.shape)
+        return cls(
+            [
+                np.linspace(low[i], high[i], bins[i] + 1)[1:-1]
+                for i in range(low.shape[0])
+            ]
+        )
+
+    @classmethod
+    def from_samples(
+        cls, samples: np.ndarray, bins: int | tuple[int, ...]
+    ) -> BinDiscretizer:
+        """Quantile bins, every bin holds about the same number of the ``(n_samples, n_dims)`` samples.
+
+        The samples are normally observations collected by a warmup rollout. Quantiles that coincide (for example
+        when many samples share the same value) are merged, so a dimension can end up with fewer bins.
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        bins = np.broadcast_to(bins, samples.shape[1:])
+        return cls(
+            [
+                np.unique(
+                    np.quantile(samples[:, i], np.linspace(0, 1, bins[i] + 1)[1:-1])
+                )
+                for i in range(samples.shape[1])
+            ]
+        )
+
+    def indices(self, observations: np.ndarray) -> np.ndarray:
+        """The bin index of every dimension, shape ``(..., n_dims)``."""
+        observations = np.asarray(observations)
+        return np.sum(observations[..., None] >= self._padded_edges, axis=-1)
+
+    def flat_indices(self, observations: np.ndarray) -> np.ndarray:
+        """The index of the cell in the flattened grid of all dimensions, shape ``(...)``."""
+        return self.indices(observations) @ self._strides
+
+    def unflatten(self, flat_indices: np.ndarray) -> np.ndarray:
+        """The per-dimension bin indices of flattened indices, shape ``(..., n_dims)``."""
+        return np.stack(
+            np.unravel_index(np.asarray(flat_indices), tuple(self.bins)), axis=-1
+        )
+
+
+class TileCoder:
+    """Tile coding: several uniform grids (tilings), each shifted by a fraction of a tile, cover the observation space.
+
+    An observation activates one tile in every tiling. Neighbouring observations share some of their tiles, so a
+    value function summed over the active tiles generalizes between them, while the combination of all tilings
+    resolves the space ``num_tilings`` times finer than a single grid. The tilings are displaced asymmetrically by
+    ``(1, 3, 5, ...) / num_tilings`` tile widths per dimension (Sutton and Barto, 2018, Section 9.5.4).
+
+    Example:
+        >>> coder = TileCoder(low=[0.0, 0.0], high=[1.0, 1.0], bins=4, num_tilings=2)
+        >>> coder.n
+        50
+        >>> coder.indices(np.array([[0.1, 0.1], [0.9, 0.1]]))
+        array([[ 0, 25],
+               [15, 45]])
+    """
+
+    def __init__(
+        self,
+        low: np.ndarray,
+        high: np.ndarray,
+        bins: int | tuple[int, ...],
+        num_tilings: int = 8,
+    ):
+        """Constructor for the tile coder.
+
+        Args:
+            low: The lower bound of every dimension.
+            high: The upper bound of every dimension.
+            bins: The number of tiles per dimension of one tiling (each tiling has one more to cover its shift).
+            num_tilings: The number of offset tilings.
+        """
+        self.low = np.asarray(low, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        assert np.all(np.isfinite(self.low)) and np.all(np.isfinite(self.high))
+        self.n_dims = self.low.shape[0]
+        self.bins = np.broadcast_to(np.asarray(bins, dtype=np.int64), self.low.shape)
+        self.num_tilings = num_tilings
+        self.tile_width = (self.high - self.low) / self.bins
+
+        self.offsets = (
+            np.arange(num_tilings)[:, None]
+            * (2 * np.arange(self.n_dims) + 1)
+            % num_tilings
+        ) / num_tilings
+        tiles = self.bins + 1
+        self.tiles_per_tiling = int(np.prod(tiles))
+        self.n = num_tilings * self.tiles_per_tiling
+        self._strides = np.append(np.cumprod(tiles[:0:-1])[::-1], 1)
+        self._tiling_starts = np.arange(num_tilings) * self.tiles_per_tiling
+
+    def indices(self, observations: np.ndarray) -> np.ndarray:
+        """The active tile of every tiling as an index in ``[0, n)``, shape ``(..., num_tilings)``."""
+        scaled = (np.asarray(observations) - self.low) / self.tile_width
+        coords = np.floor(scaled[..., None, :] + self.offsets).astype(np.int64)
+        np.clip(coords, 0, self.bins, out=coords)
+        return coords @ self._strides + self._tiling_starts
+
+
 @singledispatch
 def create_zero_array(space: Space[T_cov]) -> T_cov:
     """Creates a zero-based array of a space, this is similar to ``create_empty_array`` except all arrays are valid samples from the space.
@@ -15,6 +15,7 @@ from gymnasium.wrappers.vector.vectorize_action import (
     VectorizeTransformAction,
 )
 from gymnasium.wrappers.vector.vectorize_observation import (
+    DiscretizeObservation,
     DtypeObservation,
     FilterObservation,
     FlattenObservation,
@@ -47,6 +48,7 @@ __all__ = [
     "ReshapeObservation",
     "RescaleObservation",
     "DtypeObservation",
+    "DiscretizeObservation",
     "NormalizeObservation",
     # "RenderObservation",
     # "TimeAwareObservation",
@@ -8,13 +8,14 @@ from typing import Any
 
 import numpy as np
 
-from gymnasium import Space
+from gymnasium import Space, spaces
 from gymnasium.core import ActType, Env, ObsType
 from gymnasium.logger import warn
 from gymnasium.vector import VectorEnv, VectorObservationWrapper
 from gymnasium.vector.utils import batch_space, concatenate, create_empty_array, iterate
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode
 from gymnasium.wrappers import transform_observation
+from gymnasium.wrappers.utils import BinDiscretizer
 
 
 class TransformObservation(VectorObservationWrapper):
@@ -426,3 +427,75 @@ class DtypeObservation(VectorizeTransformObservation):
             dtype: The new dtype of the observation
         """
         super().__init__(env, transform_observation.DtypeObservation, dtype=dtype)
+
+
+class DiscretizeObservation(VectorObservationWrapper):
+    """Discretizes the continuous Box observations of all sub-environments with one vectorized call per step.
+
+    Same bins and indices as :class:`gymnasium.wrappers.DiscretizeObservation`, but the batch of observations
+    is discretized at once instead of once per sub-environment.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("MountainCar-v0", num_envs=3, vectorization_mode="sync")
+        >>> envs = DiscretizeObservation(envs, bins=10)
+        >>> envs.single_observation_space
+        Discrete(100)
+        >>> obs, info = envs.reset(seed=123)
+        >>> obs
+        array([45, 45, 45])
+        >>> envs.close()
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        bins: int | tuple[int, ...] | None = None,
+        multidiscrete: bool = False,
+        bin_edges: Sequence[np.ndarray] | None = None,
+    ):
+        """Constructor for the vector discretize observation wrapper.
+
+        Args:
+            env: The vector environment to wrap, its single observation space must be a finite :class:`Box`.
+            bins: int or tuple of ints (number of uniform bins per dimension).
+            multidiscrete: If True, use MultiDiscrete space instead of flattening to Discrete.
+            bin_edges: The increasing inner bin edges of every dimension instead of uniform ``bins``.
+        """
+        super().__init__(env)
+        single_space = env.single_observation_space
+        if not isinstance(single_space, spaces.Box):
+            raise TypeError(
+                "DiscretizeObservation is only compatible with Box continuous observations."
+            )
+        if np.any(np.isinf(single_space.low)) or np.any(np.isinf(single_space.high)):
+            raise ValueError(
+                "Discretization requires observation space to be finite. "
+                f"Found: low={single_space.low}, high={single_space.high}"
+            )
+
+        if bin_edges is not None:
+            self.discretizer = BinDiscretizer(bin_edges)
+        else:
+            assert (
+                bins is not None
+            ), "DiscretizeObservation requires either bins or bin_edges"
+            self.discretizer = BinDiscretizer.uniform(
+                single_space.low, single_space.high, bins
+            )
+        assert self.discretizer.n_dims == single_space.shape[0]
+
+        self.multidiscrete = multidiscrete
+        if multidiscrete:
+            self.single_observation_space = spaces.MultiDiscrete(self.discretizer.bins)
+        else:
+            self.single_observation_space = spaces.Discrete(self.discretizer.n)
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+
+    def observations(self, observations: ObsType) -> ObsType:
+        """Discretizes the batch of observations."""
+        if self.multidiscrete:
+            return self.discretizer.indices(observations).astype(np.int64)
+        return self.discretizer.flat_indices(observations)
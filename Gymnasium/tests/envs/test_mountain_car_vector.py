@@ -0,0 +1,101 @@
+"""Tests that the native MountainCar vector environments match the single environments."""
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.envs.classic_control.continuous_mountain_car import (
+    Continuous_MountainCarVectorEnv,
+)
+from gymnasium.envs.classic_control.mountain_car import MountainCarVectorEnv
+
+
+@pytest.mark.parametrize(
+    "env_id, vector_env_class",
+    [
+        ("MountainCar-v0", MountainCarVectorEnv),
+        ("MountainCarContinuous-v0", Continuous_MountainCarVectorEnv),
+    ],
+)
+def test_make_vec_entry_point(env_id, vector_env_class):
+    envs = gym.make_vec(env_id, num_envs=3)
+    assert isinstance(envs, vector_env_class)
+    assert envs.num_envs == 3
+
+    single_env = gym.make(env_id)
+    assert envs.single_action_space == single_env.action_space
+    assert envs.single_observation_space == single_env.observation_space
+
+    envs.close()
+    single_env.close()
+
+
+@pytest.mark.parametrize("env_id", ["MountainCar-v0", "MountainCarContinuous-v0"])
+def test_single_env_equivalence(env_id, num_steps: int = 300):
+    """Tests that every sub-environment follows the same dynamics as the single environment."""
+    envs = gym.make_vec(env_id, num_envs=1)
+    env = gym.make(env_id)
+
+    vector_obs, _ = envs.reset(seed=123)
+    obs, _ = env.reset(seed=123)
+    np.testing.assert_allclose(vector_obs[0], obs)
+
+    envs.action_space.seed(123)
+    for _ in range(num_steps):
+        actions = envs.action_space.sample()
+        vector_obs, vector_reward, vector_terminated, vector_truncated, _ = envs.step(
+            actions
+        )
+        obs, reward, terminated, truncated, _ = env.step(actions[0])
+
+        np.testing.assert_allclose(vector_obs[0], obs, rtol=1e-5, atol=1e-6)
+        assert np.isclose(vector_reward[0], reward)
+        assert vector_terminated[0] == terminated
+        assert vector_truncated[0] == truncated
+
+        if terminated or truncated:
+            break
+
+    envs.close()
+    env.close()
+
+
+def test_autoreset():
+    envs = gym.make_vec("MountainCar-v0", num_envs=4, max_episode_steps=5)
+    obs, _ = envs.reset(seed=0)
+    assert obs.shape == (4, 2)
+
+    for _ in range(5):
+        obs, reward, terminated, truncated, _ = envs.step(np.ones(4, dtype=np.int64))
+    assert np.all(truncated) and not np.any(terminated)
+    assert np.all(reward == -1)
+
+    # The step after an episode ends resets the sub-environments with zero reward
+    obs, reward, terminated, truncated, _ = envs.step(np.ones(4, dtype=np.int64))
+    assert np.all(reward == 0)
+    assert not np.any(terminated | truncated)
+    assert np.all((obs[:, 0] >= -0.6) & (obs[:, 0] <= -0.4))
+    assert np.all(obs[:, 1] == 0)
+
+    envs.close()
+
+
+def test_customizable_resets():
+    envs = gym.make_vec("MountainCar-v0", num_envs=5)
+    envs.reset(seed=0, options={"low": -0.4, "high": 0.4})
+    assert np.all((envs.unwrapped.state >= -0.4) & (envs.unwrapped.state <= 0.4))
+    envs.close()
+
+
+def test_render():
+    pytest.importorskip("pygame")
+
+    envs = gym.make_vec("MountainCar-v0", num_envs=3, render_mode="rgb_array")
+    envs.reset(seed=0)
+    frames = envs.render()
+
+    assert len(frames) == 3
+    for frame in frames:
+        assert frame.shape == (400, 600, 3) and frame.dtype == np.uint8
+
+    envs.close()
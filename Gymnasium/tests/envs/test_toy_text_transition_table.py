@@ -0,0 +1,98 @@
+"""Tests for the array-backed transition tables of the toy text environments."""
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.envs.toy_text import utils
+from gymnasium.envs.toy_text.frozen_lake import generate_random_map
+from gymnasium.envs.toy_text.utils import TransitionTable, categorical_sample
+
+
+TOY_TEXT_ENVS = [
+    ("FrozenLake-v1", {"map_name": "8x8", "is_slippery": True}),
+    ("FrozenLake-v1", {"is_slippery": False}),
+    ("CliffWalking-v1", {"is_slippery": True}),
+    ("Taxi-v3", {"is_rainy": True}),
+]
+
+
+@pytest.mark.parametrize("env_id, kwargs", TOY_TEXT_ENVS)
+def test_transition_table_matches_p(env_id, kwargs):
+    env = gym.make(env_id, **kwargs).unwrapped
+    table = env.transition_table
+
+    for s in env.P:
+        for a in env.P[s]:
+            for k, (prob, next_state, reward, terminated) in enumerate(env.P[s][a]):
+                assert table.outcome(s, a, k) == (
+                    prob,
+                    next_state,
+                    reward,
+                    terminated,
+                )
+            # padded outcomes have zero probability
+            assert np.all(table.probs[s, a, len(env.P[s][a]) :] == 0)
+
+    assert not table.cumulative_probs.flags.writeable
+
+
+@pytest.mark.parametrize("env_id, kwargs", TOY_TEXT_ENVS)
+def test_transition_table_sampling(env_id, kwargs):
+    """Tests that sampling from the table uses the random generator identically to `categorical_sample`."""
+    env = gym.make(env_id, **kwargs).unwrapped
+    table_rng, sample_rng = np.random.default_rng(1), np.random.default_rng(1)
+
+    for _ in range(10):
+        for s in env.P:
+            for a in env.P[s]:
+                expected = categorical_sample([t[0] for t in env.P[s][a]], sample_rng)
+                assert env.transition_table.sample(s, a, table_rng) == expected
+
+
+def test_transition_table_cache():
+    env_1 = gym.make("FrozenLake-v1", map_name="8x8").unwrapped
+    env_2 = gym.make("FrozenLake-v1", map_name="8x8").unwrapped
+    assert env_1.transition_table is env_2.transition_table
+
+    not_slippery_env = gym.make(
+        "FrozenLake-v1", map_name="8x8", is_slippery=False
+    ).unwrapped
+    assert not_slippery_env.transition_table is not env_1.transition_table
+
+    random_map_env = gym.make(
+        "FrozenLake-v1", desc=generate_random_map(size=8, seed=0)
+    ).unwrapped
+    assert random_map_env.transition_table is not env_1.transition_table
+
+
+@pytest.mark.parametrize("env_id, kwargs", TOY_TEXT_ENVS)
+def test_transition_table_cached_p(env_id, kwargs):
+    """Tests that `P` rebuilt from a cached table equals the `P` built by the environment."""
+    utils._TRANSITION_TABLE_CACHE.clear()
+    built_env = gym.make(env_id, **kwargs).unwrapped
+    cached_env = gym.make(env_id, **kwargs).unwrapped
+    assert cached_env.transition_table is built_env.transition_table
+
+    assert cached_env.P == built_env.P
+    assert built_env.transition_table.to_P() == built_env.P
+    # every instance has its own `P`
+    cached_env.P[0][0].clear()
+    assert built_env.P[0][0] and built_env.transition_table.to_P()[0][0]
+
+
+def test_transition_table_padding():
+    P = {
+        0: {0: [(1.0, 1, 0, False)], 1: [(0.5, 0, 1.0, False), (0.5, 1, 0, True)]},
+        1: {0: [(1.0, 1, 0, True)], 1: [(1.0, 1, 0, True)]},
+    }
+    table = TransitionTable(P)
+
+    assert table.probs.shape == (2, 2, 2)
+    assert table.rewards.dtype == np.float64
+    np.testing.assert_array_equal(table.cumulative_probs[0, 0], [1.0, 1.0])
+    np.testing.assert_array_equal(table.cumulative_probs[0, 1], [0.5, 1.0])
+
+    rng = np.random.default_rng(0)
+    samples = [table.sample(0, 0, rng) for _ in range(100)]
+    assert samples == [0] * 100
@@ -0,0 +1,28 @@
+"""Tests for the performance benchmarks."""
+
+import pytest
+
+import gymnasium as gym
+from gymnasium.utils.performance import benchmark_step_latency
+
+
+@pytest.mark.parametrize(
+    "env_fn, num_envs",
+    [
+        (lambda: gym.make("CartPole-v1"), 1),
+        (lambda: gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="sync"), 3),
+    ],
+)
+def test_benchmark_step_latency(env_fn, num_envs):
+    env = env_fn()
+    result = benchmark_step_latency(
+        env, num_steps=50, warmup=10, repeats=3, seed=0, percentiles=(50, 99)
+    )
+    env.close()
+
+    assert result["num_envs"] == num_envs
+    assert result["repeats"] == 3
+    assert len(result["steps_per_second_all"]) == 3
+    assert result["steps_per_second"] > 0
+    assert set(result["latency_us"]) == {"p50", "p99"}
+    assert 0 < result["latency_us"]["p50"] <= result["latency_us"]["p99"]
@@ -12,8 +12,9 @@ from gymnasium.error import (
     ClosedEnvironmentError,
     NoAsyncCallError,
 )
-from gymnasium.spaces import Box, Discrete, MultiDiscrete, Tuple
-from gymnasium.vector import AsyncVectorEnv
+from gymnasium.spaces import Box, Dict, Discrete, MultiDiscrete, Text, Tuple
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, AutoresetMode, SyncVectorEnv
 from tests.testing_env import GenericTestEnv
 from tests.vector.testing_utils import (
     CustomSpace,
@@ -434,3 +435,360 @@ def test_async_vector_subenv_error():
         caught_warnings[4].message.args[0]
         == "\x1b[31mERROR: Raising the last exception back to the main process.\x1b[0m"
     )
+
+
+@pytest.mark.parametrize("autoreset_mode", list(AutoresetMode))
+def test_shared_memory_transport(autoreset_mode):
+    """Test the shared memory transport returns the same steps as `SyncVectorEnv`, including the infos."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    async_envs = AsyncVectorEnv(
+        env_fns, transport="shared_memory", autoreset_mode=autoreset_mode
+    )
+    sync_envs = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+
+    assert data_equivalence(async_envs.reset(seed=123), sync_envs.reset(seed=123))
+
+    async_envs.action_space.seed(123)
+    for _ in range(100):
+        actions = async_envs.action_space.sample()
+        async_step = async_envs.step(actions)
+        sync_step = sync_envs.step(actions)
+        assert data_equivalence(async_step, sync_step)
+        assert async_step[2].dtype == np.bool_ and async_step[3].dtype == np.bool_
+
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(
+            async_step[2] | async_step[3]
+        ):
+            reset_mask = async_step[2] | async_step[3]
+            assert data_equivalence(
+                async_envs.reset(options={"reset_mask": reset_mask.copy()}),
+                sync_envs.reset(options={"reset_mask": reset_mask.copy()}),
+            )
+
+    # Commands through the pipe still work between the steps
+    assert async_envs.get_attr("gravity") == (9.8,) * 4
+
+    async_envs.close()
+    sync_envs.close()
+
+
+def test_shared_memory_transport_timeout_and_error():
+    """Test the step timeout and sub-environment errors with the shared memory transport."""
+    env = AsyncVectorEnv(
+        [make_slow_env(0.0, i) for i in range(4)], transport="shared_memory"
+    )
+    env.reset()
+    with pytest.raises(TimeoutError):
+        env.step_async(np.array([0.1, 0.1, 0.3, 0.1]))
+        env.step_wait(timeout=0.1)
+    env.close(terminate=True)
+
+    envs = AsyncVectorEnv(
+        [
+            lambda: GenericTestEnv(
+                reset_func=raise_error_reset, step_func=raise_error_step
+            )
+        ]
+        * 3,
+        transport="shared_memory",
+    )
+    with warnings.catch_warnings(record=True):
+        with pytest.raises(ValueError, match="Error in step"):
+            envs.step(np.array([[0], [1], [2]]))
+    envs.close()
+
+
+def test_shared_memory_transport_invalid():
+    """Test the shared memory transport requires shared observations and an array action space."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+
+    with pytest.raises(ValueError, match="requires `shared_memory=True`"):
+        AsyncVectorEnv(env_fns, shared_memory=False, transport="shared_memory")
+    with pytest.raises(ValueError, match="Invalid `transport`"):
+        AsyncVectorEnv(env_fns, transport="socket")
+    with pytest.raises(ValueError, match="requires a Box, Discrete"):
+        AsyncVectorEnv(
+            [lambda: GenericTestEnv(action_space=Tuple([Discrete(2), Discrete(2)]))]
+            * 2,
+            transport="shared_memory",
+        )
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+@pytest.mark.parametrize("autoreset_mode", list(AutoresetMode))
+def test_envs_per_worker(transport, autoreset_mode):
+    """Test grouping several sub-environments per worker returns the same steps as `SyncVectorEnv`."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(5)]
+    async_envs = AsyncVectorEnv(
+        env_fns,
+        transport=transport,
+        autoreset_mode=autoreset_mode,
+        envs_per_worker=2,
+    )
+    sync_envs = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+
+    assert async_envs.num_workers == 3 and len(async_envs.processes) == 3
+    assert async_envs.worker_envs == [range(0, 2), range(2, 4), range(4, 5)]
+
+    assert data_equivalence(async_envs.reset(seed=123), sync_envs.reset(seed=123))
+
+    async_envs.action_space.seed(123)
+    for _ in range(100):
+        actions = async_envs.action_space.sample()
+        async_step = async_envs.step(actions)
+        assert data_equivalence(async_step, sync_envs.step(actions))
+
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(
+            async_step[2] | async_step[3]
+        ):
+            reset_mask = async_step[2] | async_step[3]
+            assert data_equivalence(
+                async_envs.reset(options={"reset_mask": reset_mask.copy()}),
+                sync_envs.reset(options={"reset_mask": reset_mask.copy()}),
+            )
+
+    async_envs.set_attr("gravity", [9.81, 3.72, 8.87, 1.62, 24.79])
+    assert async_envs.get_attr("gravity") == (9.81, 3.72, 8.87, 1.62, 24.79)
+
+    async_envs.close()
+    sync_envs.close()
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+def test_envs_per_worker_error(transport):
+    """Test an error in a grouped sub-environment shuts down its worker and is raised in the main process."""
+    envs = AsyncVectorEnv(
+        [
+            lambda: GenericTestEnv(
+                reset_func=raise_error_reset, step_func=raise_error_step
+            )
+        ]
+        * 4,
+        transport=transport,
+        envs_per_worker=2,
+    )
+    envs.reset(seed=[0, 0, 0, 0])
+
+    with warnings.catch_warnings(record=True):
+        with pytest.raises(ValueError, match="Error in step with"):
+            envs.step(np.array([[0], [0], [1], [0]]))
+    # Only the worker hosting the third sub-environment is shut down
+    assert envs.parent_pipes[0] is not None and envs.parent_pipes[1] is None
+    envs.close()
+
+    with pytest.raises(ValueError, match="`envs_per_worker` to be a positive integer"):
+        AsyncVectorEnv([make_env("CartPole-v1", 0)], envs_per_worker=0)
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_send_recv(transport, envs_per_worker, shared_memory):
+    """Test `send` / `recv` gives every sub-environment the same trajectory as `SyncVectorEnv`."""
+    if transport == "shared_memory" and not shared_memory:
+        pytest.skip("The shared memory transport requires shared memory observations")
+
+    num_envs, num_steps = 5, 30
+    env_fns = [make_env("CartPole-v1", i) for i in range(num_envs)]
+
+    # Each sub-environment alternates its actions, independently of the others
+    def policy(env_ids, steps):
+        return (steps[env_ids] + env_ids) % 2
+
+    sync_envs = SyncVectorEnv(env_fns)
+    sync_envs.reset(seed=123)
+    expected = []
+    for t in range(num_steps):
+        actions = policy(np.arange(num_envs), np.full(num_envs, t))
+        expected.append(sync_envs.step(actions)[:4])
+    sync_envs.close()
+
+    envs = AsyncVectorEnv(
+        env_fns,
+        shared_memory=shared_memory,
+        transport=transport,
+        envs_per_worker=envs_per_worker,
+    )
+    envs.reset(seed=123)
+    steps = np.zeros(num_envs, dtype=np.int64)
+    env_ids, num_pending = np.arange(num_envs), 0
+    rng = np.random.default_rng(0)
+    while True:
+        if len(env_ids) > 0:
+            envs.send(policy(env_ids, steps), env_ids)
+            num_pending += len(env_ids)
+        if num_pending == 0:
+            break
+
+        batch_size = int(rng.integers(1, num_pending + 1))
+        *step_returns, infos, env_ids = envs.recv(batch_size=batch_size)
+        assert len(env_ids) == batch_size
+        num_pending -= batch_size
+
+        for i, env_idx in enumerate(env_ids):
+            for returned, batch in zip(step_returns, expected[steps[env_idx]]):
+                assert data_equivalence(returned[i], batch[env_idx])
+        steps[env_ids] += 1
+        env_ids = env_ids[steps[env_ids] < num_steps]
+    assert np.all(steps == num_steps)
+
+    # Once no step is pending the other methods can be used again
+    assert envs.get_attr("gravity") == (9.8,) * num_envs
+    envs.close()
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+def test_recv_first_ready(transport):
+    """Test `recv` returns the sub-environments that finished first, without waiting for a slow one."""
+    envs = AsyncVectorEnv(
+        [make_slow_env(0.0, i) for i in range(4)], transport=transport
+    )
+    envs.reset()
+
+    # The first sub-environment sleeps 1 second in its step
+    envs.send(np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32))
+    *_, env_ids = envs.recv(batch_size=3, timeout=0.5)
+    assert sorted(env_ids) == [1, 2, 3]
+
+    envs.send(np.array([0.0, 0.0], dtype=np.float32), [1, 2])
+    *_, env_ids = envs.recv(batch_size=2, timeout=0.5)
+    assert sorted(env_ids) == [1, 2]
+
+    with pytest.raises(TimeoutError):
+        envs.recv(timeout=0.1)
+    *_, env_ids = envs.recv()
+    assert list(env_ids) == [0]
+
+    envs.close()
+
+
+def test_send_recv_errors():
+    """Test the misuses of `send` and `recv`."""
+    envs = AsyncVectorEnv([make_env("CartPole-v1", i) for i in range(4)])
+    envs.reset()
+
+    with pytest.raises(NoAsyncCallError):
+        envs.recv()
+
+    envs.send(np.array([0, 1]), [0, 1])
+    with pytest.raises(ValueError, match="one step at a time"):
+        envs.send(np.array([0]), [1])
+    with pytest.raises(ValueError, match="Expected `batch_size`"):
+        envs.recv(batch_size=3)
+    with pytest.raises(AlreadyPendingCallError):
+        envs.step(np.array([0, 1, 0, 1]))
+
+    # Closing drains the pending steps
+    envs.close()
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+@pytest.mark.parametrize("autoreset_mode", list(AutoresetMode))
+def test_observation_buffers(transport, autoreset_mode):
+    """Test that several observation buffers return read-only views that stay unchanged for the next steps."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(5)]
+    async_envs = AsyncVectorEnv(
+        env_fns,
+        transport=transport,
+        autoreset_mode=autoreset_mode,
+        envs_per_worker=2,
+        observation_buffers=3,
+    )
+    sync_envs = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+
+    async_obs, async_infos = async_envs.reset(seed=123)
+    sync_obs, sync_infos = sync_envs.reset(seed=123)
+    assert data_equivalence((async_obs, async_infos), (sync_obs, sync_infos))
+    assert not async_obs.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        async_obs[0] = 0
+
+    held = [(async_obs, sync_obs)]
+    async_envs.action_space.seed(123)
+    for _ in range(100):
+        actions = async_envs.action_space.sample()
+        async_step = async_envs.step(actions)
+        sync_step = sync_envs.step(actions)
+        assert data_equivalence(async_step, sync_step)
+
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(
+            async_step[2] | async_step[3]
+        ):
+            reset_mask = async_step[2] | async_step[3]
+            async_step = async_envs.reset(options={"reset_mask": reset_mask.copy()})
+            sync_step = sync_envs.reset(options={"reset_mask": reset_mask.copy()})
+            assert data_equivalence(async_step, sync_step)
+
+        # The observations of the last two calls are still untouched
+        held = held[-1:] + [(async_step[0], sync_step[0])]
+        for async_obs, sync_obs in held:
+            assert np.all(async_obs == sync_obs)
+
+    async_envs.close()
+    sync_envs.close()
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+def test_observation_buffers_send_recv(transport):
+    """Test that steps sent with `send` leave the observations of the last `step` unchanged."""
+
+    def make_dict_env(seed):
+        def _make():
+            obs_space = Dict(
+                position=Box(low=0, high=1, shape=(2,)),
+                cell=Tuple((Discrete(3), Discrete(5))),
+            )
+            obs_space.seed(seed)
+            return GenericTestEnv(observation_space=obs_space)
+
+        return _make
+
+    env_fns = [make_dict_env(i) for i in range(4)]
+    async_envs = AsyncVectorEnv(env_fns, transport=transport, observation_buffers=2)
+    sync_envs = SyncVectorEnv(env_fns)
+
+    assert data_equivalence(async_envs.reset(seed=1), sync_envs.reset(seed=1))
+    actions = sync_envs.action_space.sample()
+    async_obs = async_envs.step(actions)[0]
+    sync_obs = sync_envs.step(actions)[0]
+    assert not async_obs["position"].flags.writeable
+    assert not async_obs["cell"][0].flags.writeable
+
+    for _ in range(3):
+        async_envs.send(actions)
+        recv_obs, _, _, _, _, env_ids = async_envs.recv()
+        step_obs = sync_envs.step(actions)[0]
+        assert np.all(recv_obs["position"] == step_obs["position"][env_ids])
+        assert data_equivalence(async_obs, sync_obs)
+
+    async_envs.close()
+    sync_envs.close()
+
+
+def test_observation_buffers_invalid():
+    """Test that the invalid uses of `observation_buffers` raise errors."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected `observation_buffers` to be a positive integer, actual got 0"
+        ),
+    ):
+        AsyncVectorEnv(env_fns, observation_buffers=0)
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "`AsyncVectorEnv(..., observation_buffers > 1)` requires `shared_memory=True`."
+        ),
+    ):
+        AsyncVectorEnv(env_fns, shared_memory=False, observation_buffers=2)
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "`AsyncVectorEnv(..., observation_buffers > 1)` requires an observation space made of Box"
+        ),
+    ):
+        AsyncVectorEnv(
+            [lambda: GenericTestEnv(observation_space=Text(5))],
+            observation_buffers=2,
+        )
@@ -9,7 +9,7 @@ import gymnasium as gym
 from gymnasium import VectorizeMode
 from gymnasium.spaces import Discrete
 from gymnasium.utils.env_checker import data_equivalence
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv
 from gymnasium.vector.vector_env import AutoresetMode
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
 from tests.testing_env import GenericTestEnv
@@ -34,10 +34,11 @@ def count_step(self: GenericTestEnv, action):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_next_step(vectoriser):
     envs = vectoriser(
@@ -94,10 +95,11 @@ def test_autoreset_next_step(vectoriser):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_within_step(vectoriser):
     envs = vectoriser(
@@ -178,10 +180,11 @@ def test_autoreset_within_step(vectoriser):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_disabled(vectoriser):
     envs = vectoriser(
@@ -246,10 +249,11 @@ def test_autoreset_disabled(vectoriser):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 @pytest.mark.parametrize(
     "autoreset_mode",
@@ -272,7 +276,8 @@ def test_autoreset_metadata(vectoriser, autoreset_mode):
 
 
 @pytest.mark.parametrize(
-    "vectorization_mode", [VectorizeMode.SYNC, VectorizeMode.ASYNC]
+    "vectorization_mode",
+    [VectorizeMode.SYNC, VectorizeMode.ASYNC, VectorizeMode.THREADED],
 )
 @pytest.mark.parametrize(
     "autoreset_mode",
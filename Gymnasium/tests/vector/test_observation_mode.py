@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 
 from gymnasium.spaces import Box, Dict, Discrete
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv
 from gymnasium.vector.utils import batch_differing_spaces
 from tests.testing_env import GenericTestEnv
 
@@ -14,12 +14,18 @@ def create_env(obs_space):
     return lambda: GenericTestEnv(observation_space=obs_space)
 
 
-# Test cases for both SyncVectorEnv and AsyncVectorEnv
+# Test cases for SyncVectorEnv, ThreadedVectorEnv and AsyncVectorEnv
 @pytest.mark.parametrize(
     "vector_env_fn",
-    [SyncVectorEnv, AsyncVectorEnv, partial(AsyncVectorEnv, shared_memory=False)],
+    [
+        SyncVectorEnv,
+        ThreadedVectorEnv,
+        AsyncVectorEnv,
+        partial(AsyncVectorEnv, shared_memory=False),
+    ],
     ids=[
         "SyncVectorEnv",
+        "ThreadedVectorEnv",
         "AsyncVectorEnv(shared_memory=True)",
         "AsyncVectorEnv(shared_memory=False)",
     ],
@@ -0,0 +1,137 @@
+"""Test the `ThreadedVectorEnv` implementation."""
+
+import re
+import time
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Box, Dict, Discrete, Tuple
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import SyncVectorEnv, ThreadedVectorEnv
+from gymnasium.vector.vector_env import AutoresetMode
+from tests.testing_env import GenericTestEnv
+from tests.vector.testing_utils import (
+    CustomSpace,
+    make_custom_space_env,
+    make_env,
+    make_slow_env,
+)
+
+
+@pytest.mark.parametrize("copy", [True, False])
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP],
+)
+def test_threaded_vector_env_equal(copy, autoreset_mode):
+    """Test that the threaded vector environment steps exactly like the sync vector environment."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    threaded_env = ThreadedVectorEnv(
+        env_fns, copy=copy, autoreset_mode=autoreset_mode, max_workers=2
+    )
+    sync_env = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+    assert threaded_env.observation_space == sync_env.observation_space
+    assert threaded_env.action_space == sync_env.action_space
+
+    threaded_obs, threaded_infos = threaded_env.reset(seed=0)
+    sync_obs, sync_infos = sync_env.reset(seed=0)
+    assert data_equivalence(threaded_obs, sync_obs)
+    assert data_equivalence(threaded_infos, sync_infos)
+
+    for _ in range(100):
+        actions = sync_env.action_space.sample()
+        threaded_step = threaded_env.step(actions)
+        sync_step = sync_env.step(actions)
+        assert data_equivalence(threaded_step, sync_step)
+
+    threaded_env.close()
+    sync_env.close()
+
+
+def test_threaded_vector_env_nested_observations():
+    """Test that tuple and dict observations are written row by row into the batched buffers."""
+
+    def make_nested_env(seed):
+        def _make():
+            obs_space = Dict(
+                a=Box(low=0, high=1, shape=(2,)), b=Tuple((Discrete(3), Discrete(5)))
+            )
+            obs_space.seed(seed)
+            return GenericTestEnv(observation_space=obs_space)
+
+        return _make
+
+    env_fns = [make_nested_env(i) for i in range(3)]
+
+    threaded_env = ThreadedVectorEnv(env_fns)
+    sync_env = SyncVectorEnv(env_fns)
+    assert threaded_env._write_rows
+
+    assert data_equivalence(threaded_env.reset(seed=1), sync_env.reset(seed=1))
+    actions = sync_env.action_space.sample()
+    assert data_equivalence(threaded_env.step(actions), sync_env.step(actions))
+
+    threaded_env.close()
+    sync_env.close()
+
+
+def test_custom_space_threaded_vector_env():
+    """Test that custom spaces, without batched arrays, are still concatenated."""
+    env = ThreadedVectorEnv([make_custom_space_env(i) for i in range(4)])
+    assert isinstance(env.single_observation_space, CustomSpace)
+    assert not env._write_rows
+
+    reset_observations, _ = env.reset()
+    assert reset_observations == ("reset", "reset", "reset", "reset")
+
+    step_observations, _, _, _, _ = env.step(
+        ("action-2", "action-3", "action-5", "action-7")
+    )
+    assert step_observations == (
+        "step(action-2)",
+        "step(action-3)",
+        "step(action-5)",
+        "step(action-7)",
+    )
+
+    env.close()
+
+
+def test_threaded_vector_env_steps_concurrently():
+    """Test that sub-environments releasing the GIL (here in `time.sleep`) are stepped in parallel."""
+    env = ThreadedVectorEnv(
+        [make_slow_env(slow_reset=0.0, seed=i) for i in range(4)], max_workers=4
+    )
+    env.reset()
+
+    start = time.perf_counter()
+    env.step(np.full(4, 0.2, dtype=np.float32))
+    assert time.perf_counter() - start < 0.6
+
+    env.close()
+
+
+def test_threaded_vector_env_errors():
+    """Test `max_workers` validation and that sub-environment errors are raised in the calling thread."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Invalid `max_workers`, expected: a positive integer, actual got 0"
+        ),
+    ):
+        ThreadedVectorEnv([make_env("CartPole-v1", 0)], max_workers=0)
+
+    def step_func(self, action):
+        raise ValueError(f"Error in step, action={action}")
+
+    env = ThreadedVectorEnv(
+        [lambda: GenericTestEnv(step_func=step_func) for _ in range(2)]
+    )
+    env.reset()
+    with pytest.raises(ValueError, match=re.escape("Error in step")):
+        env.step(env.action_space.sample())
+
+    env.close()
+    assert env._executor._shutdown
@@ -12,7 +12,7 @@ import gymnasium as gym
 from gymnasium.core import ActType, ObsType
 from gymnasium.spaces import Discrete
 from gymnasium.utils.env_checker import data_equivalence
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv
 from gymnasium.vector.vector_env import AutoresetMode
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
 from tests.testing_env import GenericTestEnv
@@ -82,10 +82,11 @@ def debug_step_func(self, action: ActType) -> tuple[ObsType, float, bool, bool,
     "vectoriser",
     (
         SyncVectorEnv,
+        ThreadedVectorEnv,
         partial(AsyncVectorEnv, shared_memory=True),
         partial(AsyncVectorEnv, shared_memory=False),
     ),
-    ids=["Sync", "Async with shared memory", "Async without shared memory"],
+    ids=["Sync", "Threaded", "Async with shared memory", "Async without shared memory"],
 )
 @pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
 def test_vector_obs_action_spaces(vectoriser, space, num_envs=3):
@@ -120,10 +121,11 @@ def test_vector_obs_action_spaces(vectoriser, space, num_envs=3):
     "vectoriser",
     (
         SyncVectorEnv,
+        ThreadedVectorEnv,
         partial(AsyncVectorEnv, shared_memory=True),
         partial(AsyncVectorEnv, shared_memory=False),
     ),
-    ids=["Sync", "Async with shared memory", "Async without shared memory"],
+    ids=["Sync", "Threaded", "Async with shared memory", "Async without shared memory"],
 )
 def test_final_obs_info(vectoriser):
     """Tests that the vector environments correctly return the final observation and info."""
@@ -189,6 +191,7 @@ def example_env_list():
     "venv_constructor",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         partial(AsyncVectorEnv, shared_memory=True),
         partial(AsyncVectorEnv, shared_memory=False),
     ],
@@ -211,6 +214,7 @@ def test_random_seeding_basics(venv_constructor, example_env_list):
     "venv_constructor",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         partial(AsyncVectorEnv, shared_memory=True),
         partial(AsyncVectorEnv, shared_memory=False),
     ],
@@ -226,10 +230,11 @@ def test_random_seeds_set_at_retrieval(venv_constructor, example_env_list):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_partial_reset(vectoriser):
     envs = vectoriser(
@@ -256,10 +261,11 @@ def test_partial_reset(vectoriser):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_partial_reset_failure(vectoriser):
     envs = vectoriser(
@@ -323,10 +329,11 @@ def test_partial_reset_failure(vectoriser):
     "vectoriser",
     [
         SyncVectorEnv,
+        ThreadedVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
+    ids=["Sync", "Threaded", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_action_count_compatibility(vectoriser):
     """Test that the number of actions is compatible with the number of environments."""
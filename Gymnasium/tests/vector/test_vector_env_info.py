@@ -11,7 +11,8 @@ import gymnasium as gym
 from gymnasium.core import ActType, ObsType
 from gymnasium.spaces import Box, Discrete
 from gymnasium.utils.env_checker import data_equivalence
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, VectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv, VectorEnv
+from gymnasium.vector.utils import InfoBatcher
 
 
 def test_vector_add_info():
@@ -118,6 +119,44 @@ def test_vector_add_info():
     assert data_equivalence(vector_infos, expected_vector_infos)
 
 
+def test_info_batcher():
+    """Test that `InfoBatcher` batches the same infos as `VectorEnv._add_info`, step after step."""
+    env = VectorEnv()
+    env.num_envs = 3
+    batcher = InfoBatcher(num_envs=3)
+
+    steps = [
+        [{"a": 1, "b": 1.0}, {"c": None, "d": np.zeros((2,))}, {"e": Discrete(3)}],
+        [{"episode": {"a": 1, "b": 1.0}}, {"episode": {"a": 2}, "a": 1}, {"a": 2}],
+        [{}, {}, {}],
+        # The same keys with another type, shape or dtype
+        [{"a": 1.5, "d": np.ones((3,))}, {"a": 2, "b": True}, {"d": np.ones((3,))}],
+        [{"final_obs": np.zeros(2), "final_info": {}}, {}, {"a": np.float32(3)}],
+        [{"a": 1, "b": 1.0}, {}, {"a": 2}],
+    ]
+    returned = []
+    for step_infos in steps:
+        expected = {}
+        for i, info in enumerate(step_infos):
+            expected = env._add_info(expected, info, i)
+            batcher.add(info, i)
+        infos = batcher.pop()
+        assert data_equivalence(infos, expected)
+        returned.append((infos, expected))
+
+    # The returned infos are not changed by the following steps
+    for infos, expected in returned:
+        assert data_equivalence(infos, expected)
+
+    # Discarded infos do not show up in the next batch
+    batcher.add({"a": 1, "episode": {"r": 1.0}}, 0)
+    batcher.clear()
+    batcher.add({"a": 2}, 1)
+    assert data_equivalence(
+        batcher.pop(), {"a": np.array([0, 2, 0]), "_a": np.array([False, True, False])}
+    )
+
+
 class ReturnInfoEnv(gym.Env):
     def __init__(self, infos):
         self.observation_space = Box(0, 1)
@@ -139,7 +178,9 @@ class ReturnInfoEnv(gym.Env):
         return self.observation_space.sample(), 0, True, False, self.infos[1]
 
 
-@pytest.mark.parametrize("vectorizer", [AsyncVectorEnv, SyncVectorEnv])
+@pytest.mark.parametrize(
+    "vectorizer", [AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv]
+)
 def test_vector_return_info(vectorizer):
     vec_env = vectorizer(
         [
@@ -75,7 +75,7 @@ class SlowEnv(gym.Env):
 
     def step(self, action):
         """Steps through the environment with a time sleep."""
-        time.sleep(action)
+        time.sleep(float(action))
         observation = self.observation_space.sample()
         reward, terminated, truncated = 0.0, False, False
         return observation, reward, terminated, truncated, {}
@@ -16,6 +16,7 @@ from gymnasium.vector.utils import (
     batch_space,
     concatenate,
     create_empty_array,
+    is_array_space,
     iterate,
 )
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS, CustomSpace
@@ -240,3 +241,33 @@ def test_batch_differing_discrete_spaces_dtype(spaces, expected_dtype):
     multi_discrete = batch_differing_spaces(spaces)
 
     assert multi_discrete.dtype == expected_dtype
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+@pytest.mark.parametrize("n", [1, 4], ids=[f"n={n}" for n in [1, 4]])
+def test_is_array_space(space: Space, n: int):
+    """Test that `is_array_space` spaces have an empty array with a writable row per sub-environment."""
+    if not is_array_space(space):
+        return
+
+    batched = create_empty_array(space, n)
+    sample = space.sample()
+    for index in range(n):
+        batched_items = [batched]
+        sample_items = [sample]
+        while batched_items:
+            item, value = batched_items.pop(), sample_items.pop()
+            if isinstance(item, tuple):
+                batched_items.extend(item)
+                sample_items.extend(value)
+            elif isinstance(item, dict):
+                batched_items.extend(item[key] for key in item)
+                sample_items.extend(value[key] for key in item)
+            else:
+                assert isinstance(item, np.ndarray) and len(item) == n
+                item[index] = value
+
+    assert all(
+        data_equivalence(item, sample)
+        for item in iterate(batch_space(space, n), batched)
+    )
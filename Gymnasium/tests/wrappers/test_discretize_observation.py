@@ -3,8 +3,9 @@
 import numpy as np
 import pytest
 
-from gymnasium.spaces import Box, Discrete
+from gymnasium.spaces import Box, Discrete, MultiDiscrete
 from gymnasium.wrappers import DiscretizeObservation
+from gymnasium.wrappers.utils import BinDiscretizer, TileCoder
 from tests.testing_env import GenericTestEnv
 
 
@@ -58,3 +59,33 @@ def test_discretize_observation_dtype():
     """Tests the discretize observation wrapper with spaces that should raise an error."""
     with pytest.raises((TypeError,)):
         DiscretizeObservation(GenericTestEnv(observation_space=Discrete(10)))
+
+
+def test_discretize_observation_bin_edges():
+    """Tests the discretize observation wrapper with custom (quantile) bin edges."""
+    env = GenericTestEnv(observation_space=Box(0, 99, shape=(2,)))
+    samples = np.random.default_rng(0).exponential(10, size=(1000, 2))
+    edges = BinDiscretizer.from_samples(samples, bins=(4, 3)).edges
+    env = DiscretizeObservation(env, bin_edges=edges, multidiscrete=True)
+    assert env.observation_space == MultiDiscrete([4, 3])
+
+    indices = env.discretizer.indices(samples)
+    for i, bins in enumerate((4, 3)):
+        counts = np.bincount(indices[:, i], minlength=bins)
+        assert np.all(np.abs(counts - 1000 / bins) <= 1)
+    assert np.all(env.observation(samples[0]) == indices[0])
+
+    low, high = env.revert_observation(env.observation(samples[0]))
+    assert np.all(low <= samples[0]) and np.all(samples[0] <= high)
+
+
+def test_tile_coder():
+    """Tests that every tiling activates exactly one tile of its own range."""
+    coder = TileCoder(low=[-1.2, -0.07], high=[0.6, 0.07], bins=8, num_tilings=4)
+    obs = np.random.default_rng(0).uniform([-1.2, -0.07], [0.6, 0.07], size=(500, 2))
+    indices = coder.indices(obs)
+    assert indices.shape == (500, 4)
+    tiling = indices // coder.tiles_per_tiling
+    assert np.all(tiling == np.arange(4))
+    assert np.all((0 <= indices) & (indices < coder.n))
+    assert np.all(coder.indices(obs[0]) == indices[0])
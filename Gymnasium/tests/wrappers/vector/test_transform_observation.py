@@ -98,3 +98,22 @@ def test_warning_on_mismatched_single_observation_space(
                 high=np.array([[10, -5, 10]] * n_envs, dtype=np.float32) + 100,
             ),
         )
+
+
+@pytest.mark.parametrize("multidiscrete", [False, True])
+def test_discretize_observation(multidiscrete, n_envs: int = 3):
+    """Tests that the vector discretize wrapper matches the single environment wrapper."""
+    vec_env = SyncVectorEnv([create_env for _ in range(n_envs)])
+    vec_env = wrappers.vector.DiscretizeObservation(
+        vec_env, bins=(3, 4, 5), multidiscrete=multidiscrete
+    )
+    single_env = wrappers.DiscretizeObservation(
+        create_env(), bins=(3, 4, 5), multidiscrete=multidiscrete
+    )
+    assert vec_env.single_observation_space == single_env.observation_space
+
+    obs = np.random.default_rng(0).uniform([0, -10, -5], [10, -5, 10], size=(n_envs, 3))
+    vec_obs = vec_env.observations(obs)
+    assert vec_obs in vec_env.observation_space
+    for i in range(n_envs):
+        assert np.all(vec_obs[i] == single_env.observation(obs[i]))
@@ -0,0 +1,112 @@
+#Step-throughput benchmark of the three course environments, results are written as JSON so runs can be diffed
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.utils.performance import benchmark_step_latency
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, 'part3'))
+import oop_project_env  # registers dino-fighter-v0
+
+# The environments as part1, part2 and part3 use them
+ENVS = {
+    'mountain_car': ('MountainCar-v0', {}),
+    'frozen_lake': ('FrozenLake-v1', {'map_name': '8x8', 'is_slippery': True}),
+    'dino': ('dino-fighter-v0', {}),
+}
+MODES = ['single', 'sync', 'threaded', 'async', 'async_shared', 'native']
+
+
+def make_env(env_id, kwargs, mode, num_envs, envs_per_worker=1):
+    """The environment in one of the MODES, None if the environment has no native vector version."""
+    if mode == 'single':
+        return gym.make(env_id, **kwargs)
+    if mode == 'native':
+        if gym.spec(env_id).vector_entry_point is None:
+            return None
+        return gym.make_vec(env_id, num_envs=num_envs, vectorization_mode='vector_entry_point', **kwargs)
+    if mode == 'async_shared':
+        # AsyncVectorEnv with actions, rewards and dones in shared memory instead of pickled through pipes
+        return gym.make_vec(env_id, num_envs=num_envs, vectorization_mode='async',
+                            vector_kwargs={'transport': 'shared_memory', 'envs_per_worker': envs_per_worker}, **kwargs)
+    if mode == 'async':
+        return gym.make_vec(env_id, num_envs=num_envs, vectorization_mode='async',
+                            vector_kwargs={'envs_per_worker': envs_per_worker}, **kwargs)
+    return gym.make_vec(env_id, num_envs=num_envs, vectorization_mode=mode, **kwargs)
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+def run_benchmarks(envs, modes, num_envs, steps, warmup, repeats, seed, envs_per_worker=1):
+    results = []
+    for name in envs:
+        env_id, kwargs = ENVS[name]
+        for mode in modes:
+            env = make_env(env_id, kwargs, mode, num_envs, envs_per_worker)
+            if env is None:
+                print(f"{name:>12} {mode:>12}: no native vector environment, skipped")
+                continue
+            result = benchmark_step_latency(env, num_steps=steps, warmup=warmup, repeats=repeats, seed=seed)
+            env.close()
+            # One vector step advances every sub-environment
+            result['env_steps_per_second'] = result['steps_per_second'] * result['num_envs']
+            results.append(dict(env=name, env_id=env_id, mode=mode, **result))
+            print(f"{name:>12} {mode:>12}: {result['env_steps_per_second']:>12,.0f} env-steps/s  "
+                  f"p50 {result['latency_us']['p50']:8.1f} us  p99 {result['latency_us']['p99']:8.1f} us")
+    return results
+
+def print_native_vs_sync(results):
+    # The native vector env has a fixed per-step cost and only beats SyncVectorEnv above some number of envs
+    throughput = {(r['env'], r['mode']): r for r in results}
+    for (name, mode), native in throughput.items():
+        sync = throughput.get((name, 'sync'))
+        if mode != 'native' or sync is None:
+            continue
+        ratio = native['env_steps_per_second'] / sync['env_steps_per_second']
+        advice = "" if ratio >= 1 else ", use vectorization_mode='sync' for this number of envs"
+        print(f"{name:>12}: native is {ratio:.2f}x sync at {native['num_envs']} envs{advice}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Step-throughput benchmark of the course environments")
+    parser.add_argument('--envs', nargs='+', choices=list(ENVS), default=list(ENVS), help='Environments to benchmark')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES, help='single env, Sync/Threaded/AsyncVectorEnv (pipe or shared memory transport) or the native vector env')
+    parser.add_argument('--num-envs', type=int, default=8, help='Sub-environments of the vector modes')
+    parser.add_argument('--envs-per-worker', type=int, default=1, help='Sub-environments hosted by each AsyncVectorEnv process')
+    parser.add_argument('--steps', type=int, default=2000, help='Timed steps per repeat')
+    parser.add_argument('--warmup', type=int, default=200, help='Untimed steps before the first repeat')
+    parser.add_argument('--repeats', type=int, default=5, help='Number of repeats')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the environments and the sampled actions')
+    parser.add_argument('--out', default='benchmark.json', help='JSON file the results are written to')
+
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.envs, args.modes, args.num_envs, args.steps, args.warmup, args.repeats, args.seed,
+                             args.envs_per_worker)
+    print_native_vs_sync(results)
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'gymnasium': gym.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'config': vars(args),
+        'results': results,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.out}")
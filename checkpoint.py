@@ -0,0 +1,95 @@
+#Q-table checkpoints: the table as a .npy file (memory-mapped when loading) with a .json header next to it
+
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import zlib
+
+import numpy as np
+
+FORMAT_VERSION = 1
+FILE_MODE = 0o644   # rw-r--r--, what a plain open() gives with the usual umask
+
+
+def header_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+def _atomic_write(path, write):
+    """Write to a temporary file in the same directory and rename it over path, readers never see half a file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        os.chmod(tmp_path, FILE_MODE)   # mkstemp creates the file private, give it the usual permissions
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def save_q_table(path, q, env_id, edges=None, hyperparameters=None, episodes=None, **extra):
+    """Save q to path (.npy) and its header (.json).
+
+    The header carries the format version, env id, the discretization edges of every observation dimension,
+    the hyperparameters, the number of training episodes and the shape, dtype and CRC32 of the table.
+    The table is written before the header, both atomically, but not as a pair: a crash between the two leaves
+    the new table next to the old header. load_q_table catches that with the CRC32 of the table.
+    """
+    q = np.ascontiguousarray(q)
+    header = dict(
+        format_version=FORMAT_VERSION,
+        env_id=env_id,
+        shape=list(q.shape),
+        dtype=q.dtype.str,
+        crc32=zlib.crc32(q.data),
+        edges=None if edges is None else [np.asarray(e).tolist() for e in edges],
+        hyperparameters=hyperparameters or {},
+        episodes=episodes,
+        **extra,
+    )
+    _atomic_write(path, lambda f: np.save(f, q))
+    _atomic_write(header_path(path), lambda f: f.write(json.dumps(header, indent=2).encode()))
+
+def load_q_table(path, mmap=True, verify=True):
+    """Load a checkpoint, returns (q, header).
+
+    With mmap=True the table is a read-only np.memmap, every process evaluating the same file shares its pages.
+    verify=True (default) checks the CRC32 of the table against the header, so a table and a header written by
+    different saves are never used together; it reads the whole table once, verify=False skips it for very large
+    tables. Legacy .pkl Q-tables load with an empty header.
+    """
+    if path.endswith('.pkl'):
+        with open(path, 'rb') as f:
+            return pickle.load(f), {}
+
+    with open(header_path(path)) as f:
+        header = json.load(f)
+    if header['format_version'] > FORMAT_VERSION:
+        raise ValueError(f"{path}: checkpoint format {header['format_version']} is newer than {FORMAT_VERSION}")
+
+    q = np.load(path, mmap_mode='r' if mmap else None)
+    if list(q.shape) != header['shape'] or q.dtype.str != header['dtype']:
+        raise ValueError(f"{path}: table {q.shape} {q.dtype.str} does not match its header "
+                         f"{tuple(header['shape'])} {header['dtype']}")
+    if verify and zlib.crc32(np.ascontiguousarray(q).data) != header['crc32']:
+        raise ValueError(f"{path}: CRC32 of the table does not match its header (written by a different or interrupted save)")
+    return q, header
+
+def remove_checkpoint(path):
+    for p in (path, header_path(path)):
+        if os.path.exists(p):
+            os.remove(p)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert a pickled Q-table into a checkpoint")
+    parser.add_argument('pkl', help='Pickled Q-table')
+    parser.add_argument('--env-id', required=True, help='Environment id stored in the header')
+    parser.add_argument('--out', default=None, help='Checkpoint path (default: the pickle name with .npy)')
+
+    args = parser.parse_args()
+    q, _ = load_q_table(args.pkl)
+    save_q_table(args.out or os.path.splitext(args.pkl)[0] + '.npy', np.asarray(q), args.env_id)
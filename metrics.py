@@ -0,0 +1,101 @@
+#Streaming training metrics for part1 and part2, constant memory however many episodes are run
+
+import argparse
+import os
+
+import numpy as np
+
+
+class RollingWindow:
+    """Sum and mean of the last `size` values, kept in a ring buffer with a running sum (O(1) per value)."""
+
+    def __init__(self, size):
+        self.values = np.zeros(size)
+        self.size = size
+        self.count = 0
+        self.sum = 0.0
+
+    def push(self, value):
+        i = self.count % self.size
+        self.sum += value - self.values[i]
+        self.values[i] = value
+        self.count += 1
+
+    def full(self):
+        return self.count >= self.size
+
+    def mean(self):
+        return self.sum / min(max(self.count, 1), self.size)
+
+
+class MetricsLog:
+    """Appends one CSV row per episode (episode, value, rolling mean of the last `window` values) while training.
+
+    Rows are buffered and written every `flush_every` episodes, nothing else is kept in memory.
+    With path=None only the rolling window is kept (for example inside a sweep).
+    """
+
+    def __init__(self, path, name='reward', window=100, flush_every=1000):
+        self.path = path
+        self.name = name
+        self.window = RollingWindow(window)
+        self.flush_every = flush_every
+        self.episodes = 0
+        self.rows = []
+        self.file = None
+        if path is not None:
+            self.file = open(path, 'w')
+            self.file.write(f'episode,{name},rolling_mean\n')
+
+    def add(self, value):
+        self.window.push(value)
+        self.episodes += 1
+        if self.file is not None:
+            self.rows.append(f'{self.episodes},{value:g},{self.window.mean():.6g}\n')
+            if len(self.rows) >= self.flush_every: self.flush()
+
+    def extend(self, values):
+        for value in values: self.add(float(value))
+
+    def flush(self):
+        if self.file is not None and self.rows:
+            self.file.writelines(self.rows)
+            self.file.flush()
+            self.rows.clear()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def plot(path, plot_path, column='rolling_mean'):
+    """Plot one column of a MetricsLog file. matplotlib is only imported here, never when training starts."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    log = np.genfromtxt(path, delimiter=',', names=True)
+    fig, ax = plt.subplots()
+    ax.plot(np.atleast_1d(log['episode']), np.atleast_1d(log[column]))
+    ax.set_xlabel('episode')
+    ax.set_ylabel(column)
+    fig.savefig(plot_path)
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Plot a training metrics log")
+    parser.add_argument('log', help='CSV file written by MetricsLog')
+    parser.add_argument('--out', default=None, help='Image file (default: the log name with .png)')
+    parser.add_argument('--column', default='rolling_mean', help='Column to plot')
+
+    args = parser.parse_args()
+    plot(args.log, args.out or os.path.splitext(args.log)[0] + '.png', args.column)
@@ -1,10 +1,64 @@
 #Using Q-Learning to solve
 
 import argparse
+import os
+import sys
 import gymnasium as gym
 import numpy as np
-import matplotlib.pyplot as plt
-import pickle
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from checkpoint import load_q_table, save_q_table
+from gymnasium.wrappers.utils import BinDiscretizer, TileCoder
+from metrics import MetricsLog, plot   # shared with part2, matplotlib is only imported when plotting (from __main__)
+
+# The Q-table has one row per cell of the discretized (position, velocity) space.
+# A discretizer is either a grid of bins (BinDiscretizer: uniform or quantile edges, one active cell per state)
+# or a TileCoder (num_tilings active tiles per state, the Q-value of a state is the sum over its tiles).
+GRID_BINS = 20
+
+def grid_discretizer(low, high):
+    # Same cells as np.digitize on a 20 point np.linspace between low and high, the last point
+    # only adds a bin that is never reached (the state never exceeds high)
+    return BinDiscretizer([np.linspace(low[i], high[i], GRID_BINS)[:-1] for i in range(len(low))])
+
+def make_discretizer(kind, low, high, samples=None, num_tilings=8):
+    if kind == 'uniform':
+        return grid_discretizer(low, high)
+    if kind == 'quantile':
+        # Edges at the quantiles of the states seen in a warmup rollout, mixed with as many states spread uniformly
+        # over the bounds: the bins are finer where the car goes often but rarely visited regions keep some bins
+        uniform = np.random.default_rng(0).uniform(low, high, samples.shape)
+        return BinDiscretizer.from_samples(np.concatenate([samples, uniform]), GRID_BINS)
+    return TileCoder(low, high, bins=GRID_BINS // 2, num_tilings=num_tilings)
+
+def active_cells(discretizer, states):
+    # Rows of the Q-table used by each of a batch of states, shape (N, number of active cells)
+    if isinstance(discretizer, TileCoder):
+        return discretizer.indices(states)
+    return discretizer.flat_indices(states)[:, None]
+
+def discretizer_header(discretizer):
+    if isinstance(discretizer, TileCoder):
+        return dict(type='tiles', low=discretizer.low.tolist(), high=discretizer.high.tolist(),
+                    bins=discretizer.bins.tolist(), num_tilings=discretizer.num_tilings)
+    return dict(type='bins')
+
+def discretizer_from_header(header, low, high):
+    info = header.get('discretizer')
+    if info is not None and info['type'] == 'tiles':
+        return TileCoder(info['low'], info['high'], info['bins'], info['num_tilings'])
+    if info is not None:
+        return BinDiscretizer(header['edges'])
+    if header.get('edges') is not None:
+        # Older checkpoints stored the 20 np.linspace points
+        return BinDiscretizer([np.array(e)[:-1] for e in header['edges']])
+    return grid_discretizer(low, high)
+
+def save(q, discretizer, episodes, **hyperparameters):
+    edges = None if isinstance(discretizer, TileCoder) else discretizer.edges
+    save_q_table('mountain_car.npy', q, 'MountainCar-v0', edges=edges, episodes=episodes,
+                 hyperparameters=hyperparameters, discretizer=discretizer_header(discretizer))
 
 def run(episodes, is_training=True, render=False):
     if is_training:
@@ -13,17 +67,16 @@ def run(episodes, is_training=True, render=False):
         print(f"Running evaluation for {episodes} episodes (render={render})")
 
     env = gym.make('MountainCar-v0', render_mode='human' if render else None)
-
-    # Divide position and velocity into segments
-    pos_space = np.linspace(env.observation_space.low[0], env.observation_space.high[0], 20)    # Between -1.2 and 0.6
-    vel_space = np.linspace(env.observation_space.low[1], env.observation_space.high[1], 20)    # Between -0.07 and 0.07
+    low, high = env.observation_space.low, env.observation_space.high    # Between -1.2 and 0.6, -0.07 and 0.07
 
     if(is_training):
-        q = np.zeros((len(pos_space), len(vel_space), env.action_space.n)) # init a 20x20x3 array
+        # Divide position and velocity into segments
+        discretizer = grid_discretizer(low, high)
+        q = np.zeros((discretizer.n, env.action_space.n)) # init a 400x3 array (20x20 cells)
     else:
-        f = open('mountain_car.pkl', 'rb')
-        q = pickle.load(f)
-        f.close()
+        q, header = load_q_table('mountain_car.npy')   # memory-mapped, read only
+        discretizer = discretizer_from_header(header, low, high)
+        q = q.reshape(-1, env.action_space.n)
 
     learning_rate_a = 0.9 # alpha or learning rate
     discount_factor_g = 0.9 # gamma or discount factor.
@@ -32,12 +85,12 @@ def run(episodes, is_training=True, render=False):
     epsilon_decay_rate = 2/episodes # epsilon decay rate
     rng = np.random.default_rng()   # random number generator
 
-    rewards_per_episode = np.zeros(episodes)
+    # Rewards are streamed to the log with a rolling mean of the last 100 episodes
+    metrics = MetricsLog('mountain_car.csv', name='reward', window=100)
 
     for i in range(episodes):
         state = env.reset()[0]      # Starting position, starting velocity always 0
-        state_p = np.digitize(state[0], pos_space)
-        state_v = np.digitize(state[1], vel_space)
+        cells = active_cells(discretizer, state[None])[0]
 
         terminated = False          # True when reached goal
 
@@ -49,47 +102,152 @@ def run(episodes, is_training=True, render=False):
                 # Choose random action (0=drive left, 1=stay neutral, 2=drive right)
                 action = env.action_space.sample()
             else:
-                action = np.argmax(q[state_p, state_v, :])
+                action = np.argmax(q[cells].sum(axis=0))
 
             new_state,reward,terminated,_,_ = env.step(action)
-            new_state_p = np.digitize(new_state[0], pos_space)
-            new_state_v = np.digitize(new_state[1], vel_space)
+            new_cells = active_cells(discretizer, new_state[None])[0]
 
             if is_training:
-                q[state_p, state_v, action] = q[state_p, state_v, action] + learning_rate_a * (
-                    reward + discount_factor_g*np.max(q[new_state_p, new_state_v,:]) - q[state_p, state_v, action]
+                q[cells, action] = q[cells, action] + learning_rate_a / len(cells) * (
+                    reward + discount_factor_g*np.max(q[new_cells].sum(axis=0)) - q[cells, action].sum()
                 )
 
             state = new_state
-            state_p = new_state_p
-            state_v = new_state_v
+            cells = new_cells
 
             rewards+=reward
 
         epsilon = max(epsilon - epsilon_decay_rate, 0)
 
-        rewards_per_episode[i] = rewards
+        metrics.add(rewards)
 
     env.close()
+    metrics.close()
 
     # Save Q table to file
     if is_training:
-        f = open('mountain_car.pkl','wb')
-        pickle.dump(q, f)
-        f.close()
+        save(q, discretizer, episodes, learning_rate_a=learning_rate_a, discount_factor_g=discount_factor_g,
+             epsilon_decay_rate=epsilon_decay_rate)
+
+def warmup_states(envs, steps, rng, seed=None):
+    # States visited in a short exploratory rollout, for the quantile edges
+    states = [envs.reset(seed=seed)[0]]
+    for _ in range(steps):
+        # Half of the actions push in the direction the car moves, so the rollout also reaches the hill tops
+        push = np.where(states[-1][:, 1] > 0, 2, 0)
+        actions = np.where(rng.random(envs.num_envs) < 0.5, push, rng.integers(0, envs.single_action_space.n, size=envs.num_envs))
+        states.append(envs.step(actions)[0])
+    return np.concatenate(states)
+
+def run_batch(episodes, num_envs=256, discretization='uniform', num_tilings=8, warmup_steps=200, seed=None):
+    print(f"Training for {episodes} episodes with {num_envs} cars in parallel ({discretization} discretization)...")
+
+    # Episodes end when the goal is reached or after 1000 steps (same as the rewards>-1000 cut-off in run)
+    envs = gym.make_vec('MountainCar-v0', num_envs=num_envs, max_episode_steps=1000)
+    rng = np.random.default_rng(seed)   # random number generator, seed=None for a different run every time
+
+    # Divide position and velocity into segments
+    low, high = envs.single_observation_space.low, envs.single_observation_space.high    # Between -1.2 and 0.6, -0.07 and 0.07
+    samples = warmup_states(envs, warmup_steps, rng, seed) if discretization == 'quantile' else None
+    discretizer = make_discretizer(discretization, low, high, samples, num_tilings)
+
+    q = np.zeros((discretizer.n, envs.single_action_space.n)) # one row per cell (or tile)
+
+    # alpha or learning rate, smaller with tile coding where every update also moves the neighbouring states
+    learning_rate_a = 0.2 if isinstance(discretizer, TileCoder) else 0.9
+    # gamma or discount factor. Tile coding needs the longer horizon: with 0.9 the generalization wipes out the
+    # optimistic zero start of the Q-table and the greedy policy often gets stuck far from the goal
+    discount_factor_g = 0.99 if isinstance(discretizer, TileCoder) else 0.9
+
+    epsilon = 1         # 1 = 100% random actions
+    epsilon_decay_rate = 2/episodes # epsilon decay rate, applied once per finished episode
+
+    metrics = MetricsLog('mountain_car.csv', name='reward', window=100)
+    episode_rewards = np.zeros(num_envs)    # running reward of the current episode of every car
+    finished = 0
+
+    # The vector env resets a car on the step after it finished, that transition must not be learned from
+    autoreset = np.zeros(num_envs, dtype=bool)
+
+    start_time = time.perf_counter()
+
+    states = envs.reset(seed=seed)[0]
+    cells = active_cells(discretizer, states)    # (num_envs, active cells per state)
 
-    mean_rewards = np.zeros(episodes)
-    for t in range(episodes):
-        mean_rewards[t] = np.mean(rewards_per_episode[max(0, t-100):(t+1)])
-    plt.plot(mean_rewards)
-    plt.savefig(f'mountain_car.png')
+    while finished < episodes:
+        explore = rng.random(num_envs) < epsilon
+        actions = np.where(
+            explore,
+            rng.integers(0, envs.single_action_space.n, size=num_envs),
+            np.argmax(q[cells].sum(axis=1), axis=1),
+        )
+
+        new_states, rewards, terminated, truncated, _ = envs.step(actions)
+        new_cells = active_cells(discretizer, new_states)
+
+        # Scatter-add the TD errors so cars visiting the same cell all contribute to the update,
+        # averaged per cell so that many cars in one cell do not overshoot the learning rate.
+        # With tile coding every active tile takes its 1/num_tilings share of the error.
+        learn = ~autoreset
+        c, a = cells[learn], actions[learn]
+        td_error = rewards[learn] + discount_factor_g*np.max(q[new_cells[learn]].sum(axis=1), axis=1) - q[c, a[:, None]].sum(axis=1)
+        td_sum = np.zeros_like(q)
+        visits = np.zeros_like(q)
+        np.add.at(td_sum, (c, a[:, None]), td_error[:, None])
+        np.add.at(visits, (c, a[:, None]), 1)
+        q += learning_rate_a / cells.shape[1] * td_sum / np.maximum(visits, 1)
+
+        episode_rewards[learn] += rewards[learn]
+
+        done = np.logical_or(terminated, truncated)
+        done_rewards = episode_rewards[done][:episodes - finished]
+        metrics.extend(done_rewards)
+        finished += len(done_rewards)
+        episode_rewards[done] = 0
+
+        epsilon = max(epsilon - epsilon_decay_rate * len(done_rewards), 0)
+
+        autoreset = done
+        cells = new_cells
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Finished {episodes} episodes in {elapsed:.2f}s ({episodes / elapsed:.1f} episodes/sec)")
+
+    envs.close()
+    metrics.close()
+
+    # Save Q table to file
+    save(q, discretizer, episodes, learning_rate_a=learning_rate_a, discount_factor_g=discount_factor_g,
+         epsilon_decay_rate=epsilon_decay_rate, num_envs=num_envs, seed=seed)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Car Agent Runner")
     parser.add_argument('--train', action='store_true', help='Run in training mode')
     parser.add_argument('--episodes', type=int, default=10, help='Number of episodes to run')
     parser.add_argument('--render', action='store_true', help='Render the environment')
+    parser.add_argument('--num-envs', type=int, default=1, help='Number of cars trained in parallel (batched training when > 1)')
+    parser.add_argument('--discretization', choices=['uniform', 'quantile', 'tiles'], default=None,
+                        help='Batched training: uniform 20x20 grid (default), quantile edges from a warmup rollout, or tile coding')
+    parser.add_argument('--tilings', type=int, default=None, help='Number of offset tilings (--discretization tiles, default 8)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the batched training (default: a different run every time)')
 
     args = parser.parse_args()
+    batched = args.train and args.num_envs > 1
+
+    # Only the batched training chooses the discretizer, run() always trains the uniform grid
+    # (evaluation rebuilds the discretizer from the checkpoint header)
+    batch_options = [name for name, value in [('--discretization', args.discretization), ('--tilings', args.tilings),
+                                              ('--seed', args.seed)] if value is not None]
+    if batch_options and not batched:
+        parser.error(f"{', '.join(batch_options)}: only used by batched training (--train --num-envs > 1)")
+    if args.tilings is not None and args.discretization != 'tiles':
+        parser.error("--tilings only applies to --discretization tiles")
+
+    if batched:
+        run_batch(args.episodes, num_envs=args.num_envs, discretization=args.discretization or 'uniform',
+                  num_tilings=args.tilings or 8, seed=args.seed)
+    else:
+        run(args.episodes, is_training=args.train, render=args.render)
 
-    run(args.episodes, is_training=args.train, render=args.render)
+    # Plotted once here rather than in run / run_batch, so training code never parses the log or imports matplotlib
+    plot('mountain_car.csv', 'mountain_car.png')
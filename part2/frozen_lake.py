@@ -1,39 +1,73 @@
+import os
+import sys
 import gymnasium as gym
 import numpy as np
-import matplotlib.pyplot as plt
-import pickle
+import time
+from planning import value_iteration
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from checkpoint import load_q_table, save_q_table
+from metrics import MetricsLog, RollingWindow, plot   # shared with part1, matplotlib is only imported when plotting (from __main__)
 
-def print_success_rate(rewards_per_episode):
+
+def print_success_rate(success_count, total_episodes):
     """Calculate and print the success rate of the agent."""
-    total_episodes = len(rewards_per_episode)
-    success_count = np.sum(rewards_per_episode)
     success_rate = (success_count / total_episodes) * 100
     print(f"✅ Success Rate: {success_rate:.2f}% ({int(success_count)} / {total_episodes} episodes)")
     return success_rate
 
-def run(episodes, is_training=True, render=False):
+def solve(discount_factor_g=0.99):
+    """Compute the optimal Q-table from the env's transition table P with value iteration and save it."""
+    env = gym.make('FrozenLake-v1', map_name="8x8", is_slippery=True)
+
+    start_time = time.perf_counter()
+    q = value_iteration(env.unwrapped.P, discount_factor_g)
+    print(f"Solved with value iteration in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    env.close()
+
+    save_q_table('frozen_lake8x8.npy', q, 'FrozenLake-v1', map_name='8x8', solver='value_iteration',
+                 hyperparameters=dict(discount_factor_g=discount_factor_g))
+
+# learning_rate_a: alpha or learning rate
+# discount_factor_g: gamma or discount rate. Near 0: more weight/reward placed on immediate state. Near 1: more on future state.
+# epsilon_decay_rate: epsilon decay rate. 1/0.0001 = 10,000
+# metrics_path: CSV log of every episode (success and rolling success rate of the last 100), None to keep no log
+# save_min_successes: the best Q-table is only saved once at least this many of the last 500 episodes succeeded, 0 always keeps the best one
+# Returns the highest success count over the last 500 episodes seen during training and the number of episodes run
+def run(episodes, is_training=True, render=False, warm_start=False,
+        learning_rate_a=0.03, discount_factor_g=0.99, epsilon_decay_rate=0.0000925,
+        seed=None, model_path='frozen_lake8x8.npy', metrics_path='frozen_lake8x8.csv',
+        save_min_successes=300, verbose=True):
 
     env = gym.make('FrozenLake-v1', map_name="8x8", is_slippery=True, render_mode='human' if render else None)
+    env.action_space.seed(seed)
 
     if(is_training):
-        q = np.zeros((env.observation_space.n, env.action_space.n)) # init a 64 x 4 array
+        if warm_start:
+            q = value_iteration(env.unwrapped.P, discount_factor_g) # start from the exact solution instead of zeros
+        else:
+            q = np.zeros((env.observation_space.n, env.action_space.n)) # init a 64 x 4 array
     else:
-        f = open('frozen_lake8x8.pkl', 'rb')
-        q = pickle.load(f)
-        f.close()
+        q, _ = load_q_table(model_path)   # memory-mapped, read only
 
-    learning_rate_a = 0.03 # alpha or learning rate
-    discount_factor_g = 0.99 # gamma or discount rate. Near 0: more weight/reward placed on immediate state. Near 1: more on future state.
     epsilon = 1         # 1 = 100% random actions
-    epsilon_decay_rate = 0.0000925        # epsilon decay rate. 1/0.0001 = 10,000
-    rng = np.random.default_rng()   # random number generator
+    alpha = learning_rate_a   # learning rate actually used, lowered once epsilon reaches 0 (learning_rate_a stays the configured one)
+    rng = np.random.default_rng(seed)   # random number generator
+
+    # Successes are streamed to the log, the rolling windows keep the last 1000 / 500 in O(1) per episode
+    metrics = MetricsLog(metrics_path, name='success', window=100)
+    last_1000 = RollingWindow(1000)
+    last_500 = RollingWindow(500)
+    total_successes = 0
+    best_success_count = -1   # below any count, so with save_min_successes=0 the first window is saved too
+    max_success_count = 0
 
-    rewards_per_episode = np.zeros(episodes)
-    best_success_count = 0
+    episodes_run = 0
 
     for i in range(episodes):
-        state = env.reset()[0]  # states: 0 to 63, 0=top left corner,63=bottom right corner
+        episodes_run = i + 1
+        state = env.reset(seed=seed if i == 0 else None)[0]  # states: 0 to 63, 0=top left corner,63=bottom right corner
         terminated = False      # True when fall in hole or reached goal
         truncated = False       # True when actions > 200
 
@@ -52,7 +86,7 @@ def run(episodes, is_training=True, render=False):
                 reward = -0.2
 
             if is_training:
-                q[state,action] = q[state,action] + learning_rate_a * (
+                q[state,action] = q[state,action] + alpha * (
                     reward + discount_factor_g * np.max(q[new_state,:]) - q[state,action]
                 )
 
@@ -61,13 +95,16 @@ def run(episodes, is_training=True, render=False):
         epsilon = max(epsilon - epsilon_decay_rate, 0)
 
         if(epsilon==0):
-            learning_rate_a = 0.0001
+            alpha = 0.0001
 
-        if reward == 1:
-            rewards_per_episode[i] = 1
+        success = 1 if reward == 1 else 0
+        total_successes += success
+        metrics.add(success)
+        last_1000.push(success)
+        last_500.push(success)
 
-        if is_training and (i + 1) % 1000 == 0:
-            successes = np.sum(rewards_per_episode[max(0, i-999):i+1])
+        if verbose and is_training and (i + 1) % 1000 == 0:
+            successes = last_1000.sum
             print(f"Episode {i+1}/{episodes}, Epsilon: {epsilon:.4f}, Successes (last 1000): {int(successes)}")
 
             #條 learning rate 反而讓後面學不上去，這個沒甚麼用
@@ -77,29 +114,30 @@ def run(episodes, is_training=True, render=False):
 
         # 修改：將評估區間從 100 拉長到 500，避免因為短期運氣好 (Variance) 而存到虛高的模型
         if is_training and i >= 500:
-            current_success_count = np.sum(rewards_per_episode[i-499:i+1])
+            current_success_count = last_500.sum
+            max_success_count = max(max_success_count, current_success_count)
             
-            # 備份機制：如果最近 500 次成功超過 300 次 (60%)，且比之前的紀錄好，就先存起來
-            if current_success_count > best_success_count and current_success_count >= 300:
+            # 備份機制：如果最近 500 次成功超過 save_min_successes 次 (預設 300 次 = 60%)，且比之前的紀錄好，就先存起來
+            if current_success_count > best_success_count and current_success_count >= save_min_successes:
                 best_success_count = current_success_count
-                with open('frozen_lake8x8.pkl', 'wb') as f:
-                    pickle.dump(q, f)
-                print(f"New best model saved! Success count (last 500): {int(best_success_count)}")
+                # Written to a temporary file and renamed, a reader never sees a half-written table
+                save_q_table(model_path, q, 'FrozenLake-v1', map_name='8x8', episodes=i + 1,
+                             hyperparameters=dict(learning_rate_a=learning_rate_a, discount_factor_g=discount_factor_g,
+                                                  epsilon_decay_rate=epsilon_decay_rate, seed=seed),
+                             current_learning_rate_a=alpha)
+                if verbose:
+                    print(f"New best model saved! Success count (last 500): {int(best_success_count)}")
 
             if current_success_count >= 400: # 80% of 500
-                print(f"Training stopped early at episode {i+1}: Last 500 episodes reached 80% success rate.")
+                if verbose:
+                    print(f"Training stopped early at episode {i+1}: Last 500 episodes reached 80% success rate.")
                 break
 
     env.close()
+    metrics.close()
 
-    sum_rewards = np.zeros(episodes)
-    for t in range(episodes):
-        sum_rewards[t] = np.sum(rewards_per_episode[max(0, t-100):(t+1)])
-    plt.plot(sum_rewards)
-    plt.savefig('frozen_lake8x8.png')
-    
     if is_training == False:
-        print(print_success_rate(rewards_per_episode))
+        print(print_success_rate(total_successes, episodes_run))
 
     # 註解掉最後的強制存檔，避免「最後的結果」(可能較差) 覆蓋掉中間存的「最佳結果」
     # if is_training:
@@ -107,9 +145,18 @@ def run(episodes, is_training=True, render=False):
     #     pickle.dump(q, f)
     #     f.close()
 
+    return max_success_count, episodes_run
+
 if __name__ == '__main__':
-    mode = input("Input 0 for training, 1 for testing: ")
+    mode = input("Input 0 for training, 1 for testing, 2 for solving with value iteration: ")
     if mode == '0':
         run(15000, is_training=True, render=False)
     elif mode == '1':
         run(1000, is_training=False, render=False)
+    elif mode == '2':
+        solve()
+        run(1000, is_training=False, render=False)
+
+    # Plotted once here rather than in run, so training (and every sweep trial) never parses the log or imports matplotlib
+    if mode in ('0', '1', '2'):
+        plot('frozen_lake8x8.csv', 'frozen_lake8x8.png')
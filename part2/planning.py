@@ -0,0 +1,82 @@
+import numpy as np
+from gymnasium.envs.toy_text.utils import TransitionTable
+
+
+def compile_transitions(P, sparse=False):
+    """Compile a toy_text ``P[s][a] = [(prob, next_state, reward, terminated), ...]`` table into NumPy arrays.
+
+    Returns the expected immediate reward of every (state, action) pair, shape (S, A), together with
+    the transitions that continue the episode. Transitions that terminate the episode do not bootstrap,
+    so their probability is left out of the transitions.
+
+    Dense: transitions is a (S, A, S) array of probabilities.
+    Sparse: transitions is a pair of (S, A, K) arrays (probs, next_states), K being the most outcomes of any pair.
+    """
+    table = TransitionTable(P)
+    rewards = np.sum(table.probs * table.rewards, axis=2)
+    probs = np.where(table.terminated, 0.0, table.probs)
+
+    if sparse:
+        return rewards, (probs, table.next_states)
+
+    n_states, n_actions, _ = probs.shape
+    transitions = np.zeros((n_states, n_actions, n_states))
+    s, a, _ = np.indices(probs.shape)
+    np.add.at(transitions, (s, a, table.next_states), probs)
+    return rewards, transitions
+
+
+def backup(rewards, transitions, v, discount_factor_g):
+    """One Bellman backup for every (state, action) pair at once, returns the (S, A) Q-table."""
+    if isinstance(transitions, tuple):
+        probs, next_states = transitions
+        return rewards + discount_factor_g * np.sum(probs * v[next_states], axis=2)
+    return rewards + discount_factor_g * (transitions @ v)
+
+
+def value_iteration(P, discount_factor_g=0.99, tol=1e-8, max_iterations=100000, sparse=False):
+    """Solve a toy_text env exactly with value iteration, returns the (S, A) Q-table of the optimal policy."""
+    rewards, transitions = compile_transitions(P, sparse=sparse)
+    v = np.zeros(rewards.shape[0])
+
+    for _ in range(max_iterations):
+        q = backup(rewards, transitions, v, discount_factor_g)
+        new_v = np.max(q, axis=1)
+        delta = np.max(np.abs(new_v - v))
+        v = new_v
+        if delta < tol:
+            break
+
+    return backup(rewards, transitions, v, discount_factor_g)
+
+
+def policy_iteration(P, discount_factor_g=0.99, tol=1e-8, max_iterations=1000, max_evaluation_iterations=100000,
+                     sparse=False):
+    """Solve a toy_text env exactly with policy iteration, returns the (S, A) Q-table of the optimal policy.
+
+    Every policy evaluation runs at most max_evaluation_iterations backups, like value_iteration.
+    """
+    rewards, transitions = compile_transitions(P, sparse=sparse)
+    n_states = rewards.shape[0]
+    states = np.arange(n_states)
+    v = np.zeros(n_states)
+    policy = np.zeros(n_states, dtype=np.int64)
+
+    for _ in range(max_iterations):
+        # Policy evaluation: iterate the Bellman expectation backup of the current policy until it converges
+        for _ in range(max_evaluation_iterations):
+            new_v = backup(rewards, transitions, v, discount_factor_g)[states, policy]
+            delta = np.max(np.abs(new_v - v))
+            v = new_v
+            if delta < tol:
+                break
+
+        # Policy improvement: only switch actions that are better by more than the tolerance, so ties do not cycle
+        q = backup(rewards, transitions, v, discount_factor_g)
+        new_policy = np.argmax(q, axis=1)
+        improved = q[states, new_policy] > q[states, policy] + tol
+        if not np.any(improved):
+            break
+        policy = np.where(improved, new_policy, policy)
+
+    return backup(rewards, transitions, v, discount_factor_g)
@@ -0,0 +1,118 @@
+#Hyperparameter sweep for the Frozen Lake Q-learning agent, every trial runs in its own process
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from checkpoint import remove_checkpoint
+from frozen_lake import run
+
+# Default search space, centered on the hand-tuned values in frozen_lake.run
+GRID = {
+    'learning_rate_a': [0.01, 0.03, 0.1],
+    'discount_factor_g': [0.95, 0.99, 0.999],
+    'epsilon_decay_rate': [0.00005, 0.0000925, 0.0002],
+}
+RANGES = {
+    'learning_rate_a': (0.005, 0.2),            # sampled log-uniformly
+    'discount_factor_g': (0.9, 0.999),
+    'epsilon_decay_rate': (0.00003, 0.0003),    # sampled log-uniformly
+}
+LOG_SCALE = {'learning_rate_a', 'epsilon_decay_rate'}
+
+FIELDS = ['trial', 'learning_rate_a', 'discount_factor_g', 'epsilon_decay_rate', 'seed',
+          'best_success_rate', 'episodes_run', 'seconds', 'model_path']
+
+
+def grid_configs(grid, seeds):
+    """Every combination of the grid values, once per seed."""
+    keys = list(grid)
+    return [
+        dict(zip(keys, values), seed=seed)
+        for values in itertools.product(*(grid[k] for k in keys))
+        for seed in seeds
+    ]
+
+def random_configs(ranges, n_trials, seeds, sweep_seed=None):
+    """n_trials configurations sampled from the ranges, once per seed."""
+    rng = np.random.default_rng(sweep_seed)
+    configs = []
+    for _ in range(n_trials):
+        config = {}
+        for key, (low, high) in ranges.items():
+            if key in LOG_SCALE:
+                config[key] = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+            else:
+                config[key] = float(rng.uniform(low, high))
+        configs.extend(dict(config, seed=seed) for seed in seeds)
+    return configs
+
+def run_trial(trial, config, episodes, out_dir):
+    """Train one configuration, the best Q-table of the trial is saved next to the results."""
+    model_path = os.path.join(out_dir, f'trial_{trial:04d}.npy')
+    remove_checkpoint(model_path)   # left over from an earlier sweep into the same directory
+    start_time = time.perf_counter()
+    # Early stopping and best-model checkpointing use the rolling-500 success count of run,
+    # save_min_successes=0 keeps the best Q-table of every trial, not only of those reaching 60%
+    max_success_count, episodes_run = run(
+        episodes, is_training=True, model_path=model_path, metrics_path=None, save_min_successes=0,
+        verbose=False, **config
+    )
+    return dict(
+        config,
+        trial=trial,
+        best_success_rate=max_success_count / 500,
+        episodes_run=episodes_run,
+        seconds=round(time.perf_counter() - start_time, 2),
+        model_path=model_path if os.path.exists(model_path) else '',
+    )
+
+def sweep(configs, episodes, out_dir='sweep', max_workers=None):
+    """Run all configurations over a process pool, streaming each finished trial to out_dir/results.csv."""
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+
+    with open(os.path.join(out_dir, 'results.csv'), 'w', newline='') as f, \
+            ProcessPoolExecutor(max_workers=max_workers) as executor:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+
+        futures = [executor.submit(run_trial, trial, config, episodes, out_dir) for trial, config in enumerate(configs)]
+        for future in as_completed(futures):
+            result = future.result()
+            writer.writerow(result)
+            f.flush()
+            results.append(result)
+            print(f"[{len(results)}/{len(configs)}] trial {result['trial']}: "
+                  f"best success rate {result['best_success_rate']:.1%} after {result['episodes_run']} episodes")
+
+    best = max(results, key=lambda r: r['best_success_rate'])
+    print(f"Best trial {best['trial']}: {best['best_success_rate']:.1%} with "
+          f"alpha={best['learning_rate_a']}, gamma={best['discount_factor_g']}, "
+          f"epsilon decay={best['epsilon_decay_rate']}, seed={best['seed']} ({best['model_path']})")
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Frozen Lake hyperparameter sweep")
+    parser.add_argument('--search', choices=['grid', 'random'], default='grid', help='Grid or random search')
+    parser.add_argument('--trials', type=int, default=20, help='Number of random configurations (random search)')
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0], help='Seeds every configuration is trained with')
+    parser.add_argument('--episodes', type=int, default=15000, help='Maximum episodes per trial')
+    parser.add_argument('--workers', type=int, default=None, help='Number of processes (default: all cores)')
+    parser.add_argument('--out', default='sweep', help='Directory for results.csv and the Q-tables')
+
+    args = parser.parse_args()
+
+    if args.search == 'grid':
+        configs = grid_configs(GRID, args.seeds)
+    else:
+        configs = random_configs(RANGES, args.trials, args.seeds)
+
+    sweep(configs, args.episodes, out_dir=args.out, max_workers=args.workers)
@@ -1,248 +1,150 @@
-import random
+'''
+Dino Fighter Ultimate - 畫面與真人遊玩 (Rendering & Human Play)
+檔案名稱: dino.py
+
+遊戲邏輯在 dino_core.py (沒有 pygame)，這裡只負責「畫出來」：
+粒子特效、每種物件的畫法、HUD，以及鍵盤遊玩的主迴圈。
+'''
 import sys
 import pygame
-import math
-from enum import Enum
-
-# --- 基礎設定 ---
-class Action(Enum):
-    RUN = 0
-    JUMP = 1
-    SHOOT = 2
-    DROP = 3
-
-# 調色盤 (省略...)
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 50, 50)       
-SKY_BLUE = (240, 248, 255)
-UI_DARK = (40, 44, 52)
-HEART_RED = (220, 20, 60)
-AMMO_GOLD = (255, 215, 0)
-
-DINO_COLOR = (80, 80, 80)
-BULLET_COLOR = (255, 140, 0)
-CACTUS_COLOR = (34, 139, 34)
-BIRD_COLOR = (70, 130, 180)
-BAT_COLOR = (75, 0, 130)
 
-# --- 1. 粒子系統 ---
+import numpy as np
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(4, 7)
-        self.life = random.randint(20, 40)
-        angle = random.uniform(0, 6.28)
-        speed = random.uniform(2, 6)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
-        self.size *= 0.95
-
-    def draw(self, surface):
-        if self.life > 0 and self.size > 1:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.size))
+from dino_core import (
+    Action, WHITE, RED, SKY_BLUE, UI_DARK, HEART_RED, AMMO_GOLD,
+    Bullet, Cactus, Bird, Bat, HealthPack, DinoSimulation,
+)
 
+# --- 1. 粒子系統 ---
+# 粒子只是視覺效果，用自己的亂數產生器，
+# 不會動到模擬的 Generator，有沒有開畫面，同一個 seed 都會跑出同一場遊戲。
+
+# ### [OOP] 封裝 (Encapsulation)
+# 所有粒子存在固定容量的 NumPy 陣列裡 (位置、速度、壽命、大小、顏色)，
+# 發射不會建立新物件，每一幀用一次陣列運算更新全部，
+# 再用 surface.blits 一次貼上預先畫好的圓形小圖。
 class ParticleSystem:
-    def __init__(self):
-        # ### [OOP] 組合 (Composition)
-        # ParticleSystem "擁有" 多個 Particle 物件。
-        self.particles = []
+    def __init__(self, capacity=1024):
+        self.n = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int64)
+        self.size = np.zeros(capacity)
+        self.color = np.zeros(capacity, dtype=np.int64)    # 顏色在 colors 裡的編號
+        self.colors = {}
+        self.sprites = []       # sprites[顏色編號][半徑]
+        self.rng = np.random.default_rng()
+
+    def _color_id(self, color):
+        if color not in self.colors:
+            self.colors[color] = len(self.sprites)
+            sprites = []
+            for radius in range(8):  # 粒子最大 7，之後只會縮小
+                sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, (radius, radius), radius)
+                sprites.append(sprite)
+            self.sprites.append(sprites)
+        return self.colors[color]
 
     def emit(self, x, y, color, count=10):
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+        count = min(count, len(self.x) - self.n)    # 滿了就不再發射
+        new = slice(self.n, self.n + count)
+        angle = self.rng.uniform(0, 6.28, count)
+        speed = self.rng.uniform(2, 6, count)
+        self.x[new], self.y[new] = x, y
+        self.vx[new] = np.cos(angle) * speed
+        self.vy[new] = np.sin(angle) * speed
+        self.size[new] = self.rng.integers(4, 8, count)
+        self.life[new] = self.rng.integers(20, 41, count)
+        self.color[new] = self._color_id(color)
+        self.n += count
+
+    def clear(self):
+        self.n = 0
 
     def update_and_draw(self, surface):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for p in self.particles:
-            p.update()
-            p.draw(surface)
-
-# --- 2. 核心 OOP 架構 ---
-
-# ### [OOP] 基礎類別 (Base Class)
-# 定義所有遊戲物件共有的屬性 (x, y, w, h) 和行為 (draw, collides_with)。
-# 這符合 "Don't Repeat Yourself" (DRY) 原則。
-class GameObject:
-    def __init__(self, x, y, w, h, color):
-        self.x = x
-        self.y = y
-        self.w = w
-        self.h = h
-        self.color = color
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.w, self.h))
-
-    # ### [OOP] 共用邏輯
-    # 所有繼承 GameObject 的子類別 (Dino, Bullet, Obstacle) 自動擁有此功能，
-    # 不需要重複寫碰撞偵測代碼。
-    def collides_with(self, other):
-        return (self.x < other.x + other.w and
-                self.x + self.w > other.x and
-                self.y < other.y + other.h and
-                self.y + self.h > other.y)
-
-
-# ### [OOP] 繼承 (Inheritance)
-# Bullet 繼承自 GameObject，自動獲得 x, y, w, h 等屬性。
-class Bullet(GameObject):
-    def __init__(self, x, y):
-        super().__init__(x, y, 15, 6, BULLET_COLOR)
-        self.speed = 15
-
-    def move(self):
-        self.x += self.speed
-    
-    # ### [OOP] 多型 (Polymorphism) - 覆寫 (Override)
-    # 子類別重新定義了父類別的 draw 方法。
-    # 這裡將矩形改為圓角矩形，表現出與一般 GameObject 不同的行為。
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.w, self.h), border_radius=3)
-
-
-# ### [OOP] 繼承 (Inheritance)
-class Dino(GameObject):
-    def __init__(self):
-        super().__init__(50, 250, 40, 40, DINO_COLOR)
-        self.is_jumping = False
-        self.jump_velocity = 0
-        self.gravity = 2.0      
-        self.jump_strength = -25
-        self.base_y = 250
-        # ### [OOP] 封裝 (Encapsulation) - 數據保護
-        # hp 和 invincible_timer 是物件內部的狀態，
-        # 不應該由外部直接修改 (例如不要在外面寫 dino.hp -= 1)。
-        self.max_hp = 3
-        self.hp = self.max_hp
-        self.invincible_timer = 0 
-
-    def update(self):
-        self.y += self.jump_velocity
-        if self.y < self.base_y:
-            self.jump_velocity += self.gravity
-            self.is_jumping = True
-        else:
-            self.y = self.base_y
-            self.jump_velocity = 0
-            self.is_jumping = False
-        
-        if self.invincible_timer > 0:
-            self.invincible_timer -= 1
-
-    def jump(self):
-        if not self.is_jumping:
-            self.jump_velocity = self.jump_strength
-
-    def fast_drop(self):
-        if self.is_jumping:
-            self.jump_velocity = 20 
-
-    # ### [OOP] 封裝 (Encapsulation) - 行為控制
-    # 外部透過此方法與 Dino 互動。
-    # 這個方法內部處理了「無敵時間」的邏輯判斷，外部呼叫者不需要知道細節，
-    # 只要知道「呼叫此函數嘗試扣血」即可。
-    def take_damage(self):
-        if self.invincible_timer == 0:
-            self.hp -= 1
-            self.invincible_timer = 45 
-            return True
-        return False
-    
-    # ### [OOP] 封裝 (Encapsulation)
-    # 同樣的，補血邏輯 (不能超過上限) 被封裝在這裡。
-    def heal(self):
-        if self.hp < self.max_hp:
-            self.hp += 1
-            return True
-        return False
-
-    # ### [OOP] 多型 (Polymorphism) - 覆寫
-    # Dino 的畫法包含閃爍效果 (無敵時間) 和眼睛繪製，與父類別不同。
-    def draw(self, surface):
-        if self.invincible_timer > 0 and self.invincible_timer % 4 < 2: return
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.w, self.h))
-        pygame.draw.rect(surface, self.color, (self.x + 20, self.y - 15, 25, 25)) 
-        pygame.draw.circle(surface, WHITE, (self.x + 35, self.y - 8), 3) 
-        pygame.draw.rect(surface, self.color, (self.x + 5, self.y + self.h, 8, 8)) 
-        pygame.draw.rect(surface, self.color, (self.x + 25, self.y + self.h, 8, 8)) 
-
-# --- 3. 障礙物體系 ---
-
-# ### [OOP] 中層抽象 (Abstraction)
-# Obstacle 繼承 GameObject，並增加了 speed 和 shootable 屬性。
-# 它作為所有具體障礙物 (Cactus, Bird, Bat) 的父類別。
-class Obstacle(GameObject):
-    def __init__(self, x, y, w, h, color, speed, shootable):
-        super().__init__(x, y, w, h, color)
-        self.speed = speed
-        self.shootable = shootable
-
-    def move(self, speed_multiplier):
-        self.x -= self.speed * speed_multiplier
-
-
-# ### [OOP] 多層繼承 (Multilevel Inheritance)
-# Cactus -> Obstacle -> GameObject
-class Cactus(Obstacle):
-    def __init__(self, start_x):
-        super().__init__(start_x, 250, 25, 45, CACTUS_COLOR, 7, False)
-    
-    # ### [OOP] 多型 - 具體實作
-    # 仙人掌有自己獨特的形狀繪製方式。
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, (self.x + 8, self.y, 10, self.h), border_radius=3)
-        pygame.draw.rect(surface, self.color, (self.x, self.y + 10, 26, 8), border_radius=3)
-        pygame.draw.rect(surface, self.color, (self.x, self.y + 5, 8, 15), border_radius=3)
-        pygame.draw.rect(surface, self.color, (self.x + 18, self.y + 5, 8, 15), border_radius=3)
-
-class Bird(Obstacle):
-    def __init__(self, start_x):
-        rand_y = random.randint(150, 230) 
-        super().__init__(start_x, rand_y, 35, 25, BIRD_COLOR, 9, True)
-    
-    # ### [OOP] 多型 - 具體實作
-    def draw(self, surface):
-        pygame.draw.ellipse(surface, self.color, (self.x, self.y, self.w, self.h))
-        pygame.draw.polygon(surface, WHITE, [(self.x+10, self.y+10), (self.x+20, self.y-10), (self.x+25, self.y+10)])
-        pygame.draw.polygon(surface, AMMO_GOLD, [(self.x, self.y+10), (self.x-8, self.y+13), (self.x, self.y+16)])
-
-class Bat(Obstacle):
-    def __init__(self, start_x):
-        rand_y = random.randint(200, 250) 
-        super().__init__(start_x, rand_y, 30, 20, BAT_COLOR, 11, True)
-    
-    # ### [OOP] 多型 - 具體實作
-    def draw(self, surface):
-        center = (self.x + 15, self.y + 10)
-        pygame.draw.circle(surface, self.color, center, 10)
-        pygame.draw.polygon(surface, self.color, [(self.x+15, self.y+10), (self.x-5, self.y-5), (self.x+5, self.y+15)])
-        pygame.draw.polygon(surface, self.color, [(self.x+15, self.y+10), (self.x+35, self.y-5), (self.x+25, self.y+15)])
-
-
-#補包的部分
-class HealthPack(Obstacle):
-    def __init__(self, start_x):
-        rand_y = random.randint(180, 240)
-        super().__init__(start_x, rand_y, 30, 30, WHITE, 9, False) 
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, WHITE, (self.x, self.y, self.w, self.h), border_radius=5)
-        pygame.draw.rect(surface, RED, (self.x, self.y, self.w, self.h), 2, border_radius=5)
-        cx, cy = self.x + 15, self.y + 15
-        pygame.draw.rect(surface, RED, (cx - 4, cy - 10, 8, 20))
-        pygame.draw.rect(surface, RED, (cx - 10, cy - 4, 20, 8))
-
-
-# --- 4. 介面管理 ---
+        # 移除死掉的粒子 (往前壓縮)
+        alive = (self.life[:self.n] > 0).nonzero()[0]
+        if len(alive) < self.n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.size, self.color):
+                arr[:len(alive)] = arr[alive]
+            self.n = len(alive)
+        n = self.n
+        if n == 0: return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+        self.size[:n] *= 0.95
+
+        visible = ((self.life[:n] > 0) & (self.size[:n] > 1)).nonzero()[0]
+        radius = self.size[visible].astype(np.int64)
+        left = self.x[visible].astype(np.int64) - radius
+        top = self.y[visible].astype(np.int64) - radius
+        sprites = self.sprites
+        surface.blits(
+            [(sprites[c][r], (px, py)) for c, r, px, py in
+             zip(self.color[visible].tolist(), radius.tolist(), left.tolist(), top.tolist())],
+            doreturn=False,
+        )
+
+# --- 2. 物件畫法 ---
+# 子彈和障礙物存在 ObjectPool 的陣列裡，畫的時候只需要位置 (x, y)，大小和顏色由種類決定。
+
+# ### [OOP] 多型 (Polymorphism)
+# 子彈畫成圓角矩形。
+def draw_bullet(surface, x, y):
+    pygame.draw.rect(surface, Bullet.color, (x, y, Bullet.w, Bullet.h), border_radius=3)
+
+# Dino 的畫法包含閃爍效果 (無敵時間) 和眼睛繪製。
+def draw_dino(surface, dino):
+    if dino.invincible_timer > 0 and dino.invincible_timer % 4 < 2: return
+    pygame.draw.rect(surface, dino.color, (dino.x, dino.y, dino.w, dino.h))
+    pygame.draw.rect(surface, dino.color, (dino.x + 20, dino.y - 15, 25, 25))
+    pygame.draw.circle(surface, WHITE, (dino.x + 35, dino.y - 8), 3)
+    pygame.draw.rect(surface, dino.color, (dino.x + 5, dino.y + dino.h, 8, 8))
+    pygame.draw.rect(surface, dino.color, (dino.x + 25, dino.y + dino.h, 8, 8))
+
+# 仙人掌有自己獨特的形狀繪製方式。
+def draw_cactus(surface, x, y):
+    color = Cactus.color
+    pygame.draw.rect(surface, color, (x + 8, y, 10, Cactus.h), border_radius=3)
+    pygame.draw.rect(surface, color, (x, y + 10, 26, 8), border_radius=3)
+    pygame.draw.rect(surface, color, (x, y + 5, 8, 15), border_radius=3)
+    pygame.draw.rect(surface, color, (x + 18, y + 5, 8, 15), border_radius=3)
+
+def draw_bird(surface, x, y):
+    pygame.draw.ellipse(surface, Bird.color, (x, y, Bird.w, Bird.h))
+    pygame.draw.polygon(surface, WHITE, [(x+10, y+10), (x+20, y-10), (x+25, y+10)])
+    pygame.draw.polygon(surface, AMMO_GOLD, [(x, y+10), (x-8, y+13), (x, y+16)])
+
+def draw_bat(surface, x, y):
+    color = Bat.color
+    pygame.draw.circle(surface, color, (x + 15, y + 10), 10)
+    pygame.draw.polygon(surface, color, [(x+15, y+10), (x-5, y-5), (x+5, y+15)])
+    pygame.draw.polygon(surface, color, [(x+15, y+10), (x+35, y-5), (x+25, y+15)])
+
+def draw_health_pack(surface, x, y):
+    w, h = HealthPack.w, HealthPack.h
+    pygame.draw.rect(surface, WHITE, (x, y, w, h), border_radius=5)
+    pygame.draw.rect(surface, RED, (x, y, w, h), 2, border_radius=5)
+    cx, cy = x + 15, y + 15
+    pygame.draw.rect(surface, RED, (cx - 4, cy - 10, 8, 20))
+    pygame.draw.rect(surface, RED, (cx - 10, cy - 4, 20, 8))
+
+# ### [OOP] 多型繪圖
+# 每種障礙物對應自己的畫法，renderer 只要用 type_code 查表，不需要 if/else 判斷是什麼。
+DRAW_OBSTACLE = {
+    Cactus.type_code: draw_cactus,
+    Bird.type_code: draw_bird,
+    Bat.type_code: draw_bat,
+    HealthPack.type_code: draw_health_pack,
+}
+
+
+# --- 3. 介面管理 ---
 # ### [OOP] 單一職責原則 (SRP)
 # 這個類別只負責「畫圖」，不負責遊戲邏輯 (例如不決定什麼時候扣血)。
 class UIManager:
@@ -250,17 +152,26 @@ class UIManager:
         self.width = width
         self.height = height
         self.font = font
-    
-    def draw_hud(self, surface, score, speed, hp, bullets_left):
-        # (繪製程式碼省略，這屬於封裝的實作細節)
+        # 文字和半透明遮罩畫過一次就存起來 (分數每 5 幀才變一次，不用每幀重新 render 字型)
+        self.text_cache = {}
+        self.overlays = {}
+
+    def text(self, text, color):
+        key = (text, color)
+        if key not in self.text_cache:
+            if len(self.text_cache) > 256: self.text_cache.clear()
+            self.text_cache[key] = self.font.render(text, True, color)
+        return self.text_cache[key]
+
+    # HUD 不會變的部分 (深色底條和分隔線)，只畫進背景圖層一次
+    def draw_hud_frame(self, surface):
         pygame.draw.rect(surface, UI_DARK, (0, 0, self.width, 50))
         pygame.draw.line(surface, WHITE, (0, 50), (self.width, 50), 2)
-        
-        score_text = self.font.render(f"SCORE: {int(score)}", True, WHITE)
-        surface.blit(score_text, (20, 15))
-        
-        speed_text = self.font.render(f"SPEED: x{speed:.1f}", True, AMMO_GOLD)
-        surface.blit(speed_text, (self.width // 2 - 50, 15))
+
+    def draw_hud(self, surface, score, speed, hp, bullets_left):
+        # (繪製程式碼省略，這屬於封裝的實作細節)
+        surface.blit(self.text(f"SCORE: {int(score)}", WHITE), (20, 15))
+        surface.blit(self.text(f"SPEED: x{speed:.1f}", AMMO_GOLD), (self.width // 2 - 50, 15))
 
         for i in range(hp):
             x = self.width - 140 + (i * 25)
@@ -270,183 +181,138 @@ class UIManager:
 
         for i in range(3):
             rect = (self.width - 140 + (i * 20), 42, 12, 5)
-            pygame.draw.rect(surface, (100, 100, 100), rect, 1) 
+            pygame.draw.rect(surface, (100, 100, 100), rect, 1)
             if i < bullets_left: pygame.draw.rect(surface, AMMO_GOLD, rect)
 
     def draw_screen(self, surface, title, subtitle, bg_color=(0,0,0,180)):
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(bg_color[3])
-        overlay.fill(bg_color[:3])
-        surface.blit(overlay, (0,0))
-        t_surf = self.font.render(title, True, WHITE)
-        s_surf = self.font.render(subtitle, True, AMMO_GOLD)
+        if bg_color not in self.overlays:
+            overlay = pygame.Surface((self.width, self.height))
+            overlay.set_alpha(bg_color[3])
+            overlay.fill(bg_color[:3])
+            self.overlays[bg_color] = overlay
+        surface.blit(self.overlays[bg_color], (0,0))
+        t_surf = self.text(title, WHITE)
+        s_surf = self.text(subtitle, AMMO_GOLD)
         t_rect = t_surf.get_rect(center=(self.width//2, self.height//2 - 20))
         s_rect = s_surf.get_rect(center=(self.width//2, self.height//2 + 20))
         surface.blit(t_surf, t_rect)
         surface.blit(s_surf, s_rect)
 
-# --- 5. 遊戲引擎 ---
-class DinoGame:
-    def __init__(self, width=700, height=350, fps=30):
-        self.width = width
-        self.height = height
-        self.fps = fps
-        self._init_pygame()
+# --- 4. 畫面 ---
+class DinoRenderer:
+    # render_mode='human' 畫到視窗並限制在 fps；
+    # render_mode='rgb_array' 畫到記憶體裡的 Surface (不開視窗、不限速)，render() 回傳 (H, W, 3) 的 uint8 陣列。
+    def __init__(self, game, render_mode='human', fps=30):
         # ### [OOP] 組合 (Composition)
-        # DinoGame 是一個容器，它組合了 UIManager, ParticleSystem。
-        self.ui = UIManager(width, height, self.font)
-        self.particles = ParticleSystem() 
-        self.state = 'WAITING' 
-        self.reset()
+        # Renderer 只「看」一場模擬 (DinoSimulation)，並組合了 UIManager, ParticleSystem。
+        # pygame 要等到第一次 render() 才會啟動。
+        self.game = game
+        self.render_mode = render_mode
+        self.fps = fps
+        self.window = None
+        self.particles = ParticleSystem()
+        game.record_effects = True
 
     def _init_pygame(self):
-        pygame.init()
-        pygame.display.set_caption("Dino Fighter Ultimate")
-        self.clock = pygame.time.Clock()
+        size = (self.game.width, self.game.height)
+        if self.render_mode == 'human':
+            pygame.init()
+            pygame.display.set_caption("Dino Fighter Ultimate")
+            self.clock = pygame.time.Clock()
+            self.window = pygame.display.set_mode(size)
+        else:
+            # 離線畫面只需要字型，不啟動顯示
+            pygame.font.init()
+            self.window = pygame.Surface(size)
         self.font = pygame.font.SysFont("Arial Bold", 20)
-        self.window = pygame.display.set_mode((self.width, self.height))
+        self.ui = UIManager(self.game.width, self.game.height, self.font)
 
-    def reset(self, seed=None):
-        random.seed(seed)
-        # ### [OOP] 組合 (Composition)
-        # 遊戲重置時，重新創建 Dino 物件。
-        self.dino = Dino()
-        # ### [OOP] 聚合 (Aggregation)
-        # 透過 List 儲存所有的障礙物與子彈物件。
-        self.obstacles = []
-        self.bullets = []
-        self.particles = ParticleSystem()
-        self.score = 0
-        self.game_over = False
-        self.spawn_timer = 0
-        self.game_speed = 1.0
-
-
-    #每一幀都會執行的邏輯
-    def step(self, action: Action):
-        if self.state != 'RUNNING': return False, self.state == 'GAME_OVER'
-        if self.spawn_timer % 5 == 0: self.score += 1
-        self.game_speed = 1.0 + (self.score / 600.0)
-        current_spawn_threshold = max(20, 60 - int(self.score / 15))
-
-        if action == Action.JUMP: self.dino.jump()
-        elif action == Action.SHOOT:
-            if len(self.bullets) < 3:
-                self.bullets.append(Bullet(self.dino.x + self.dino.w, self.dino.y + 15))
-        elif action == Action.DROP: self.dino.fast_drop()
-
-        self.dino.update()
-
-        self.spawn_timer += 1
-        # 1. 決定「什麼時候」生怪 (Timer)
-        if self.spawn_timer > current_spawn_threshold:
-            # 2. 決定「生不生」 (60% 機率會生，40% 落空，讓節奏有變化)
-            if random.random() < 0.6: 
-                start_x = self.width + random.randint(0, 50)
-                # 3. 決定「生什麼」 (抽獎邏輯)
-                rng = random.random()
-                # ### [OOP] 多型物件生成
-                # 不管生成的是 HealthPack, Cactus, Bird 還是 Bat，
-                # 它們都被視為 Obstacle 存入 self.obstacles 列表中。
-                if rng < 0.1:     self.obstacles.append(HealthPack(start_x)) 
-                elif rng < 0.45:  self.obstacles.append(Cactus(start_x))
-                elif rng < 0.75:  self.obstacles.append(Bird(start_x))
-                else:             self.obstacles.append(Bat(start_x))
-                self.spawn_timer -= current_spawn_threshold
-
-        for b in self.bullets[:]:
-            b.move()
-            if b.x > self.width: self.bullets.remove(b)
-
-        for obj in self.obstacles[:]:
-            # ### [OOP] 多型行為 (Polymorphic Behavior)
-            # 這裡呼叫 obj.move() 或 obj.draw() 時，
-            # 程式不需要檢查 obj 是仙人掌還是鳥，
-            # 物件自己知道該怎麼移動、怎麼畫。
-            obj.move(self.game_speed)
-            
-            hit_by_bullet = False
-            for b in self.bullets[:]:
-                # ### [OOP] 父類別方法複用
-                # collides_with 是定義在 GameObject 中的，所有物件都能用。
-                if b.collides_with(obj):
-                    if obj.shootable:
-                        self.score += 5
-                        self.particles.emit(obj.x + obj.w//2, obj.y + obj.h//2, obj.color, 15)
-                        self.particles.emit(b.x, b.y, BULLET_COLOR, 5) 
-                        
-                        self.bullets.remove(b)
-                        self.obstacles.remove(obj)
-                        hit_by_bullet = True
-                        break
-                    else:
-                        self.particles.emit(b.x, b.y, WHITE, 5)
-                        self.bullets.remove(b) 
-                        break
-            if hit_by_bullet: continue
-            
-            if self.dino.collides_with(obj):
-                # ### [OOP] 類型檢查 (Type Checking)
-                # 雖然通常用多型，但偶爾需要判斷特定類型 (isinstance) 來執行特殊邏輯 (補血)。
-                if isinstance(obj, HealthPack):
-                    if self.dino.heal():
-                        self.particles.emit(self.dino.x, self.dino.y, HEART_RED, 10)
-                    self.obstacles.remove(obj)
-                    continue 
-                
-                # ### [OOP] 封裝方法的應用
-                # 不直接寫 self.dino.hp -= 1，而是呼叫 take_damage()，
-                # 確保無敵時間邏輯被正確執行。
-                if self.dino.take_damage():
-                    self.particles.emit(self.dino.x + 20, self.dino.y + 20, RED, 10)
-
-                if self.dino.hp <= 0:
-                    self.game_over = True
-                    self.state = 'GAME_OVER'
-
-            if obj.x < -50: self.obstacles.remove(obj)
-
-        return True, self.game_over
+        # 預先畫好的靜態圖層：天空、地面線、HUD 底條，每幀只要貼一次
+        self.background = pygame.Surface(size)
+        self.background.fill(SKY_BLUE)
+        pygame.draw.line(self.background, (100, 100, 100), (0, 290), (self.game.width, 290), 3)
+        self.ui.draw_hud_frame(self.background)
+
+    def reset(self):
+        self.particles.clear()
+        self.game.effects.clear()
 
     def render(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-        
-        self.window.fill(SKY_BLUE)
-        pygame.draw.line(self.window, (100, 100, 100), (0, 290), (self.width, 290), 3)
+        if self.window is None: self._init_pygame()
+        if self.render_mode == 'human':
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT: pygame.quit(); sys.exit()
+
+        game = self.game
+        # 把模擬記下來的特效事件轉成粒子
+        for x, y, color, count in game.effects: self.particles.emit(x, y, color, count)
+        game.effects.clear()
+
+        self.window.blit(self.background, (0, 0))
+
+        draw_dino(self.window, game.dino)
 
-        self.dino.draw(self.window)
-        
         # ### [OOP] 多型繪圖
-        # 遍歷所有障礙物，每個物件呼叫自己的 draw()。
-        for obj in self.obstacles: obj.draw(self.window)
-        for b in self.bullets: b.draw(self.window)
-        
+        # 遍歷所有障礙物，每一種用自己的畫法。
+        obstacles, bullets = game.obstacles, game.bullets
+        for x, y, t in zip(obstacles.x[:obstacles.n].tolist(), obstacles.y[:obstacles.n].tolist(), obstacles.type[:obstacles.n].tolist()):
+            DRAW_OBSTACLE[t](self.window, x, y)
+        for x, y in zip(bullets.x[:bullets.n].tolist(), bullets.y[:bullets.n].tolist()):
+            draw_bullet(self.window, x, y)
+
         self.particles.update_and_draw(self.window)
 
-        if self.state == 'RUNNING':
-            self.ui.draw_hud(self.window, self.score, self.game_speed, self.dino.hp, 3 - len(self.bullets))
-        elif self.state == 'WAITING':
+        if game.state == 'RUNNING':
+            self.ui.draw_hud(self.window, game.score, game.game_speed, game.dino.hp, 3 - len(game.bullets))
+        elif game.state == 'WAITING':
             self.ui.draw_hud(self.window, 0, 1.0, 3, 3)
             self.ui.draw_screen(self.window, "DINO FIGHTER", "Press SPACE to Start")
-        elif self.state == 'GAME_OVER':
-            self.ui.draw_hud(self.window, self.score, self.game_speed, 0, 3 - len(self.bullets))
+        elif game.state == 'GAME_OVER':
+            self.ui.draw_hud(self.window, game.score, game.game_speed, 0, 3 - len(game.bullets))
             self.ui.draw_screen(self.window, "GAME OVER", "Press R to Restart", bg_color=(0,0,0,200))
-        
-        pygame.display.update()
-        self.clock.tick(self.fps)
+
+        if self.render_mode == 'human':
+            pygame.display.update()
+            self.clock.tick(self.fps)
+        else:
+            return np.transpose(pygame.surfarray.array3d(self.window), axes=(1, 0, 2))
+
+    def close(self):
+        if self.window is not None:
+            if self.render_mode == 'human':
+                pygame.display.quit()
+                pygame.quit()
+            self.window = None
+
+# --- 5. 遊戲引擎 (真人遊玩) ---
+# ### [OOP] 繼承 + 組合
+# DinoGame 就是一場 DinoSimulation，再加上一個負責畫面的 DinoRenderer。
+class DinoGame(DinoSimulation):
+    def __init__(self, width=700, height=350, fps=30):
+        self.renderer = None
+        super().__init__(width, height)
+        self.renderer = DinoRenderer(self, 'human', fps)
+        self.fps = fps
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        if self.renderer is not None: self.renderer.reset()
+
+    def render(self):
+        self.renderer.render()
 
 if __name__ == "__main__":
     game = DinoGame()
+    game.render()
     running = True
     while running:
-        action = None 
+        action = None
         keys = pygame.key.get_pressed()
         for event in pygame.event.get():
             if event.type == pygame.QUIT: running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE: running = False
-                
+
                 if game.state == 'WAITING':
                     if event.key == pygame.K_SPACE: game.state = 'RUNNING'
                 elif game.state == 'GAME_OVER':
@@ -455,8 +321,8 @@ if __name__ == "__main__":
                     if event.key == pygame.K_SPACE or event.key == pygame.K_UP: action = Action.JUMP
                     elif event.key == pygame.K_f: action = Action.SHOOT
                     elif event.key == pygame.K_s or event.key == pygame.K_DOWN: action = Action.DROP
-        
+
         if game.state == 'RUNNING':
              if action is None and (keys[pygame.K_s] or keys[pygame.K_DOWN]): action = Action.DROP
              game.step(action if action else Action.RUN)
-        game.render()
\ No newline at end of file
+        game.render()
@@ -0,0 +1,1023 @@
+'''
+Dino Fighter Ultimate - 純模擬核心 (Simulation Core)
+檔案名稱: dino_core.py
+
+只有遊戲邏輯，沒有 pygame：不開視窗、不建 Clock 或字型。
+DinoEnv 預設只用這個模組，所以可以在沒有 X server / SDL 的 AsyncVectorEnv worker 裡大量執行。
+畫面相關的部分 (draw、UIManager、粒子特效) 都在 dino.py。
+'''
+from enum import Enum
+
+import numpy as np
+
+# --- 基礎設定 ---
+class Action(Enum):
+    RUN = 0
+    JUMP = 1
+    SHOOT = 2
+    DROP = 3
+
+# 每次寫 Action.JUMP 都要經過 Enum 的 metaclass 查一次 (比一般屬性慢很多)，step 每一幀都要比對動作，先存起來
+JUMP, SHOOT, DROP = Action.JUMP, Action.SHOOT, Action.DROP
+
+# 調色盤 (省略...)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 50, 50)
+SKY_BLUE = (240, 248, 255)
+UI_DARK = (40, 44, 52)
+HEART_RED = (220, 20, 60)
+AMMO_GOLD = (255, 215, 0)
+
+DINO_COLOR = (80, 80, 80)
+BULLET_COLOR = (255, 140, 0)
+CACTUS_COLOR = (34, 139, 34)
+BIRD_COLOR = (70, 130, 180)
+BAT_COLOR = (75, 0, 130)
+
+MAX_BULLETS = 3     # 畫面上最多同時 3 顆子彈
+
+# --- 1. 核心 OOP 架構 ---
+
+# ### [OOP] 基礎類別 (Base Class)
+# 定義遊戲物件共有的屬性 (x, y, w, h) 和行為 (collides_with)。
+# 這符合 "Don't Repeat Yourself" (DRY) 原則。
+class GameObject:
+    def __init__(self, x, y, w, h, color):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.color = color
+
+    # ### [OOP] 共用邏輯
+    # 繼承 GameObject 的子類別 (Dino) 自動擁有此功能，不需要重複寫碰撞偵測代碼。
+    # 子彈和障礙物數量多，改成在 ObjectPool 裡一次用 NumPy 算完 (見下方 collide)。
+    def collides_with(self, other):
+        return (self.x < other.x + other.w and
+                self.x + self.w > other.x and
+                self.y < other.y + other.h and
+                self.y + self.h > other.y)
+
+
+# ### [OOP] 繼承 (Inheritance)
+class Dino(GameObject):
+    def __init__(self):
+        super().__init__(50, 250, 40, 40, DINO_COLOR)
+        self.is_jumping = False
+        self.jump_velocity = 0
+        self.gravity = 2.0
+        self.jump_strength = -25
+        self.base_y = 250
+        # ### [OOP] 封裝 (Encapsulation) - 數據保護
+        # hp 和 invincible_timer 是物件內部的狀態，
+        # 不應該由外部直接修改 (例如不要在外面寫 dino.hp -= 1)。
+        self.max_hp = 3
+        self.hp = self.max_hp
+        self.invincible_timer = 0
+        self.invincible_frames = 45
+
+    def update(self):
+        self.y += self.jump_velocity
+        if self.y < self.base_y:
+            self.jump_velocity += self.gravity
+            self.is_jumping = True
+        else:
+            self.y = self.base_y
+            self.jump_velocity = 0
+            self.is_jumping = False
+
+        if self.invincible_timer > 0:
+            self.invincible_timer -= 1
+
+    def jump(self):
+        if not self.is_jumping:
+            self.jump_velocity = self.jump_strength
+
+    def fast_drop(self):
+        if self.is_jumping:
+            self.jump_velocity = 20
+
+    # ### [OOP] 封裝 (Encapsulation) - 行為控制
+    # 外部透過此方法與 Dino 互動。
+    # 這個方法內部處理了「無敵時間」的邏輯判斷，外部呼叫者不需要知道細節，
+    # 只要知道「呼叫此函數嘗試扣血」即可。
+    def take_damage(self):
+        if self.invincible_timer == 0:
+            self.hp -= 1
+            self.invincible_timer = self.invincible_frames
+            return True
+        return False
+
+    # ### [OOP] 封裝 (Encapsulation)
+    # 同樣的，補血邏輯 (不能超過上限) 被封裝在這裡。
+    def heal(self):
+        if self.hp < self.max_hp:
+            self.hp += 1
+            return True
+        return False
+
+# --- 2. 子彈與障礙物體系 ---
+# 子彈和障礙物每一幀都要移動、互相檢查碰撞，數量也會隨分數變多。
+# 所以它們不再是一個個物件，而是存在 ObjectPool 的 NumPy 陣列裡 (struct of arrays)，
+# 類別只負責描述「這一種東西長怎樣」(大小、顏色、速度、能不能被射)。
+
+# ### [OOP] 基礎類別 (Base Class)
+class Bullet:
+    type_code = 0
+    w, h = 15, 6
+    color = BULLET_COLOR
+    speed = 15
+
+
+# ### [OOP] 中層抽象 (Abstraction)
+# Obstacle 描述所有障礙物共有的屬性，它作為所有具體障礙物 (Cactus, Bird, Bat) 的父類別。
+# type_code 就是存在陣列裡的種類編號 (0 留給「沒有東西」)。
+class Obstacle:
+    type_code = 0
+    w, h = 0, 0
+    color = BLACK
+    speed = 0
+    shootable = False
+    y_range = (0, 0)    # 出現高度的範圍 (含兩端)
+
+    # ### [OOP] 多型 (Polymorphism)
+    # 每種障礙物自己決定出現的高度，生怪的程式不需要知道是哪一種。
+    # u 是生怪時抽好的 [0, 1) 亂數，換算成 y_range 裡的整數。
+    @classmethod
+    def spawn_y(cls, u):
+        low, high = cls.y_range
+        return low + int(u * (high - low + 1))
+
+
+# ### [OOP] 繼承 (Inheritance)
+# Cactus -> Obstacle
+class Cactus(Obstacle):
+    type_code = 1
+    w, h = 25, 45
+    color = CACTUS_COLOR
+    speed = 7
+    y_range = (250, 250)
+
+    # 仙人掌永遠長在地上
+    @classmethod
+    def spawn_y(cls, u):
+        return cls.y_range[0]
+
+class Bird(Obstacle):
+    type_code = 2
+    w, h = 35, 25
+    color = BIRD_COLOR
+    speed = 9
+    shootable = True
+    y_range = (150, 230)
+
+class Bat(Obstacle):
+    type_code = 3
+    w, h = 30, 20
+    color = BAT_COLOR
+    speed = 11
+    shootable = True
+    y_range = (200, 250)
+
+
+#補包的部分
+class HealthPack(Obstacle):
+    type_code = 4
+    w, h = 30, 30
+    color = WHITE
+    speed = 9
+    y_range = (180, 240)
+
+
+# 用 type_code 查種類
+OBSTACLE_TYPES = (None, Cactus, Bird, Bat, HealthPack)
+KINDS = (Obstacle,) + OBSTACLE_TYPES[1:]
+SHOOTABLE = np.array([t.shootable for t in KINDS])
+# 給批次引擎用的查表 (index 就是 type_code)
+KIND_W = np.array([t.w for t in KINDS], dtype=float)
+KIND_H = np.array([t.h for t in KINDS], dtype=float)
+KIND_SPEED = np.array([t.speed for t in KINDS], dtype=float)
+KIND_Y_LOW = np.array([t.y_range[0] for t in KINDS])
+KIND_Y_HIGH = np.array([t.y_range[1] for t in KINDS])
+# 生怪抽獎: rng < 0.1 補包, < 0.45 仙人掌, < 0.75 鳥, 其他是蝙蝠
+SPAWN_CUTOFFS = np.array([0.1, 0.45, 0.75])
+SPAWN_CODES = np.array([HealthPack.type_code, Cactus.type_code, Bird.type_code, Bat.type_code])
+
+
+# ### [OOP] 封裝 (Encapsulation)
+# ObjectPool 把一群同類物件存成一塊預先配置好的陣列，外部只透過 add / keep 增刪，
+# 前 n 格是活著的物件，新物件加在最後面；seq 記錄生成的順序。
+# data 的每一列是一個欄位 (x, y, w, h, speed)，所以一個 NumPy 運算就能處理所有物件。
+# cols 是同一塊陣列每個欄位 (x, y, w, h, speed, type, seq) 的 memoryview，
+# 讀寫單一格拿到的是 Python 的 float/int，物件少的時候用純量迴圈比呼叫 NumPy 快很多。
+class ObjectPool:
+    def __init__(self, capacity):
+        self.n = 0
+        self.data = np.zeros((5, capacity))
+        self.type = np.zeros(capacity, dtype=np.int8)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self.spawned = 0
+        self._make_cols()
+
+    def _make_cols(self):
+        self.capacity = self.data.shape[1]
+        self.cols = tuple(memoryview(row) for row in self.data) + (memoryview(self.type), memoryview(self.seq))
+
+    # memoryview 不能 pickle / deepcopy，複製時重新建
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['cols']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._make_cols()
+
+    @property
+    def x(self): return self.data[0]
+
+    @property
+    def y(self): return self.data[1]
+
+    @property
+    def w(self): return self.data[2]
+
+    @property
+    def h(self): return self.data[3]
+
+    @property
+    def speed(self): return self.data[4]
+
+    def __len__(self):
+        return self.n
+
+    def add(self, x, y, kind):
+        if self.n == self.capacity: self._grow()
+        i = self.n
+        xs, ys, ws, hs, speeds, types, seqs = self.cols
+        xs[i], ys[i], ws[i], hs[i], speeds[i] = x, y, kind.w, kind.h, kind.speed
+        types[i] = kind.type_code
+        seqs[i] = self.spawned
+        self.spawned += 1
+        self.n += 1
+
+    def keep(self, alive):
+        # 用 alive mask 壓縮陣列：留下來的物件往前搬，順序不變
+        if alive.all(): return
+        idx = alive.nonzero()[0]
+        k = len(idx)
+        self.data[:, :k] = self.data[:, idx]
+        self.type[:k] = self.type[idx]
+        self.seq[:k] = self.seq[idx]
+        self.n = k
+
+    # 刪掉 removed 裡的編號，和 keep 一樣順序不變；透過 cols 逐格搬，物件少的時候比 keep 快
+    def remove_small(self, removed):
+        k = 0
+        for i in range(self.n):
+            if i not in removed:
+                if k != i:
+                    for col in self.cols: col[k] = col[i]
+                k += 1
+        self.n = k
+
+    def clear(self):
+        self.n = 0
+
+    def sort_by_x(self):
+        # 障礙物都從右邊出生、往左移，所以大部分時候本來就由左到右排好了，
+        # 只有快的 (蝙蝠) 超過慢的 (仙人掌) 時才需要重排。
+        x = self.data[0, :self.n]
+        if not (x[1:] < x[:-1]).any(): return
+        order = np.argsort(x, kind='stable')
+        self.data[:, :self.n] = self.data[:, order]
+        self.type[:self.n] = self.type[order]
+        self.seq[:self.n] = self.seq[order]
+
+    # 陣列是依 x 排序的，碰撞結果要照「生成順序」處理，規則才會和以前一樣
+    def in_spawn_order(self, idx):
+        return idx[np.argsort(self.seq[idx])] if len(idx) > 1 else idx
+
+    def _grow(self):
+        self.data = np.concatenate([self.data, np.zeros_like(self.data)], axis=1)
+        self.type = np.concatenate([self.type, np.zeros_like(self.type)])
+        self.seq = np.concatenate([self.seq, np.zeros_like(self.seq)])
+        self._make_cols()
+
+    # 存檔用的欄位 (見 DinoSimulation.get_state)，陣列大小跟著目前的容量
+    def state_fields(self):
+        return pool_state_fields(self.capacity)
+
+    def get_state(self, record):
+        record['n'] = self.n
+        record['spawned'] = self.spawned
+        record['data'] = self.data
+        record['type'] = self.type
+        record['seq'] = self.seq
+
+    def set_state(self, record):
+        capacity = record['type'].shape[0]
+        while self.data.shape[1] < capacity: self._grow()
+        self.n = int(record['n'])
+        self.spawned = int(record['spawned'])
+        self.data[:, :capacity] = record['data']
+        self.type[:capacity] = record['type']
+        self.seq[:capacity] = record['seq']
+
+    # AABB 碰撞：和 GameObject.collides_with 一樣的判斷，一次算出 (self.n, other.n) 的結果
+    def collide(self, other):
+        pos, size = self.data[:2, :self.n, None], self.data[2:4, :self.n, None]
+        other_pos, other_size = other.data[:2, None, :other.n], other.data[2:4, None, :other.n]
+        return ((pos < other_pos + other_size) & (pos + size > other_pos)).all(axis=0)
+
+    # 和單一物件 (例如 Dino) 的碰撞
+    def collide_object(self, obj):
+        pos, size = self.data[:2, :self.n], self.data[2:4, :self.n]
+        obj_pos = np.array([[obj.x], [obj.y]])
+        obj_size = np.array([[obj.w], [obj.h]])
+        return ((obj_pos < pos + size) & (obj_pos + obj_size > pos)).all(axis=0)
+
+
+# ObjectPool (和 BatchObjectPool 的一場遊戲) 存檔用的欄位
+def pool_state_fields(capacity):
+    return [('n', np.int64), ('spawned', np.int64), ('data', np.float64, (5, capacity)),
+            ('type', np.int8, (capacity,)), ('seq', np.int64, (capacity,))]
+
+
+# ### [OOP] 封裝 (Encapsulation)
+# 生怪用的亂數。每次生怪嘗試固定用 4 個 [0, 1) 的亂數 (生不生、x 偏移、種類、高度)，
+# 每場遊戲一次從自己的 np.random.Generator 預先抽 block 次的量，之後照順序拿。
+# 一次抽一大塊和每次抽 4 個是同一串亂數，所以結果只跟 seed 有關，
+# 同一個 process 裡的很多場遊戲也不會互相干擾 (以前全部共用 random 模組)。
+class SpawnDraws:
+    def __init__(self, num_games, block=64):
+        self.block = block
+        self.rngs = [np.random.default_rng() for _ in range(num_games)]
+        self.draws = np.zeros((num_games, block, 4))
+        self.next = np.full(num_games, block)    # == block 代表用完了，下次拿的時候再抽
+
+    def set_rngs(self, games, rngs):
+        # 換新的 Generator 時，舊的預抽亂數就不要了
+        for g, rng in zip(games, rngs): self.rngs[g] = rng
+        self.next[games] = self.block
+
+    def take(self, games):
+        for g in games[self.next[games] == self.block]:
+            self.draws[g] = self.rngs[g].random((self.block, 4))
+            self.next[g] = 0
+        rows = self.draws[games, self.next[games]]
+        self.next[games] += 1
+        return rows
+
+    # 和 take 一樣，只拿第 g 場的一組 (給單場的 DinoSimulation)，回傳 Python float 的 list
+    def take_one(self, g):
+        i = int(self.next[g])
+        if i == self.block:
+            self.draws[g] = self.rngs[g].random((self.block, 4))
+            i = 0
+        self.next[g] = i + 1
+        return self.draws[g, i].tolist()
+
+    # 單場遊戲的亂數狀態：Generator (PCG64) 的 128-bit state/inc 拆成 uint64，加上預抽好的亂數和讀到哪裡
+    def state_fields(self):
+        return [('rng', np.uint64, (6,)), ('draws', np.float64, (self.block, 4)), ('next', np.int64)]
+
+    def get_state(self, g, record):
+        bit_state = self.rngs[g].bit_generator.state
+        assert bit_state['bit_generator'] == 'PCG64', bit_state['bit_generator']
+        pcg = bit_state['state']
+        record['rng'] = (pcg['state'] >> 64, pcg['state'] & MASK64, pcg['inc'] >> 64, pcg['inc'] & MASK64,
+                         bit_state['has_uint32'], bit_state['uinteger'])
+        record['draws'] = self.draws[g]
+        record['next'] = self.next[g]
+
+    def set_state(self, g, record):
+        words = [int(w) for w in record['rng']]
+        self.rngs[g].bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': words[0] << 64 | words[1], 'inc': words[2] << 64 | words[3]},
+            'has_uint32': words[4], 'uinteger': words[5],
+        }
+        self.draws[g] = record['draws']
+        self.next[g] = record['next']
+
+
+MASK64 = (1 << 64) - 1
+
+
+# --- 3. 遊戲引擎 (模擬) ---
+GAME = np.array([0])    # 單場遊戲在 SpawnDraws 裡的編號
+STATES = ('WAITING', 'RUNNING', 'GAME_OVER')
+# 障礙物至少這麼多個時才用 NumPy 一次算完 (見 DinoSimulation.step)，子彈最多只有 MAX_BULLETS 顆所以不用看
+VECTOR_MIN_OBSTACLES = 64
+STATE_DTYPES = {}      # (障礙物容量, 子彈容量, 預抽亂數的量) -> get_state 的 record dtype (建 dtype 很慢，建一次就好)
+
+# 一場遊戲的存檔格式，DinoSimulation.get_state 和 DinoBatch.get_state 共用
+def state_dtype(obstacle_capacity, bullet_capacity, spawn_draws):
+    key = (obstacle_capacity, bullet_capacity, spawn_draws.block)
+    if key not in STATE_DTYPES:
+        STATE_DTYPES[key] = np.dtype([
+            ('state', np.int8), ('score', np.int64), ('spawn_timer', np.int64),
+            ('game_speed', np.float64), ('game_over', np.bool_),
+            ('dino', [('y', np.float64), ('jump_velocity', np.float64), ('is_jumping', np.bool_),
+                      ('hp', np.int64), ('invincible_timer', np.int64)]),
+            ('obstacles', pool_state_fields(obstacle_capacity)),
+            ('bullets', pool_state_fields(bullet_capacity)),
+            ('spawn_draws', spawn_draws.state_fields()),
+        ])
+    return STATE_DTYPES[key]
+
+class DinoSimulation:
+    def __init__(self, width=700, height=350):
+        self.width = width
+        self.height = height
+        # 特效事件 (x, y, color, count)：模擬只負責記錄，要畫面的 renderer 才會打開並轉成粒子。
+        # 沒有 renderer 時不記錄，避免 headless 執行時越堆越多。
+        self.record_effects = False
+        self.effects = []
+        # ### [OOP] 聚合 (Aggregation)
+        # 透過 ObjectPool 儲存所有的障礙物與子彈。
+        self.obstacles = ObjectPool(16)
+        self.bullets = ObjectPool(MAX_BULLETS)
+        self.spawn_draws = SpawnDraws(1)
+        self.state = 'WAITING'
+        self.reset()
+
+    # rng: 這場遊戲用的 np.random.Generator (DinoEnv 會給 Env.np_random)，
+    # 沒給 rng 但有 seed 就建一個新的，兩個都沒給就沿用原本的亂數繼續跑。
+    def reset(self, seed=None, rng=None):
+        if rng is None and seed is not None: rng = np.random.default_rng(seed)
+        if rng is not None and rng is not self.spawn_draws.rngs[0]:
+            self.spawn_draws.set_rngs(GAME, [rng])
+        # ### [OOP] 組合 (Composition)
+        # 遊戲重置時，重新創建 Dino 物件。
+        self.dino = Dino()
+        self.obstacles.clear()
+        self.bullets.clear()
+        self.effects = []
+        self.score = 0
+        self.game_over = False
+        self.spawn_timer = 0
+        self.game_speed = 1.0
+
+    def _emit(self, x, y, color, count):
+        if self.record_effects:
+            self.effects.append((x, y, color, count))
+
+
+    #每一幀都會執行的邏輯
+    def step(self, action: Action):
+        if self.state != 'RUNNING': return False, self.state == 'GAME_OVER'
+        if self.spawn_timer % 5 == 0: self.score += 1
+        self.game_speed = 1.0 + (self.score / 600.0)
+        # 和 max(20, 60 - int(score / 15)) 一樣 (分數是非負整數)，只是不用呼叫 max / int
+        current_spawn_threshold = 60 - self.score // 15
+        if current_spawn_threshold < 20: current_spawn_threshold = 20
+
+        obstacles, bullets, dino = self.obstacles, self.bullets, self.dino
+
+        if action == JUMP: dino.jump()
+        elif action == SHOOT:
+            if bullets.n < MAX_BULLETS:
+                bullets.add(dino.x + dino.w, dino.y + 15, Bullet)
+        elif action == DROP: dino.fast_drop()
+
+        dino.update()
+
+        self.spawn_timer += 1
+        # 1. 決定「什麼時候」生怪 (Timer)
+        if self.spawn_timer > current_spawn_threshold:
+            u = self.spawn_draws.take_one(0)
+            # 2. 決定「生不生」 (60% 機率會生，40% 落空，讓節奏有變化)
+            if u[0] < 0.6:
+                start_x = self.width + int(u[1] * 51)
+                # 3. 決定「生什麼」 (抽獎邏輯)
+                rng = u[2]
+                if rng < 0.1:     kind = HealthPack
+                elif rng < 0.45:  kind = Cactus
+                elif rng < 0.75:  kind = Bird
+                else:             kind = Bat
+                # ### [OOP] 多型物件生成
+                # 不管生成的是 HealthPack, Cactus, Bird 還是 Bat，
+                # 都用同樣的方式存入 self.obstacles。
+                obstacles.add(start_x, kind.spawn_y(u[3]), kind)
+                self.spawn_timer -= current_spawn_threshold
+
+        # 子彈和障礙物的移動與碰撞：一場遊戲畫面上通常只有幾個物件，這時候每次呼叫 NumPy 的固定成本
+        # 比運算本身還貴，所以下面透過 ObjectPool.cols 一個一個物件算 (規則和 _update_objects_vector 一樣)，
+        # 物件多到整條陣列一起算比較划算時才用 NumPy 的版本。要刪除的物件先記下編號，最後用 remove_small 一次搬完。
+        n = obstacles.n
+        if n >= VECTOR_MIN_OBSTACLES:
+            self._update_objects_vector()
+            return True, self.game_over
+
+        # 子彈池裡都是 Bullet，大小和速度直接用類別的，不用一格一格讀
+        m = bullets.n
+        if m:
+            bx, speed, width = bullets.cols[0], Bullet.speed, self.width
+            for j in range(m): bx[j] += speed
+            # 最早射出的 bullets.x[0] 在最右邊，它沒飛出畫面就都還在
+            if bx[0] > width:
+                gone = []
+                for j in range(m):
+                    if bx[j] > width: gone.append(j)
+                bullets.remove_small(gone)
+                m = bullets.n
+        if not n: return True, self.game_over
+        ox, oy, ow, oh, ospeed, otype, oseq = obstacles.cols
+        game_speed = self.game_speed
+        leftmost = ox[0] = ox[0] - ospeed[0] * game_speed
+        if n > 1:
+            in_order, prev = True, leftmost
+            for i in range(1, n):
+                x = ox[i] = ox[i] - ospeed[i] * game_speed
+                if x < prev: in_order = False
+                prev = x
+            if not in_order:
+                obstacles.sort_by_x()
+                leftmost = ox[0]
+
+        # 要刪除和被打掉的障礙物編號 (很少發生，用到才建)
+        removed = shot = ()
+        # 排好序了，所以只有最左邊的障礙物超過 -50 時才需要一個一個檢查
+        if leftmost < -50:
+            for i in range(n):
+                if ox[i] < -50: removed += (i,)
+
+        # 子彈 vs 障礙物：子彈都在 [bullets.x[m - 1], bullets.x[0] + Bullet.w] 之間，
+        # 障礙物由左到右排好了，碰不到這段的就不用一顆一顆比
+        if m and leftmost < bx[0] + Bullet.w:
+            by, bw, bh = bullets.cols[1], Bullet.w, Bullet.h
+            hits = ()
+            front, back = bx[0] + bw, bx[m - 1]
+            for i in range(n):
+                x = ox[i]
+                if x >= front: break
+                r = x + ow[i]
+                if r <= back: continue
+                y, b = oy[i], oy[i] + oh[i]
+                for j in range(m):
+                    bj = bx[j]
+                    if x < bj + bw and r > bj and y < by[j] + bh and b > by[j]:
+                        hits += ((oseq[i], i),)
+                        break
+            # 每顆子彈最多只能打中一個障礙物，依生成順序處理，每個障礙物拿它碰到的第一顆還在的子彈
+            if hits:
+                used = []
+                for _, i in sorted(hits):
+                    x, y, r, b = ox[i], oy[i], ox[i] + ow[i], oy[i] + oh[i]
+                    for j in range(m):
+                        if j not in used and x < bx[j] + bw and r > bx[j] and y < by[j] + bh and b > by[j]: break
+                    else: continue
+                    used.append(j)
+                    kind = OBSTACLE_TYPES[otype[i]]
+                    if kind.shootable:
+                        self.score += 5
+                        self._emit(ox[i] + kind.w//2, oy[i] + kind.h//2, kind.color, 15)
+                        self._emit(bx[j], by[j], BULLET_COLOR, 5)
+                        shot += (i,)
+                        removed += (i,)
+                    else:
+                        self._emit(bx[j], by[j], WHITE, 5)
+                bullets.remove_small(used)
+
+        # Dino vs 障礙物 (被子彈打掉的不算)
+        if leftmost < dino.x + dino.w:
+            x, y, r, b = dino.x, dino.y, dino.x + dino.w, dino.y + dino.h
+            touching = ()
+            for i in range(n):
+                if ox[i] >= r: break
+                if x < ox[i] + ow[i] and y < oy[i] + oh[i] and b > oy[i] and i not in shot:
+                    touching += (i,)
+            if len(touching) > 1: touching = sorted(touching, key=oseq.__getitem__)
+            for i in touching:
+                # ### [OOP] 類型檢查 (Type Checking)
+                # 雖然通常用多型，但偶爾需要判斷特定類型來執行特殊邏輯 (補血)。
+                if otype[i] == HealthPack.type_code:
+                    if dino.heal():
+                        self._emit(dino.x, dino.y, HEART_RED, 10)
+                    removed += (i,)
+                    continue
+
+                # ### [OOP] 封裝方法的應用
+                # 不直接寫 self.dino.hp -= 1，而是呼叫 take_damage()，
+                # 確保無敵時間邏輯被正確執行。
+                if dino.take_damage():
+                    self._emit(dino.x + 20, dino.y + 20, RED, 10)
+
+                if dino.hp <= 0:
+                    self.game_over = True
+                    self.state = 'GAME_OVER'
+
+        if removed: obstacles.remove_small(removed)
+
+        return True, self.game_over
+
+    # 子彈和障礙物一起移動 (整條陣列一次算完)
+    def _update_objects_vector(self):
+        obstacles, bullets, dino = self.obstacles, self.bullets, self.dino
+        m = bullets.n
+        if m:
+            bullets.x[:m] += bullets.speed[:m]
+            bullets.keep(bullets.x[:m] <= self.width)
+            m = bullets.n
+        n = obstacles.n
+        if not n: return
+        obstacles.x[:n] -= obstacles.speed[:n] * self.game_speed
+        # 障礙物保持由左到右排序，最近的障礙物就是陣列最前面幾個
+        obstacles.sort_by_x()
+
+        alive = obstacles.x[:n] >= -50
+        shot = np.zeros(n, dtype=bool)
+        # 最左邊的障礙物還沒碰到子彈/恐龍的右邊時，整段碰撞檢查都可以跳過
+        # (子彈速度一樣，最早射出的 bullets.x[0] 一定在最右邊)
+        leftmost = obstacles.x[0]
+
+        # 子彈 vs 障礙物：一次算出所有配對，只對真的有撞到的障礙物 (依生成順序) 處理結果，
+        # 每顆子彈最多只能打中一個障礙物。
+        if m and leftmost < bullets.x[0] + Bullet.w:
+            hits = obstacles.collide(bullets)
+            if hits.any():
+                bullet_alive = np.ones(m, dtype=bool)
+                for i in obstacles.in_spawn_order(hits.any(axis=1).nonzero()[0]):
+                    free = (hits[i] & bullet_alive).nonzero()[0]
+                    if len(free) == 0: continue
+                    j = free[0]
+                    bullet_alive[j] = False
+                    if SHOOTABLE[obstacles.type[i]]:
+                        self.score += 5
+                        kind = OBSTACLE_TYPES[obstacles.type[i]]
+                        self._emit(obstacles.x[i] + kind.w//2, obstacles.y[i] + kind.h//2, kind.color, 15)
+                        self._emit(bullets.x[j], bullets.y[j], BULLET_COLOR, 5)
+                        shot[i] = True
+                    else:
+                        self._emit(bullets.x[j], bullets.y[j], WHITE, 5)
+                bullets.keep(bullet_alive)
+
+        # Dino vs 障礙物 (被子彈打掉的不算)
+        if leftmost < dino.x + dino.w:
+            touching = obstacles.collide_object(dino) & ~shot
+            for i in obstacles.in_spawn_order(touching.nonzero()[0]):
+                if obstacles.type[i] == HealthPack.type_code:
+                    if dino.heal():
+                        self._emit(dino.x, dino.y, HEART_RED, 10)
+                    alive[i] = False
+                    continue
+                if dino.take_damage():
+                    self._emit(dino.x + 20, dino.y + 20, RED, 10)
+
+                if dino.hp <= 0:
+                    self.game_over = True
+                    self.state = 'GAME_OVER'
+
+        obstacles.keep(alive & ~shot)
+
+    # ### [OOP] 封裝 (Encapsulation)
+    # 存檔 / 讀檔：整場模擬 (恐龍、障礙物、子彈、分數、亂數) 存成一筆 NumPy structured record，
+    # 給 MCTS / rollout 之類的搜尋用，不用 copy.deepcopy 整個遊戲。
+    # 同一個 record 可以 set_state 很多次；out 可以傳入上次的 record 重複使用。
+    # 特效和畫面 (粒子) 不算模擬狀態，不會存。
+    def state_dtype(self):
+        return state_dtype(self.obstacles.capacity, self.bullets.capacity, self.spawn_draws)
+
+    def get_state(self, out=None):
+        dtype = self.state_dtype()
+        record = np.zeros((), dtype) if out is None or out.dtype != dtype else out
+        dino = self.dino
+        record['state'] = STATES.index(self.state)
+        record['score'] = self.score
+        record['spawn_timer'] = self.spawn_timer
+        record['game_speed'] = self.game_speed
+        record['game_over'] = self.game_over
+        record['dino'] = (dino.y, dino.jump_velocity, dino.is_jumping, dino.hp, dino.invincible_timer)
+        self.obstacles.get_state(record['obstacles'])
+        self.bullets.get_state(record['bullets'])
+        self.spawn_draws.get_state(0, record['spawn_draws'])
+        return record
+
+    def set_state(self, record):
+        dino = self.dino
+        self.state = STATES[record['state']]
+        self.score = int(record['score'])
+        self.spawn_timer = int(record['spawn_timer'])
+        self.game_speed = float(record['game_speed'])
+        self.game_over = bool(record['game_over'])
+        dino.y, dino.jump_velocity, dino.is_jumping, dino.hp, dino.invincible_timer = record['dino'].item()
+        self.obstacles.set_state(record['obstacles'])
+        self.bullets.set_state(record['bullets'])
+        self.spawn_draws.set_state(0, record['spawn_draws'])
+        self.effects.clear()
+
+    # 恐龍前方最近的 k 個障礙物，每列是 [距離, y, 種類]，不夠 k 個的補 [999, 0, 0]。
+    # 障礙物由左到右排好了，所以只要二分搜尋找到第一個在恐龍右邊的，再往後拿 k 個。
+    def nearest_obstacles(self, k=1):
+        obstacles, dino_x = self.obstacles, self.dino.x
+        first = np.searchsorted(obstacles.x[:obstacles.n], dino_x, side='right')
+        idx = np.arange(first, min(first + k, obstacles.n))
+        nearest = np.zeros((k, 3))
+        nearest[:, 0] = 999
+        nearest[:len(idx), 0] = obstacles.x[idx] - dino_x
+        nearest[:len(idx), 1] = obstacles.y[idx]
+        nearest[:len(idx), 2] = obstacles.type[idx]
+        return nearest
+
+
+# --- 4. 批次引擎 (N 場遊戲一起跑) ---
+# DinoBatch 用和 DinoSimulation 一樣的規則同時模擬 N 場遊戲。
+# 所有狀態都是「第一維是遊戲編號」的陣列，一次 NumPy 運算就更新全部的遊戲，
+# 只有真的撞到東西的那幾組 (遊戲, 障礙物) 才會進 Python 迴圈。
+# 每場遊戲有自己的 np.random.Generator (SpawnDraws)，抽亂數的方式和 DinoSimulation 一樣。
+
+# ### [OOP] 封裝 (Encapsulation)
+# 和 ObjectPool 一樣，只是多了一維：data[g] 是第 g 場遊戲的 (x, y, w, h, speed)，n[g] 是它的物件數。
+class BatchObjectPool:
+    def __init__(self, num_games, capacity):
+        self.n = np.zeros(num_games, dtype=np.int64)
+        self.data = np.zeros((num_games, 5, capacity))
+        self.type = np.zeros((num_games, capacity), dtype=np.int8)
+        self.seq = np.zeros((num_games, capacity), dtype=np.int64)
+        self.spawned = 0
+        # 先建好的索引 (每一幀都要用，不用每次 np.arange)：格子編號和每場遊戲的列編號
+        self.slots = np.arange(capacity)
+        self.rows = np.arange(num_games)[:, None]
+
+    @property
+    def x(self): return self.data[:, 0]
+
+    @property
+    def y(self): return self.data[:, 1]
+
+    @property
+    def speed(self): return self.data[:, 4]
+
+    def valid(self):
+        return self.slots < self.n[:, None]
+
+    def add(self, games, x, y, w, h, speed, type_code=0):
+        # 每場遊戲 (games 裡不重複) 加一個物件在最後面
+        if len(games) == 0: return
+        if self.n[games].max() == self.data.shape[2]: self._grow()
+        slots = self.n[games]
+        for k, value in enumerate((x, y, w, h, speed)):
+            self.data[games, k, slots] = value
+        self.type[games, slots] = type_code
+        self.seq[games, slots] = self.spawned + np.arange(len(games))
+        self.spawned += len(games)
+        self.n[games] += 1
+
+    def keep(self, alive):
+        # 用 alive mask 壓縮每場遊戲的陣列，留下來的物件往前搬，順序不變
+        if not (self.valid() & ~alive).any(): return
+        order = np.argsort(~alive, axis=1, kind='stable')
+        self._reorder(self.rows, order)
+        self.n = alive.sum(axis=1)
+
+    def clear(self, games):
+        self.n[games] = 0
+
+    def sort_by_x(self):
+        # 只重排有障礙物超車的那幾場遊戲 (空的格子當成無限遠，留在最後面)
+        x = np.where(self.valid(), self.data[:, 0], np.inf)
+        games = np.flatnonzero((x[:, 1:] < x[:, :-1]).any(axis=1))
+        if len(games) == 0: return
+        self._reorder(games[:, None], np.argsort(x[games], axis=1, kind='stable'))
+
+    def _reorder(self, rows, order):
+        # rows 這幾場遊戲的格子改成 order 的順序 (直接用索引陣列，比 np.take_along_axis 少很多固定開銷)
+        self.data[rows[:, 0]] = self.data.transpose(0, 2, 1)[rows, order].transpose(0, 2, 1)
+        self.type[rows[:, 0]] = self.type[rows, order]
+        self.seq[rows[:, 0]] = self.seq[rows, order]
+
+    def _grow(self):
+        self.data = np.concatenate([self.data, np.zeros_like(self.data)], axis=2)
+        self.type = np.concatenate([self.type, np.zeros_like(self.type)], axis=1)
+        self.seq = np.concatenate([self.seq, np.zeros_like(self.seq)], axis=1)
+        self.slots = np.arange(self.data.shape[2])
+
+    # 第 g 場遊戲的物件，格式和 ObjectPool.get_state 一樣 (spawned 是所有遊戲共用的，比這場的 seq 都大)
+    def get_state(self, g, record):
+        record['n'] = self.n[g]
+        record['spawned'] = self.spawned
+        record['data'] = self.data[g]
+        record['type'] = self.type[g]
+        record['seq'] = self.seq[g]
+
+    # 每場遊戲裡 self 和 other 所有配對的 AABB 碰撞，形狀 (N, self 容量, other 容量)
+    def collide(self, other):
+        pos, size = self.data[:, :2, :, None], self.data[:, 2:4, :, None]
+        other_pos, other_size = other.data[:, :2, None, :], other.data[:, 2:4, None, :]
+        hit = ((pos < other_pos + other_size) & (pos + size > other_pos)).all(axis=1)
+        return hit & self.valid()[:, :, None] & other.valid()[:, None, :]
+
+    # 每場遊戲一個方塊 (例如 Dino)，x, y, w, h 是長度 N 的陣列或純量
+    def collide_box(self, x, y, w, h):
+        ox, oy, ow, oh = self.data[:, 0], self.data[:, 1], self.data[:, 2], self.data[:, 3]
+        x, y = np.reshape(x, (-1, 1)), np.reshape(y, (-1, 1))
+        return self.valid() & (x < ox + ow) & (x + w > ox) & (y < oy + oh) & (y + h > oy)
+
+
+class DinoBatch:
+    def __init__(self, num_games, width=700, height=350):
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        # 恐龍的固定數值 (位置、大小、重力...) 直接從 Dino 類別拿，兩個引擎才不會不一致
+        self.proto = Dino()
+        self.obstacles = BatchObjectPool(num_games, 16)
+        self.bullets = BatchObjectPool(num_games, MAX_BULLETS)
+        self.spawn_draws = SpawnDraws(num_games)
+
+        self.dino_y = np.full(num_games, float(self.proto.base_y))
+        self.jump_velocity = np.zeros(num_games)
+        self.is_jumping = np.zeros(num_games, dtype=bool)
+        self.hp = np.full(num_games, self.proto.max_hp)
+        self.invincible_timer = np.zeros(num_games, dtype=np.int64)
+        self.score = np.zeros(num_games, dtype=np.int64)
+        self.spawn_timer = np.zeros(num_games, dtype=np.int64)
+        self.game_speed = np.ones(num_games)
+        self.game_over = np.zeros(num_games, dtype=bool)
+
+    def reset(self, games, rngs=None):
+        # 重置 games 這幾場遊戲 (index 陣列)，有給 rngs 就換成新的 Generator
+        if rngs is not None: self.spawn_draws.set_rngs(games, rngs)
+        self.dino_y[games] = self.proto.base_y
+        self.jump_velocity[games] = 0
+        self.is_jumping[games] = False
+        self.hp[games] = self.proto.max_hp
+        self.invincible_timer[games] = 0
+        self.score[games] = 0
+        self.spawn_timer[games] = 0
+        self.game_speed[games] = 1.0
+        self.game_over[games] = False
+        self.obstacles.clear(games)
+        self.bullets.clear(games)
+
+    #每一幀都會執行的邏輯 (actions 是每場遊戲的動作編號，只有 active 的遊戲會前進)
+    def step(self, actions, active=None):
+        active = ~self.game_over if active is None else active & ~self.game_over
+        dino, obstacles, bullets = self.proto, self.obstacles, self.bullets
+
+        self.score += active & (self.spawn_timer % 5 == 0)
+        self.game_speed = np.where(active, 1.0 + self.score / 600.0, self.game_speed)
+        current_spawn_threshold = np.maximum(20, 60 - self.score // 15)
+
+        # 動作：和 Dino.jump / fast_drop 一樣的條件
+        self.jump_velocity[active & (actions == Action.JUMP.value) & ~self.is_jumping] = dino.jump_strength
+        self.jump_velocity[active & (actions == Action.DROP.value) & self.is_jumping] = 20
+        shooters = np.flatnonzero(active & (actions == Action.SHOOT.value) & (bullets.n < MAX_BULLETS))
+        bullets.add(shooters, dino.x + dino.w, self.dino_y[shooters] + 15, Bullet.w, Bullet.h, Bullet.speed)
+
+        # Dino.update
+        y = self.dino_y + self.jump_velocity
+        in_air = y < dino.base_y
+        self.dino_y = np.where(active, np.where(in_air, y, dino.base_y), self.dino_y)
+        self.jump_velocity = np.where(active, np.where(in_air, self.jump_velocity + dino.gravity, 0), self.jump_velocity)
+        self.is_jumping = np.where(active, in_air, self.is_jumping)
+        self.invincible_timer -= active & (self.invincible_timer > 0)
+
+        # 生怪：和 DinoSimulation 一樣，每次嘗試拿 4 個預抽的亂數 (生不生、x 偏移、種類、高度)
+        self.spawn_timer += active
+        attempts = np.flatnonzero(active & (self.spawn_timer > current_spawn_threshold))
+        if len(attempts):
+            u = self.spawn_draws.take(attempts)
+            spawned = u[:, 0] < 0.6
+            games, u = attempts[spawned], u[spawned]
+            codes = SPAWN_CODES[np.searchsorted(SPAWN_CUTOFFS, u[:, 2], side='right')]
+            start_x = self.width + np.floor(u[:, 1] * 51)
+            spawn_y = KIND_Y_LOW[codes] + np.floor(u[:, 3] * (KIND_Y_HIGH[codes] - KIND_Y_LOW[codes] + 1))
+            obstacles.add(games, start_x, spawn_y, KIND_W[codes], KIND_H[codes], KIND_SPEED[codes], codes)
+            self.spawn_timer[games] -= current_spawn_threshold[games]
+
+        # 子彈和障礙物一起移動
+        bullets.x[:] += bullets.speed * active[:, None]
+        bullets.keep(bullets.valid() & (bullets.x <= self.width))
+        obstacles.x[:] -= obstacles.speed * (self.game_speed * active)[:, None]
+        obstacles.sort_by_x()
+
+        alive = obstacles.valid() & (obstacles.x >= -50)
+        shot = np.zeros_like(alive)
+
+        # 子彈 vs 障礙物 (每顆子彈最多打中一個，依生成順序處理)
+        hits = obstacles.collide(bullets) & active[:, None, None]
+        if hits.any():
+            bullet_alive = bullets.valid()
+            for g in np.flatnonzero(hits.any(axis=(1, 2))):
+                rows = np.flatnonzero(hits[g].any(axis=1))
+                for i in rows[np.argsort(obstacles.seq[g, rows])]:
+                    free = np.flatnonzero(hits[g, i] & bullet_alive[g])
+                    if len(free) == 0: continue
+                    bullet_alive[g, free[0]] = False
+                    if SHOOTABLE[obstacles.type[g, i]]:
+                        self.score[g] += 5
+                        shot[g, i] = True
+            bullets.keep(bullet_alive)
+
+        # Dino vs 障礙物：和 Dino.heal / take_damage 一樣的規則
+        touching = obstacles.collide_box(dino.x, self.dino_y, dino.w, dino.h) & active[:, None] & ~shot
+        if touching.any():
+            pairs = np.argwhere(touching)
+            # 依 (遊戲, 生成順序) 處理
+            pairs = pairs[np.lexsort((obstacles.seq[pairs[:, 0], pairs[:, 1]], pairs[:, 0]))]
+            for g, i in pairs:
+                if obstacles.type[g, i] == HealthPack.type_code:
+                    if self.hp[g] < dino.max_hp: self.hp[g] += 1
+                    alive[g, i] = False
+                    continue
+                if self.invincible_timer[g] == 0:
+                    self.hp[g] -= 1
+                    self.invincible_timer[g] = dino.invincible_frames
+                if self.hp[g] <= 0:
+                    self.game_over[g] = True
+
+        obstacles.keep(alive & ~shot)
+        return self.game_over
+
+    # 第 g 場遊戲存成和 DinoSimulation.get_state 一樣的 record，可以直接 set_state 到 DinoSimulation 接著玩，
+    # 也可以拿來逐幀比對兩個引擎的規則 (見 test_dino_core.py)
+    def get_state(self, g, out=None):
+        dtype = state_dtype(self.obstacles.data.shape[2], self.bullets.data.shape[2], self.spawn_draws)
+        record = np.zeros((), dtype) if out is None or out.dtype != dtype else out
+        record['state'] = STATES.index('GAME_OVER' if self.game_over[g] else 'RUNNING')
+        record['score'] = self.score[g]
+        record['spawn_timer'] = self.spawn_timer[g]
+        record['game_speed'] = self.game_speed[g]
+        record['game_over'] = self.game_over[g]
+        record['dino'] = (self.dino_y[g], self.jump_velocity[g], self.is_jumping[g], self.hp[g],
+                          self.invincible_timer[g])
+        self.obstacles.get_state(g, record['obstacles'])
+        self.bullets.get_state(g, record['bullets'])
+        self.spawn_draws.get_state(g, record['spawn_draws'])
+        return record
+
+    # 每場遊戲恐龍前方最近的 k 個障礙物，形狀 (N, k, 3)，每列是 [距離, y, 種類]，不夠的補 [999, 0, 0]
+    # 障礙物由左到右排好了，所以「在恐龍左邊 (含) 的個數」就是第一個在前方的位置。
+    def nearest_obstacles(self, k=1):
+        obstacles, dino_x = self.obstacles, self.proto.x
+        first = (obstacles.valid() & (obstacles.x <= dino_x)).sum(axis=1)
+        idx = first[:, None] + np.arange(k)
+        found = idx < obstacles.n[:, None]
+        idx = np.minimum(idx, obstacles.data.shape[2] - 1)
+        nearest = np.empty(idx.shape + (3,))
+        nearest[..., :2] = obstacles.data.transpose(0, 2, 1)[obstacles.rows, idx, :2]
+        nearest[..., 0] -= dino_x
+        nearest[..., 2] = obstacles.type[obstacles.rows, idx]
+        nearest[~found] = (999, 0, 0)
+        return nearest
+
+    # 所有遊戲的 [Dino Y, HP, 剩餘子彈, 最近障礙物距離, 種類, (下一個的距離, 種類)...]，和 DinoEnv._get_obs 相同
+    def observations(self, num_obstacles=1):
+        nearest = self.nearest_obstacles(num_obstacles)[:, :, [0, 2]].reshape(self.num_games, -1)
+        return np.concatenate(
+            [self.dino_y[:, None], self.hp[:, None], (MAX_BULLETS - self.bullets.n)[:, None], nearest], axis=1
+        ).astype(np.float32)
+
+
+# --- 5. 像素觀察 (給 CNN 用) ---
+# 不經過 pygame：直接把模擬裡的長方形 (恐龍、障礙物、子彈) 縮小畫進一個灰階 uint8 陣列。
+# 比起 rgb_array 畫 700x350 的彩色畫面再 ResizeObservation + GrayscaleObservation 便宜很多。
+# 灰階值是手選的 (不是顏色換算)，讓每一種東西在黑色背景上都分得出來。
+BACKGROUND_GRAY = 0
+GROUND_GRAY = 60
+DINO_GRAY = 255
+BULLET_GRAY = 200
+KIND_GRAY = np.array([0, 100, 140, 170, 230], dtype=np.uint8)  # 依 type_code：無, Cactus, Bird, Bat, HealthPack
+HUD_HEIGHT = 50     # 上面 HUD 的區域畫 HP 和子彈的格子
+
+class PixelFrame:
+    def __init__(self, width=700, height=350, size=84):
+        self.width = width
+        self.height = height
+        self.size = size
+        self.sx = size / width
+        self.sy = size / height
+        # 背景 (地面線、HUD 分隔線) 每一幀都一樣，先畫好，每幀複製一次
+        self.background = np.full((size, size), BACKGROUND_GRAY, dtype=np.uint8)
+        self._fill(self.background, 0, 290, width, 3, GROUND_GRAY)
+        self._fill(self.background, 0, HUD_HEIGHT, width, 2, GROUND_GRAY)
+
+    # 長方形 (遊戲座標) 縮小到像素格：只要碰到一格就塗滿那格，所以再小的東西至少 1 像素
+    def _fill(self, out, x, y, w, h, gray):
+        c0 = max(int(x * self.sx), 0)
+        c1 = min(int(np.ceil((x + w) * self.sx)), self.size)
+        r0 = max(int(y * self.sy), 0)
+        r1 = min(int(np.ceil((y + h) * self.sy)), self.size)
+        if c0 < c1 and r0 < r1: out[r0:r1, c0:c1] = gray
+
+    # 把一場 DinoSimulation 畫進 out (形狀 (size, size) 的 uint8)
+    def draw(self, sim, out):
+        out[:] = self.background
+        dino = sim.dino
+        # HUD：左邊每格一滴血，右邊每格一顆剩下的子彈
+        for i in range(dino.hp): self._fill(out, 20 + i * 40, 15, 30, 20, DINO_GRAY)
+        for i in range(MAX_BULLETS - len(sim.bullets)): self._fill(out, self.width - 140 + i * 40, 15, 30, 20, BULLET_GRAY)
+
+        obstacles, bullets = sim.obstacles, sim.bullets
+        for x, y, w, h, t in zip(obstacles.x[:obstacles.n].tolist(), obstacles.y[:obstacles.n].tolist(),
+                                 obstacles.w[:obstacles.n].tolist(), obstacles.h[:obstacles.n].tolist(),
+                                 obstacles.type[:obstacles.n].tolist()):
+            self._fill(out, x, y, w, h, KIND_GRAY[t])
+        for x, y in zip(bullets.x[:bullets.n].tolist(), bullets.y[:bullets.n].tolist()):
+            self._fill(out, x, y, Bullet.w, Bullet.h, BULLET_GRAY)
+        self._fill(out, dino.x, dino.y, dino.w, dino.h, DINO_GRAY)
+        return out
@@ -5,88 +5,219 @@ Gym Wrapper for Dino Fighter Ultimate
 import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.envs.registration import register
-import dino as wr # 匯入你的遊戲檔案
+from gymnasium.utils import seeding
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+import dino_core as wr # 匯入遊戲的模擬核心 (不需要 pygame)
 import numpy as np
 
 # 註冊環境 ID
 register(
     id='dino-fighter-v0',
     entry_point='oop_project_env:DinoEnv', # 這裡一定要對應下面的 class 名稱
+    vector_entry_point='oop_project_env:DinoVectorEnv', # gym.make_vec 會直接用批次版本 (少於約 16 場用 vectorization_mode='sync' 比較快)
 )
+register(
+    id='dino-fighter-pixels-v0',
+    entry_point='oop_project_env:DinoPixelEnv', # 灰階 84x84 畫面 + frame stack (給 CNN)
+)
+
+# AI 給的數字 -> Action，先建好查表用 (不用每一步 list(wr.Action))
+ACTIONS = tuple(wr.Action)
+
+# Observation: [Dino Y, Dino HP, Ammo, Nearest Obstacle Dist, Nearest Obstacle Type]
+# num_obstacles > 1 時，後面再接上第 2、3... 近的障礙物的 (Dist, Type)
+def dino_observation_space(num_obstacles=1):
+    return spaces.Box(
+        low=np.zeros(3 + 2 * num_obstacles, dtype=np.float32),
+        high=np.array([1000, 3, 3] + [1000, 5] * num_obstacles, dtype=np.float32),
+        dtype=np.float32
+    )
 
 class DinoEnv(gym.Env):
-    metadata = {"render_modes": ["human"], 'render_fps': 30}
+    metadata = {"render_modes": ["human", "rgb_array"], 'render_fps': 30}
 
-    def __init__(self, render_mode=None):
+    # frame_skip: 每一次 step 讓遊戲跑幾幀 (同一個動作重複做)，死掉就提早停
+    def __init__(self, render_mode=None, num_obstacles=1, frame_skip=1):
+        assert frame_skip >= 1, frame_skip
         self.render_mode = render_mode
-        self.game = wr.DinoGame()
+        self.num_obstacles = num_obstacles
+        self.frame_skip = frame_skip
+        self.game = wr.DinoSimulation()
+        # 只有要畫面時才載入 pygame (dino.py)，headless 訓練不會開視窗
+        # rgb_array 畫在記憶體裡，不開視窗也不限速 (給 RecordVideo / AddRenderObservation 用)
+        self.renderer = None
+        if render_mode is not None:
+            assert render_mode in self.metadata["render_modes"], render_mode
+            from dino import DinoRenderer
+            self.renderer = DinoRenderer(self.game, render_mode, fps=self.metadata['render_fps'])
         
         # Action: 0=RUN, 1=JUMP, 2=SHOOT, 3=DROP
         self.action_space = spaces.Discrete(4)
 
-        # Observation: [Dino Y, Dino HP, Ammo, Nearest Obstacle Dist, Nearest Obstacle Type]
-        self.observation_space = spaces.Box(
-            low=np.array([0, 0, 0, 0, 0]), 
-            high=np.array([1000, 3, 3, 1000, 5]), 
-            dtype=np.float32
-        )
+        self.observation_space = dino_observation_space(num_obstacles)
 
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
         
-        # 1. 指揮遊戲本體重置
-        self.game.reset(seed=seed)
+        # 1. 指揮遊戲本體重置 (生怪的亂數來自這個環境自己的 np_random)
+        self.game.reset(rng=self.np_random)
         self.game.state = 'RUNNING' # AI 模式下直接開始
         obs = self._get_obs()
+        if self.renderer is not None:
+            self.renderer.reset()
         if self.render_mode == 'human':
-            self.game.render()
+            self.render()
         return obs, {}
 
     def step(self, action):
         # 1. [翻譯動作] AI 給數字 (例如 1)，我轉成 Enum (Action.JUMP)
-        game_action = list(wr.Action)[action]
-        # 2. [執行遊戲] 讓遊戲跑一幀 (Frame)
+        game_action = ACTIONS[action]
+        # 2. [執行遊戲] 讓遊戲跑 frame_skip 幀 (Frame)
         # 這裡用到了我設計的 Game Engine
-        _, is_done = self.game.step(game_action)
-
         # 3. [設計獎勵結構 (Reward Structure)]
-        # 活著就 +1 分 (鼓勵生存)
-        reward = 1
-        if is_done: reward = -100
-        # 死掉就 -100 分 (懲罰死亡)
+        # 每一幀活著就 +1 分 (鼓勵生存)，死掉就 -100 分 (懲罰死亡) 並提早停下
+        reward = 0
+        for _ in range(self.frame_skip):
+            _, is_done = self.game.step(game_action)
+            if self.render_mode == 'human':
+                self.render()
+            if is_done:
+                reward += -100
+                break
+            reward += 1
         obs = self._get_obs()
-        if self.render_mode == 'human':
-            self.game.render()
         # 5. 回傳 Gymnasium 標準格式
         # (新狀態, 獎勵, 是否結束, 被截斷, 資訊)
         return obs, reward, is_done, False, {}
 
     def _get_obs(self):
-        # 找出最近的一個障礙物
-        dist = 999
-        obs_type = 0 # 0=None, 1=Cactus, 2=Bird, 3=Bat, 4=Heal
-        
-        if self.game.obstacles:
-            # 找到第一個在恐龍右邊的障礙物
-            for obj in self.game.obstacles:
-                if obj.x > self.game.dino.x:
-                    dist = obj.x - self.game.dino.x
-                    if isinstance(obj, wr.Cactus): obs_type = 1
-                    elif isinstance(obj, wr.Bird): obs_type = 2
-                    elif isinstance(obj, wr.Bat): obs_type = 3
-                    elif isinstance(obj, wr.HealthPack): obs_type = 4
-                    break
-        
-        return np.array([
-            self.game.dino.y,
-            self.game.dino.hp,
-            3 - len(self.game.bullets),
-            dist,
-            obs_type
-        ], dtype=np.float32)
+        # 恐龍前方最近的障礙物 (沒有的話距離 999)
+        # 種類: 0=None, 1=Cactus, 2=Bird, 3=Bat, 4=Heal (就是障礙物的 type_code)
+        nearest = self.game.nearest_obstacles(self.num_obstacles)
+
+        return np.concatenate([
+            [self.game.dino.y,
+             self.game.dino.hp,
+             wr.MAX_BULLETS - len(self.game.bullets)],
+            nearest[:, [0, 2]].ravel()    # (Dist, Type)
+        ]).astype(np.float32)
+
+    # 給搜尋 (MCTS / rollout) 用：存下整場遊戲 (含亂數) 的狀態，之後可以讀回來從同一點重跑
+    # set_state 回傳讀回去之後的 observation
+    def get_state(self, out=None):
+        return self.game.get_state(out)
+
+    def set_state(self, state):
+        self.game.set_state(state)
+        if self.renderer is not None:
+            self.renderer.reset()
+        return self._get_obs()
 
     def render(self):
-        self.game.render()
+        if self.renderer is not None:
+            return self.renderer.render()
+
+    def close(self):
+        if self.renderer is not None:
+            self.renderer.close()
+
+# 像素版本：observation 是最近 frame_stack 幀的灰階畫面，形狀 (frame_stack, size, size) 的 uint8
+# 畫面直接由模擬狀態畫進 NumPy 陣列 (wr.PixelFrame)，不需要 pygame。
+class DinoPixelEnv(DinoEnv):
+    def __init__(self, render_mode=None, size=84, frame_stack=4, frame_skip=1):
+        super().__init__(render_mode=render_mode, frame_skip=frame_skip)
+        self.frame_stack = frame_stack
+        self.pixels = wr.PixelFrame(self.game.width, self.game.height, size)
+        self.observation_space = spaces.Box(low=0, high=255, shape=(frame_stack, size, size), dtype=np.uint8)
+
+        # 環形緩衝區：每一幀同時寫進第 p 格和第 p + frame_stack 格，
+        # 這樣 frames[p+1 : p+1+frame_stack] 永遠是「舊到新」連續排好的一段，不用 np.roll
+        self.frames = np.zeros((2 * frame_stack, size, size), dtype=np.uint8)
+        self.head = 0
+
+    def reset(self, seed=None, options=None):
+        self.head = -1     # 下面的 _get_obs 會把第一幀填滿整個 stack
+        return super().reset(seed=seed, options=options)
+
+    def _get_obs(self):
+        k = self.frame_stack
+        if self.head < 0:
+            self.head = 0
+            self.pixels.draw(self.game, self.frames[k])
+            self.frames[:] = self.frames[k]
+        else:
+            self.head = (self.head + 1) % k
+            self.pixels.draw(self.game, self.frames[self.head + k])
+            self.frames[self.head] = self.frames[self.head + k]
+        return self.frames[self.head + 1:self.head + 1 + k].copy()
+
+    # frame stack 不在遊戲狀態裡，讀檔後用讀回來的那一幀重新填滿
+    def set_state(self, state):
+        self.head = -1
+        return super().set_state(state)
+
+# N 場遊戲一起跑的批次版本 (gym.make_vec('dino-fighter-v0', num_envs=N))
+# 所有遊戲的狀態都放在 DinoBatch 的陣列裡一起前進，不需要 N 個 DinoEnv + SyncVectorEnv。
+# 但每一步有固定的 NumPy 開銷 (幾十個小陣列運算)，遊戲少的時候 SyncVectorEnv 反而比較快：
+# 單核心上大約 16 場打平，8 場時只有 SyncVectorEnv 的 0.7 倍，64 場時是 2 倍以上 (python benchmark.py --envs dino)
+class DinoVectorEnv(VectorEnv):
+    metadata = {"render_modes": [], 'render_fps': 30, "autoreset_mode": AutoresetMode.NEXT_STEP}
+
+    def __init__(self, num_envs=1, max_episode_steps=None, render_mode=None, num_obstacles=1, frame_skip=1):
+        assert render_mode is None, "DinoVectorEnv does not support rendering"
+        assert frame_skip >= 1, frame_skip
+        self.num_envs = num_envs
+        self.num_obstacles = num_obstacles
+        self.frame_skip = frame_skip
+        self.max_episode_steps = max_episode_steps
+        self.render_mode = render_mode
+        self.game = wr.DinoBatch(num_envs)
+
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(num_envs, dtype=np.bool_)
+
+        # 和 DinoEnv 一樣的 action / observation
+        self.single_action_space = spaces.Discrete(4)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.single_observation_space = dino_observation_space(num_obstacles)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+        # 每場遊戲有自己的 Generator：第 i 場用 seed + i (和 SyncVectorEnv 給子環境的 seed 一樣)
+        seeds = [None] * self.num_envs if seed is None else [seed + i for i in range(self.num_envs)]
+        games = np.arange(self.num_envs)
+        self.game.reset(games, [seeding.np_random(s)[0] for s in seeds])
+        self.steps[:] = 0
+        self.prev_done[:] = False
+        return self.game.observations(self.num_obstacles), {}
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        # 上一步結束的遊戲這一步不前進，而是重置 (NEXT_STEP autoreset)，繼續用自己的 Generator
+        # 和 DinoEnv 一樣：每一幀活著 +1，死掉 -100 並停下，重置的那一步 0
+        active = ~self.prev_done
+        reward = np.zeros(self.num_envs)
+        for _ in range(self.frame_skip):
+            game_over = self.game.step(actions, active=active)
+            reward += np.where(active, np.where(game_over, -100.0, 1.0), 0.0)
+            active = active & ~game_over
+            if not active.any(): break
+        done_games = np.flatnonzero(self.prev_done)
+        if len(done_games): self.game.reset(done_games)
+
+        terminated = self.game.game_over.copy()
+        self.steps += 1
+        self.steps[done_games] = 0
+        if self.max_episode_steps is None:
+            truncated = np.zeros(self.num_envs, dtype=np.bool_)
+        else:
+            truncated = self.steps >= self.max_episode_steps
+
+        self.prev_done = terminated | truncated
+        return self.game.observations(self.num_obstacles), reward, terminated, truncated, {}
+
 
 # AI 測試區 (Random Agent)
 if __name__=="__main__":
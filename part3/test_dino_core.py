@@ -0,0 +1,132 @@
+'''
+dino_core 的規則在三個地方各寫了一份：DinoSimulation.step 的純量迴圈、_update_objects_vector (NumPy 版)、
+DinoBatch.step (N 場一起算)。這裡讓三個引擎吃同樣的 seed (同一串生怪亂數) 和同樣的動作，
+每一幀都比對 get_state()，任何一份規則改了另外兩份沒跟上就會失敗。
+
+執行: python -m pytest part3/test_dino_core.py
+'''
+import numpy as np
+import pytest
+
+import dino_core
+from dino_core import Action, DinoBatch, DinoSimulation
+
+SEEDS = range(12)
+MAX_FRAMES = 3000
+# 一般的遊戲 (3 滴血，很快就結束) 和很長的遊戲 (分數高、生怪快、蝙蝠會超過仙人掌要重新排序)
+START_HP = [None, 60]
+# 隨機動作的機率：多射擊和跳，讓子彈打中、補血、受傷都會發生
+ACTION_PROBS = [0.4, 0.25, 0.25, 0.1]
+
+
+def comparable(record):
+    # get_state 的 record 裡只比真的在用的格子 (n 之後是舊資料)，
+    # seq 的數值在 DinoBatch 裡是所有遊戲共用的編號，所以只比生成的先後順序
+    obstacles, bullets = record['obstacles'], record['bullets']
+    n, m = int(obstacles['n']), int(bullets['n'])
+    return {
+        'state': int(record['state']),
+        'score': int(record['score']),
+        'spawn_timer': int(record['spawn_timer']),
+        'game_speed': float(record['game_speed']),
+        'game_over': bool(record['game_over']),
+        'dino': record['dino'].item(),
+        'obstacles': obstacles['data'][:, :n].tolist(),
+        'obstacle_types': obstacles['type'][:n].tolist(),
+        'obstacle_order': np.argsort(obstacles['seq'][:n], kind='stable').tolist(),
+        'bullets': bullets['data'][:, :m].tolist(),
+        'rng': record['spawn_draws']['rng'].tolist(),
+        'draws': record['spawn_draws']['draws'].tolist(),
+        'next': int(record['spawn_draws']['next']),
+    }
+
+
+def new_simulation(seed, hp):
+    sim = DinoSimulation()
+    sim.reset(seed=seed)
+    sim.state = 'RUNNING'
+    if hp is not None: sim.dino.hp = hp
+    return sim
+
+
+def play(seeds, hp, vector_min_obstacles, monkeypatch):
+    # 每一幀回傳所有遊戲的 comparable(get_state())，還沒結束的遊戲都用同一組動作
+    monkeypatch.setattr(dino_core, 'VECTOR_MIN_OBSTACLES', vector_min_obstacles)
+    sims = [new_simulation(seed, hp) for seed in seeds]
+    action_rng = np.random.default_rng(1234)
+    frames = []
+    for _ in range(MAX_FRAMES):
+        actions = action_rng.choice(len(Action), size=len(sims), p=ACTION_PROBS)
+        for sim, action in zip(sims, actions):
+            sim.step(Action(int(action)))
+        frames.append([comparable(sim.get_state()) for sim in sims])
+        if all(sim.game_over for sim in sims): break
+    return frames
+
+
+def play_batch(seeds, hp):
+    batch = DinoBatch(len(seeds))
+    games = np.arange(len(seeds))
+    batch.reset(games, [np.random.default_rng(seed) for seed in seeds])
+    if hp is not None: batch.hp[:] = hp
+    action_rng = np.random.default_rng(1234)
+    frames = []
+    for _ in range(MAX_FRAMES):
+        actions = action_rng.choice(len(Action), size=len(seeds), p=ACTION_PROBS)
+        batch.step(actions)
+        frames.append([comparable(batch.get_state(g)) for g in games])
+        if batch.game_over.all(): break
+    return frames
+
+
+@pytest.fixture(scope='module', params=START_HP, ids=['hp=default', 'hp=60'])
+def start_hp(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def scalar_frames(start_hp):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        return play(SEEDS, start_hp, dino_core.VECTOR_MIN_OBSTACLES, monkeypatch)
+
+
+def assert_same_frames(frames, expected):
+    assert len(frames) == len(expected)
+    for t, (frame, expected_frame) in enumerate(zip(frames, expected)):
+        for g, (state, expected_state) in enumerate(zip(frame, expected_frame)):
+            assert state == expected_state, f'game {g} differs at frame {t + 1}'
+
+
+def test_games_cover_every_rule(scalar_frames, start_hp):
+    # 確認這些遊戲真的有用到要比對的規則，不然比對沒有意義
+    states = [state for frame in scalar_frames for state in frame]
+    scores = np.array([[state['score'] for state in frame] for frame in scalar_frames])
+    assert (np.diff(scores, axis=0) >= 5).any(), 'no obstacle was shot'
+    hp = np.array([[state['dino'][3] for state in frame] for frame in scalar_frames])
+    assert (np.diff(hp, axis=0) < 0).any(), 'the dino never took damage'
+    if start_hp is None:
+        assert all(state['game_over'] for state in scalar_frames[-1])
+        assert (np.diff(hp, axis=0) > 0).any(), 'no health pack was picked up'
+    else:
+        assert max(len(state['obstacle_types']) for state in states) >= 3
+        assert any(state['obstacle_order'] != sorted(state['obstacle_order']) for state in states), \
+            'no obstacle overtook another one'
+
+
+def test_vector_path_matches_scalar_path(scalar_frames, start_hp, monkeypatch):
+    # VECTOR_MIN_OBSTACLES = 0：每一幀都走 _update_objects_vector
+    assert_same_frames(play(SEEDS, start_hp, 0, monkeypatch), scalar_frames)
+
+
+def test_batch_matches_simulation(scalar_frames, start_hp):
+    assert_same_frames(play_batch(list(SEEDS), start_hp), scalar_frames)
+
+
+def test_batch_state_restores_into_simulation():
+    # DinoBatch.get_state 的 record 可以直接 set_state 到 DinoSimulation
+    batch = DinoBatch(2)
+    batch.reset(np.arange(2), [np.random.default_rng(seed) for seed in SEEDS[:2]])
+    for _ in range(200): batch.step(np.full(2, Action.SHOOT.value))
+    sim = DinoSimulation()
+    sim.set_state(batch.get_state(1))
+    assert comparable(sim.get_state()) == comparable(batch.get_state(1))